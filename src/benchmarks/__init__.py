@@ -0,0 +1,253 @@
+"""
+Функции для замеров производительности.
+
+Каждый замер выполняется в отдельном процессе, чтобы пиковое потребление памяти (RSS)
+не накапливалось между замерами.
+"""
+import csv
+import resource
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable
+from xml.sax.saxutils import escape
+
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import to_excel
+
+# строки листов рабочей книги для генерации тестовых данных (первая строка – заголовок)
+SHEETS_ROWS: dict[str, tuple[tuple[Any, ...], tuple[Any, ...]]] = {
+    "Книга": (
+        ("Авторы", "Название", "Издание", "Город", "Издательство", "Год", "Страницы"),
+        ("Иванов И.М., Петров С.Н.", "Наука как искусство", "3-е", "СПб.", "Просвещение", 2020, 999),
+    ),
+    "Интернет-ресурс": (
+        ("Статья", "Сайт", "Ссылка", "Дата обращения"),
+        ("Наука как искусство", "Ведомости", "https://www.vedomosti.ru", datetime(2021, 1, 1)),
+    ),
+    "Статья из сборника": (
+        ("Авторы", "Статья", "Сборник", "Город", "Издательство", "Год", "Страницы"),
+        ("Иванов И.М., Петров С.Н.", "Наука как искусство", "Сборник научных трудов", "СПб.", "АСТ", 2020, "25-30"),
+    ),
+    " Закон, нормативный акт и т.п.": (
+        ("Тип", "Название", "Дата", "Номер", "Источник", "Год", "Выход", "Статья", "Редакция"),
+        (
+            "Конституция Российской Федерации",
+            "Наука как искусство",
+            datetime(2000, 1, 1),
+            "1234-56",
+            "Парламентская газета",
+            2020,
+            5,
+            15,
+            datetime(2002, 9, 11),
+        ),
+    ),
+    "Диссертация": (
+        ("Автор", "Название", "Степень", "Отрасль", "Код", "Город", "Год", "Страницы"),
+        ("Иванов И.М.", "Наука как искусство", "д-р. / канд.", "экон.", "01.01.01", "СПб.", 2020, 199),
+    ),
+}
+
+
+# служебные части пакета xlsx для генерации тестовой рабочей книги
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    "{sheets}"
+    "</Types>"
+)
+CONTENT_TYPE_SHEET = (
+    '<Override PartName="/xl/worksheets/sheet{index}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    "</Relationships>"
+)
+WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    "<sheets>{sheets}</sheets>"
+    "</workbook>"
+)
+WORKBOOK_SHEET = '<sheet name="{name}" sheetId="{index}" r:id="rId{index}"/>'
+WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    "{sheets}"
+    '<Relationship Id="rIdStyles" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    '<Relationship Id="rIdStrings" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+    'Target="sharedStrings.xml"/>'
+    "</Relationships>"
+)
+WORKBOOK_RELS_SHEET = (
+    '<Relationship Id="rId{index}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{index}.xml"/>'
+)
+# второй формат ячеек (s="1") – дата (встроенный числовой формат 14)
+STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    "</styleSheet>"
+)
+
+
+def generate_workbook(path: Path | str, rows: int) -> Path:
+    """
+    Генерация рабочей книги с заданным количеством строк на каждом листе.
+
+    Книга записывается так же, как её сохраняет Excel: с таблицей общих строк и размерами листов,
+    поэтому замеры отражают работу с реальными входными файлами.
+
+    :param path: Путь для сохранения рабочей книги.
+    :param rows: Количество строк данных на каждом листе.
+    :return: Путь к сохраненной рабочей книге.
+    """
+
+    strings: dict[str, int] = {}
+
+    def cell(column: int, value: Any) -> str:
+        ref = f"{get_column_letter(column)}{{row}}"
+        if isinstance(value, str):
+            return f'<c r="{ref}" t="s"><v>{strings.setdefault(value, len(strings))}</v></c>'
+        if isinstance(value, datetime):
+            return f'<c r="{ref}" s="1"><v>{to_excel(value)}</v></c>'
+
+        return f'<c r="{ref}"><v>{value}</v></c>'
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for index, (header, row) in enumerate(SHEETS_ROWS.values(), start=1):
+            template = "".join(cell(column, value) for column, value in enumerate(row, start=1))
+            with archive.open(f"xl/worksheets/sheet{index}.xml", "w") as part:
+                part.write(
+                    (
+                        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                        f'<dimension ref="A1:{get_column_letter(len(row))}{rows + 1}"/><sheetData>'
+                        '<row r="1">'
+                        + "".join(cell(column, value) for column, value in enumerate(header, start=1)).format(row=1)
+                        + "</row>"
+                    ).encode()
+                )
+                for number in range(2, rows + 2):
+                    part.write(f'<row r="{number}">{template.format(row=number)}</row>'.encode())
+                part.write(b"</sheetData></worksheet>")
+
+        sheets = range(1, len(SHEETS_ROWS) + 1)
+        archive.writestr(
+            "[Content_Types].xml",
+            CONTENT_TYPES.format(sheets="".join(CONTENT_TYPE_SHEET.format(index=i) for i in sheets)),
+        )
+        archive.writestr("_rels/.rels", ROOT_RELS)
+        archive.writestr(
+            "xl/workbook.xml",
+            WORKBOOK.format(
+                sheets="".join(
+                    WORKBOOK_SHEET.format(name=escape(name), index=index)
+                    for index, name in enumerate(SHEETS_ROWS, start=1)
+                )
+            ),
+        )
+        archive.writestr(
+            "xl/_rels/workbook.xml.rels",
+            WORKBOOK_RELS.format(sheets="".join(WORKBOOK_RELS_SHEET.format(index=i) for i in sheets)),
+        )
+        archive.writestr("xl/styles.xml", STYLES)
+        archive.writestr(
+            "xl/sharedStrings.xml",
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            f'<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" uniqueCount="{len(strings)}">'
+            + "".join(f'<si><t xml:space="preserve">{escape(value)}</t></si>' for value in strings)
+            + "</sst>",
+        )
+
+    return Path(path)
+
+
+def generate_delimited(directory: Path | str, rows: int) -> Path:
+    """
+    Генерация файлов CSV с заданным количеством строк для каждого типа источника.
+
+    :param directory: Путь к директории для сохранения файлов.
+    :param rows: Количество строк данных в каждом файле.
+    :return: Путь к директории с файлами.
+    """
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, (header, row) in SHEETS_ROWS.items():
+        values = [value.strftime("%d.%m.%Y") if isinstance(value, datetime) else value for value in row]
+        with (directory / f"{name.strip()}.csv").open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(header)
+            writer.writerows(values for _ in range(rows))
+
+    return directory
+
+
+def _run(func: Callable[..., int], *args: Any) -> tuple[int, float, int]:
+    """
+    Выполнение замеряемой функции в дочернем процессе.
+
+    :return: Количество обработанных строк, время выполнения в секундах и пиковый RSS в килобайтах.
+    """
+
+    started = time.perf_counter()
+    count = func(*args)
+    elapsed = time.perf_counter() - started
+
+    return count, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def measure(func: Callable[..., int], *args: Any) -> tuple[int, float, int]:
+    """
+    Замер времени выполнения и пикового потребления памяти функции в отдельном процессе.
+
+    :param func: Замеряемая функция, возвращающая количество обработанных строк.
+    :param args: Аргументы замеряемой функции.
+    :return: Количество обработанных строк, время выполнения в секундах и пиковый RSS в килобайтах.
+    """
+
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(_run, func, *args).result()
+
+
+def report(name: str, count: int, elapsed: float, max_rss: int) -> None:
+    """
+    Вывод результата замера.
+
+    :param name: Наименование замера.
+    :param count: Количество обработанных строк.
+    :param elapsed: Время выполнения в секундах.
+    :param max_rss: Пиковый RSS в килобайтах.
+    """
+
+    print(f"{name:<40} {count:>10} rows {elapsed:>9.2f} s {count / elapsed:>12.0f} rows/s {max_rss / 1024:>9.1f} MB")
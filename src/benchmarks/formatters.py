@@ -0,0 +1,187 @@
+"""
+Замер производительности форматирования источников стилями цитирования.
+
+Запуск (из директории `src`):
+
+.. code-block:: console
+
+    python -m benchmarks.formatters --entries 100000
+"""
+import logging
+import os
+import random
+import time
+from string import Template
+from itertools import cycle, islice
+from typing import Any, Iterator
+
+import click
+from pydantic import BaseModel
+
+from benchmarks import SHEETS_ROWS, measure, report
+from formatters.collation import collation_key
+from formatters.records import model_name, to_record
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import GOSTCitationFormatter
+from readers.reader import SourcesReader
+
+
+def substitute_legacy(item: BaseCitationStyle, getters: dict[str, Any]) -> str:
+    """
+    Заполнение шаблона с созданием и разбором шаблона для каждого источника (прежняя реализация).
+
+    :param item: Стиль цитирования с форматируемым объектом.
+    :param getters: Методы стиля для вычисляемых переменных шаблона.
+    :return: Отформатированная строка.
+    """
+
+    values = item.data.dict()
+    values.update({name: getter(values[name]) for name, getter in getters.items()})
+
+    return Template(item.template.template).substitute(values)
+
+
+def generate_models(entries: int) -> Iterator[BaseModel]:
+    """
+    Генерация моделей всех типов источников по очереди.
+
+    :param entries: Количество моделей.
+    :return: Генератор моделей.
+    """
+
+    samples = []
+    for reader_type in SourcesReader.readers:
+        reader = reader_type()
+        header, row = SHEETS_ROWS[reader.sheet]
+        samples.append((reader.model, reader.compile_decoder(header)(row)))
+
+    for model, attrs in islice(cycle(samples), entries):
+        yield model.construct(**attrs)
+
+
+def format_styles(entries: int) -> int:
+    """
+    Форматирование списка источников с сохранением объектов стилей и преобразованием их в строки.
+
+    :param entries: Количество источников.
+    :return: Количество отформатированных источников.
+    """
+
+    logging.disable(logging.INFO)
+    return len(tuple(str(item) for item in GOSTCitationFormatter(generate_models(entries)).format()))
+
+
+def format_text(entries: int, workers: int = 1) -> int:
+    """
+    Форматирование списка источников сразу в строки.
+
+    :param entries: Количество источников.
+    :param workers: Количество процессов для форматирования.
+    :return: Количество отформатированных источников.
+    """
+
+    logging.disable(logging.INFO)
+    return len(GOSTCitationFormatter(generate_models(entries), workers=workers).format_text())
+
+
+def generate_texts(entries: int) -> list[str]:
+    """
+    Генерация строк списка источников с разными авторами на кириллице и латинице.
+
+    :param entries: Количество строк.
+    :return: Строки.
+    """
+
+    surnames = ["Иванов", "петров", "Ёлкин", "«Сидоров»", "Smith", "adams", "Élan", "10-й"]
+    generator = random.Random(0)
+    text = " И.М. Наука как искусство. – 3-е изд. – СПб.: Просвещение, 2020. – 999 с."
+
+    return [f"{generator.choice(surnames)}{generator.randrange(entries)}{text}" for _ in range(entries)]
+
+
+def sort_texts(entries: int, collate: bool = False) -> int:
+    """
+    Сортировка строк списка источников.
+
+    :param entries: Количество строк.
+    :param collate: Сортировка по ключам `collation_key()` (иначе – по строкам).
+    :return: Количество отсортированных строк.
+    """
+
+    texts = generate_texts(entries)
+    if collate:
+        texts.sort(key=collation_key)
+    else:
+        texts.sort()
+
+    return len(texts)
+
+
+@click.command()
+@click.option("--entries", "entries", type=int, default=100_000, show_default=True, help="Количество источников")
+@click.option(
+    "--list_entries",
+    "list_entries",
+    type=int,
+    default=1_000_000,
+    show_default=True,
+    help="Количество источников для замера пикового потребления памяти",
+)
+def main(entries: int, list_entries: int) -> None:
+    """
+    Сравнение скорости заполнения шаблонов, разбираемых для каждого источника, скомпилированных шаблонов
+    и пакетного форматирования по столбцам, а также пикового потребления памяти при форматировании списка
+    в объекты стилей и сразу в строки и при сортировке по строкам и по ключам сортировки ГОСТ.
+    """
+
+    report("styles (format, str)", *measure(format_styles, list_entries))
+    report("text (format_text)", *measure(format_text, list_entries))
+    # пиковый RSS учитывает только родительский процесс
+    workers = os.cpu_count() or 1
+    report(f"text (format_text, {workers} workers)", *measure(format_text, list_entries, workers))
+
+    # генерация строк входит в оба замера, разница показывает стоимость ключей сортировки
+    report("sort (str)", *measure(sort_texts, list_entries))
+    report("sort (collation_key)", *measure(sort_texts, list_entries, True))
+
+    # запись в лог для каждого источника не относится к замеру
+    logging.disable(logging.INFO)
+
+    for formatter in (GOSTCitationFormatter, APACitationFormatter):
+        for reader_type in SourcesReader.readers:
+            reader = reader_type()
+            header, row = SHEETS_ROWS[reader.sheet]
+            record = to_record(reader.model(**reader.compile_decoder(header)(row)))
+            style = formatter.formatters_map[model_name(record)]
+            item = style(record)
+            getters = {
+                name.removeprefix("get_"): getattr(style, name) for name in dir(style) if name.startswith("get_")
+            }
+            assert substitute_legacy(item, getters) == item.render()
+
+            started = time.perf_counter()
+            for _ in range(entries):
+                substitute_legacy(item, getters)
+            legacy = entries / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for _ in range(entries):
+                item.render()
+            compiled = entries / (time.perf_counter() - started)
+
+            columns = {name: [getattr(record, name)] * entries for name in style.variables}
+            assert style.format_batch(columns)[0] == item.render()
+            started = time.perf_counter()
+            style.format_batch(columns)
+            batch = entries / (time.perf_counter() - started)
+
+            print(
+                f"{style.__name__:<24} legacy {legacy:>10.0f} entries/s, "
+                f"compiled {compiled:>10.0f} entries/s, x{compiled / legacy:.1f}, "
+                f"batch {batch:>10.0f} entries/s, x{batch / legacy:.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
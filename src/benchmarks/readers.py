@@ -0,0 +1,233 @@
+"""
+Замер производительности чтения исходного файла.
+
+Запуск (из директории `src`):
+
+.. code-block:: console
+
+    python -m benchmarks.readers --rows 200000
+"""
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any, Sequence
+
+import click
+from openpyxl import Workbook
+
+from benchmarks import SHEETS_ROWS, generate_delimited, generate_workbook, measure, report
+from readers.base import BaseReader
+from readers.cache import SheetCache
+from readers.delimited import DelimitedReader
+from readers.reader import EngineEnum, SourcesReader
+from readers.snapshot import SnapshotReader, SnapshotWriter
+
+
+def read_sources(path: str, read_only: bool, workers: int = 1, engine: str = EngineEnum.OPENPYXL) -> int:
+    """
+    Чтение всех моделей из исходного файла.
+
+    :param path: Путь к исходному файлу.
+    :param read_only: Потоковый режим чтения.
+    :param workers: Количество процессов для параллельного чтения листов.
+    :param engine: Способ чтения рабочей книги.
+    :return: Количество прочитанных моделей.
+    """
+
+    with SourcesReader(path, read_only=read_only, workers=workers, engine=engine) as reader:
+        return sum(1 for _ in reader.read())
+
+
+def read_cached(path: str, directory: str) -> int:
+    """
+    Чтение всех моделей из исходного файла с использованием кэша листов.
+
+    :param path: Путь к исходному файлу.
+    :param directory: Путь к директории кэша.
+    :return: Количество прочитанных моделей.
+    """
+
+    with SourcesReader(path, read_only=True, cache=SheetCache(directory)) as reader:
+        return sum(1 for _ in reader.read())
+
+
+def read_delimited(path: str) -> int:
+    """
+    Чтение всех моделей из директории с файлами CSV.
+
+    :param path: Путь к директории с файлами.
+    :return: Количество прочитанных моделей.
+    """
+
+    with DelimitedReader(path) as reader:
+        return sum(1 for _ in reader.read())
+
+
+def write_snapshot(source: str, path: str) -> int:
+    """
+    Запись моделей исходного файла в снимок.
+
+    :param source: Путь к исходному файлу.
+    :param path: Путь к снимку.
+    :return: Количество записанных моделей.
+    """
+
+    with SourcesReader(source, read_only=True, engine=EngineEnum.XML) as reader, SnapshotWriter(path) as writer:
+        for model in reader.read():
+            writer.write(model)
+
+    return writer.count
+
+
+def read_snapshot(path: str) -> int:
+    """
+    Чтение всех моделей из снимка.
+
+    :param path: Путь к снимку.
+    :return: Количество прочитанных моделей.
+    """
+
+    with SnapshotReader(path) as reader:
+        return sum(1 for _ in reader.read())
+
+
+def open_snapshot(path: str) -> int:
+    """
+    Открытие снимка и чтение последней записи каждой тысячи (произвольный доступ).
+
+    :param path: Путь к снимку.
+    :return: Количество прочитанных моделей.
+    """
+
+    with SnapshotReader(path) as reader:
+        return sum(1 for index in range(999, len(reader), 1000) if reader[index])
+
+
+def decode_legacy(reader: BaseReader, row: Sequence[Any]) -> dict[str, Any]:
+    """
+    Декодирование строки обходом описания атрибутов для каждой ячейки (прежняя реализация).
+
+    :param reader: Читатель листа.
+    :param row: Строка таблицы.
+    :return: Словарь атрибутов модели.
+    """
+
+    attrs = {}
+    for attr, params in reader.attributes.items():
+        index, data_type = list(params.items())[0]
+        attrs[attr] = row[index]
+
+        if not attrs[attr]:
+            continue
+
+        if data_type is int:
+            attrs[attr] = int(str(attrs.get(attr)))
+
+        if data_type is str:
+            attrs[attr] = str(attrs.get(attr)).strip()
+
+        if data_type is date:
+            value = attrs.get(attr)
+            if isinstance(value, date):
+                attrs[attr] = value.strftime("%d.%m.%Y")
+
+    return attrs
+
+
+def benchmark_decoders(rows: int) -> None:
+    """
+    Сравнение декодирования строк обходом атрибутов и скомпилированной функцией декодирования.
+
+    :param rows: Количество строк на листе.
+    """
+
+    workbook = Workbook()
+    for reader_type in SourcesReader.readers:
+        reader = reader_type(workbook)
+        header, row = SHEETS_ROWS[reader.sheet]
+        decode = reader.compile_decoder(header)
+
+        started = time.perf_counter()
+        for _ in range(rows):
+            decode_legacy(reader, row)
+        legacy = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(rows):
+            decode(row)
+        compiled = time.perf_counter() - started
+
+        print(
+            f"{reader_type.__name__:<40} legacy {legacy:>7.2f} s, compiled {compiled:>7.2f} s, x{legacy / compiled:.1f}"
+        )
+
+
+def benchmark_validation(rows: int) -> None:
+    """
+    Сравнение создания моделей конструктором для каждой строки, проверки с накоплением ошибок
+    и создания моделей без проверки для доверенных данных.
+
+    :param rows: Количество строк на листе.
+    """
+
+    for reader_type in SourcesReader.readers:
+        reader = reader_type()
+        header, row = SHEETS_ROWS[reader.sheet]
+        decode = reader.compile_decoder(header)
+        model = reader.model
+
+        started = time.perf_counter()
+        for _ in range(rows):
+            model(**decode(row))
+        constructor = time.perf_counter() - started
+
+        sheet = [header, *(row for _ in range(rows))]
+        started = time.perf_counter()
+        for _ in reader.read_rows(sheet):
+            pass
+        batch = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in reader_type(trusted=True).read_rows(sheet):
+            pass
+        trusted = time.perf_counter() - started
+
+        print(
+            f"{reader_type.__name__:<40} constructor {constructor:>7.2f} s, "
+            f"batch {batch:>7.2f} s, trusted {trusted:>7.2f} s, x{constructor / trusted:.1f}"
+        )
+
+
+@click.command()
+@click.option("--rows", "rows", type=int, default=200_000, show_default=True, help="Количество строк на листе")
+def main(rows: int) -> None:
+    """
+    Сравнение полной загрузки рабочей книги, потокового, параллельного чтения, разбора XML-частей листов,
+    чтения файлов CSV и снимка моделей.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = str(generate_workbook(Path(directory) / "input.xlsx", rows))
+
+        report("openpyxl (full load)", *measure(read_sources, path, False))
+        report("openpyxl (read-only streaming)", *measure(read_sources, path, True))
+        # пиковый RSS учитывает только родительский процесс
+        report("openpyxl (read-only, 5 workers)", *measure(read_sources, path, True, 5))
+        report("xml (sheet XML streaming)", *measure(read_sources, path, True, 1, EngineEnum.XML))
+        cache = str(Path(directory) / "cache")
+        report("sheet cache (cold)", *measure(read_cached, path, cache))
+        report("sheet cache (warm)", *measure(read_cached, path, cache))
+        delimited = str(generate_delimited(Path(directory) / "csv", rows))
+        report("csv (row streaming)", *measure(read_delimited, delimited))
+        snapshot = str(Path(directory) / "models.snapshot")
+        write_snapshot(path, snapshot)
+        report("snapshot (mmap, all records)", *measure(read_snapshot, snapshot))
+        report("snapshot (mmap, every 1000th record)", *measure(open_snapshot, snapshot))
+
+    benchmark_decoders(rows)
+    benchmark_validation(rows)
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
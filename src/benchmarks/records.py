@@ -0,0 +1,91 @@
+"""
+Замер памяти, занимаемой моделями pydantic и компактными записями.
+
+Запуск (из директории `src`):
+
+.. code-block:: console
+
+    python -m benchmarks.records --entries 100000
+"""
+import tracemalloc
+from typing import Any, Callable
+
+import click
+
+from benchmarks import SHEETS_ROWS
+from formatters.records import to_record
+from readers.base import BaseReader
+from readers.reader import SourcesReader
+
+
+def allocated(factory: Callable[[], Any], entries: int) -> float:
+    """
+    Замер памяти, выделенной для создания объектов.
+
+    :param factory: Функция создания объекта.
+    :param entries: Количество объектов.
+    :return: Количество байт на объект.
+    """
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        objects = [factory() for _ in range(entries)]
+        size = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+    del objects
+    return size / entries
+
+
+def read_records(reader: BaseReader, header: tuple[Any, ...], row: tuple[Any, ...], entries: int) -> list[Any]:
+    """
+    Чтение записей из строк с отдельными копиями строковых значений (как при разборе входного файла).
+
+    :param reader: Читатель листа.
+    :param header: Строка заголовка.
+    :param row: Строка данных.
+    :param entries: Количество строк.
+    :return: Список записей.
+    """
+
+    rows = (
+        tuple(value.encode().decode() if isinstance(value, str) else value for value in row) for _ in range(entries)
+    )
+    return [to_record(model) for model in reader.read_rows((header, *rows))]
+
+
+@click.command()
+@click.option("--entries", "entries", type=int, default=100_000, show_default=True, help="Количество объектов")
+def main(entries: int) -> None:
+    """
+    Сравнение количества байт на источник для моделей и записей каждого типа.
+
+    Для моделей и записей значения атрибутов всех объектов общие, поэтому замер показывает собственные
+    накладные расходы объектов. Для прочитанных записей значения копируются для каждой строки,
+    как при разборе входного файла, и замер показывает экономию от таблиц уникальных значений.
+    """
+
+    for reader_type in SourcesReader.readers:
+        reader = reader_type()
+        header, row = SHEETS_ROWS[reader.sheet]
+        attrs = reader.compile_decoder(header)(row)
+        model = reader.model(**attrs)
+
+        models = allocated(lambda: reader.model(**attrs), entries)
+        records = allocated(lambda: to_record(model), entries)
+
+        # записи из строк с отдельными копиями значений: без таблиц уникальных значений и с ними
+        plain = type(reader_type.__name__, (reader_type,), {"interned": frozenset()})
+        copied = allocated(lambda: read_records(plain(), header, row, entries), 1) / entries
+        interned = allocated(lambda: read_records(reader_type(), header, row, entries), 1) / entries
+
+        print(
+            f"{reader.model.__name__:<24} model {models:>5.0f} B, record {records:>4.0f} B, x{models / records:.1f}; "
+            f"read records {copied:>5.0f} B, interned {interned:>5.0f} B, x{copied / interned:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
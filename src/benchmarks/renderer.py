@@ -0,0 +1,171 @@
+"""
+Замер производительности генерации выходного файла.
+
+Запуск (из директории `src`):
+
+.. code-block:: console
+
+    python -m benchmarks.renderer --entries 100000
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterator
+
+import click
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Pt
+
+from benchmarks import measure, report
+from renderer import FORMAT_RENDERERS, FormatEnum, GOSTRenderer, HTMLRenderer, TextRenderer, render_outputs
+
+# строка источника для генерации выходного файла
+ROW = "Иванов И.М., Петров С.Н. Наука как искусство. – 3-е изд. – СПб.: Просвещение, 2020. – 999 с."
+
+
+def generate_rows(entries: int) -> Iterator[str]:
+    """
+    Генерация строк источников.
+
+    :param entries: Количество строк.
+    :return: Генератор строк.
+    """
+
+    for index in range(entries):
+        yield f"{ROW} {index}"
+
+
+def render_legacy(entries: int) -> int:
+    """
+    Генерация файла через объектную модель python-docx (прежняя реализация).
+
+    :param entries: Количество строк.
+    :return: Количество записанных строк.
+    """
+
+    document = Document()
+    paragraph = document.add_paragraph()
+    paragraph.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    paragraph.add_run("Список использованной литературы").bold = True
+
+    style_normal = document.styles["Normal"]
+    style_normal.font.name = "Times New Roman"
+    style_normal.font.size = Pt(12)
+    style_normal.paragraph_format.line_spacing = 1.5
+    style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+    for row in generate_rows(entries):
+        document.add_paragraph(row, style="List Number")
+
+    with tempfile.TemporaryDirectory() as directory:
+        document.save(Path(directory) / "output.docx")
+
+    return entries
+
+
+def render_streaming(entries: int) -> int:
+    """
+    Потоковая генерация файла.
+
+    :param entries: Количество строк.
+    :return: Количество записанных строк.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        GOSTRenderer(generate_rows(entries)).render(Path(directory) / "output.docx")
+
+    return entries
+
+
+def render_text(entries: int, output_format: FormatEnum) -> int:
+    """
+    Потоковая генерация текстового файла.
+
+    :param entries: Количество строк.
+    :param output_format: Формат выходного файла.
+    :return: Количество записанных строк.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        FORMAT_RENDERERS[output_format](generate_rows(entries)).render(
+            Path(directory) / f"output.{output_format.value}"
+        )
+
+    return entries
+
+
+def render_fan_out(entries: int) -> int:
+    """
+    Генерация файлов docx, HTML и текста за один проход по строкам.
+
+    :param entries: Количество строк.
+    :return: Количество записанных строк.
+    """
+
+    with tempfile.TemporaryDirectory() as directory:
+        outputs = [
+            (GOSTRenderer, Path(directory) / "output.docx"),
+            (HTMLRenderer, Path(directory) / "output.html"),
+            (TextRenderer, Path(directory) / "output.txt"),
+        ]
+        render_outputs(generate_rows(entries), outputs)
+
+    return entries
+
+
+def render_latency(repeats: int) -> tuple[float, float, float]:
+    """
+    Замер времени генерации файла из 10 строк.
+
+    :param repeats: Количество генераций.
+    :return: Время первой генерации (с созданием образца пакета), средние времена генерации
+        через python-docx и потоковой генерации в миллисекундах.
+    """
+
+    rows = list(generate_rows(10))
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "output.docx"
+
+        started = time.perf_counter()
+        GOSTRenderer(rows).render(path)
+        first = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        for _ in range(repeats):
+            render_legacy(len(rows))
+        legacy = (time.perf_counter() - started) * 1000 / repeats
+
+        started = time.perf_counter()
+        for _ in range(repeats):
+            GOSTRenderer(rows).render(path)
+        streaming = (time.perf_counter() - started) * 1000 / repeats
+
+    return first, legacy, streaming
+
+
+@click.command()
+@click.option("--entries", "entries", type=int, default=100_000, show_default=True, help="Количество строк")
+def main(entries: int) -> None:
+    """
+    Сравнение скорости и пикового потребления памяти генерации файла через python-docx, потоковой генерации
+    docx и текстовых форматов,
+    а также времени генерации небольшого файла.
+    """
+
+    report("docx (python-docx)", *measure(render_legacy, entries))
+    report("docx (streaming)", *measure(render_streaming, entries))
+    for output_format in FORMAT_RENDERERS:
+        report(f"{output_format.value} (streaming)", *measure(render_text, entries, output_format))
+    report("docx + html + txt (fan-out)", *measure(render_fan_out, entries))
+
+    # образец пакета создается при первой генерации в процессе, затем используется повторно
+    first, legacy, streaming = render_latency(100)
+    print(
+        f"docx, 10 rows: python-docx {legacy:.1f} ms, streaming first {first:.1f} ms, "
+        f"streaming {streaming:.1f} ms, x{legacy / streaming:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -1,9 +1,22 @@
 """
 Базовые функции форматирования списка источников
 """
+import heapq
+import logging
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
+from typing import Any, Iterable, Iterator, Optional
 
+from pydantic import BaseModel
+
+from formatters.cache import FormattedCache
+from formatters.external import ExternalSorter
+from formatters.ordering import Ordering
+from formatters.records import BaseRecord, model_name, to_record
 from formatters.styles.base import BaseCitationStyle
-from logger import get_logger
+from logger import get_logger, pool_options
 
 
 logger = get_logger(__name__)
@@ -33,3 +46,277 @@ class BaseCitationFormatter:
         logger.info("Общее форматирование ...")
 
         return sorted(self.formatted_items, key=lambda item: item.formatted)
+
+
+class CitationFormatter(BaseCitationFormatter):
+    """
+    Форматирование списка источников по стилю цитирования.
+
+    Наследники определяют классы стилей для моделей в `formatters_map`.
+    Источники читаются только при форматировании, поэтому в конструктор можно передать генератор моделей.
+
+    При форматировании в несколько процессов источники делятся на части по `chunk_size` записей,
+    каждая часть форматируется в дочернем процессе в пары из ключа сортировки и строки,
+    а родительский процесс только упорядочивает результаты.
+    """
+
+    # классы стилей цитирования по наименованиям моделей
+    formatters_map: dict[str, type[BaseCitationStyle]] = {}
+    # порядок источников в списке
+    ordering: Ordering = Ordering()
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self,
+        models: Iterable[BaseModel | BaseRecord],
+        workers: int = 1,
+        chunk_size: int = 10_000,
+        cache: Optional[FormattedCache] = None,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param models: Список объектов для форматирования
+        :param workers: Количество процессов для форматирования (1 – последовательное форматирование).
+        :param chunk_size: Количество источников в части для одного процесса (меньший список форматируется
+            последовательно).
+        :param cache: Постоянный кэш отформатированных строк (строки неизмененных источников не форматируются).
+        """
+
+        self.models = models
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.cache = cache
+
+    def iter_items(self) -> Iterator[BaseCitationStyle]:
+        """
+        Создание объектов стилей по мере чтения источников.
+
+        :return: Генератор объектов стилей.
+        """
+
+        formatters_map = self.formatters_map
+        for model in self.models:
+            # после проверки модель заменяется компактной записью, модель pydantic не хранится
+            record = to_record(model)
+            yield formatters_map[model_name(record)](record)
+
+    def sort_key(self, record: BaseModel | BaseRecord, text: str) -> Any:
+        """
+        Получение ключа сортировки источника.
+
+        :param record: Запись или модель источника.
+        :param text: Отформатированная строка.
+        :return: Ключ сортировки.
+        """
+
+        return self.ordering.key(record, text)
+
+    def format(self) -> list[BaseCitationStyle]:
+        """
+        Форматирование списка источников.
+
+        :return:
+        """
+
+        logger.info("Общее форматирование ...")
+
+        sort_key = self.sort_key
+        return sorted(self.iter_items(), key=lambda item: sort_key(item.data, item.formatted))
+
+    def pairs(self) -> Iterator[tuple[Any, str]]:
+        """
+        Форматирование источников в порядке чтения без сохранения объектов стилей и моделей.
+
+        :return: Генератор пар из ключа сортировки и отформатированной строки.
+        """
+
+        for _, key, text in self.entries():
+            yield key, text
+
+    def entries(self) -> Iterator[tuple[str, Any, str]]:
+        """
+        Форматирование источников в порядке чтения с наименованиями моделей.
+
+        :return: Генератор троек из наименования модели, ключа сортировки и отформатированной строки.
+        """
+
+        if self.workers > 1:
+            yield from self.entries_parallel()
+            return
+
+        for chunk in self.chunks():
+            yield from self.format_records(chunk)
+
+    def format_records(self, records: list[BaseModel | BaseRecord]) -> list[tuple[str, Any, str]]:
+        """
+        Пакетное форматирование части источников.
+
+        Записи группируются по типам, значения атрибутов каждого типа собираются в столбцы
+        и форматируются одним вызовом `format_batch()` стиля без создания объектов стилей.
+        При использовании кэша форматируются только источники, строк которых нет в кэше.
+
+        :param records: Записи источников.
+        :return: Тройки из наименования модели, ключа сортировки и отформатированной строки в порядке записей.
+        """
+
+        # номера записей по наименованиям моделей
+        groups: dict[str, list[int]] = {}
+        names = [model_name(record) for record in records]
+        for index, name in enumerate(names):
+            groups.setdefault(name, []).append(index)
+
+        texts: list[str] = [""] * len(records)
+        for name, indexes in groups.items():
+            style = self.formatters_map[name]
+            # строки значений переменных шаблона транспонируются в столбцы
+            getter = attrgetter(*style.variables)
+            rows = [getter(records[index]) for index in indexes]
+            if len(style.variables) == 1:
+                rows = [(value,) for value in rows]
+
+            if self.cache is None:
+                columns = dict(zip(style.variables, zip(*rows)))
+                for index, text in zip(indexes, style.format_batch(columns)):
+                    texts[index] = text
+                continue
+
+            keys = self.cache.keys(style, name, rows)
+            found = self.cache.get(keys)
+            missing = [position for position, key in enumerate(keys) if key not in found]
+            columns = dict(zip(style.variables, zip(*(rows[position] for position in missing))))
+            formatted = dict(zip(missing, style.format_batch(columns) if missing else ()))
+            self.cache.put([(keys[position], text) for position, text in formatted.items()])
+            for position, (index, key) in enumerate(zip(indexes, keys)):
+                texts[index] = found[key] if key in found else formatted[position]
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Отформатирована часть источников: %s.", {name: len(indexes) for name, indexes in groups.items()}
+            )
+
+        sort_key = self.sort_key
+        return [(name, sort_key(record, text), text) for name, record, text in zip(names, records, texts)]
+
+    def entries_parallel(self) -> Iterator[tuple[str, Any, str]]:
+        """
+        Форматирование источников частями в нескольких процессах.
+
+        Одновременно в обработке находится не больше двух частей на процесс, поэтому потребление памяти
+        не зависит от количества источников. Результаты возвращаются в порядке чтения.
+
+        :return: Генератор троек из наименования модели, ключа сортировки и отформатированной строки.
+        """
+
+        chunks = self.chunks()
+        first = next(chunks, [])
+        if len(first) < self.chunk_size:
+            # для небольшого списка запуск процессов дольше форматирования
+            yield from self.format_records(first)
+            return
+
+        logger.info("Параллельное форматирование (процессов: %s) ...", self.workers)
+        with ProcessPoolExecutor(max_workers=self.workers, **pool_options()) as executor:
+            pending: deque[Future] = deque()
+            for chunk in chain([first], chunks):
+                pending.append(executor.submit(format_chunk, type(self), chunk, self.cache))
+                if len(pending) >= self.workers * 2:
+                    yield from self.collect(pending.popleft())
+
+            while pending:
+                yield from self.collect(pending.popleft())
+
+    def collect(self, future: Future) -> list[tuple[str, Any, str]]:
+        """
+        Получение результата форматирования части в дочернем процессе с учетом обращений к кэшу.
+
+        :param future: Результат форматирования части.
+        :return: Тройки из наименования модели, ключа сортировки и отформатированной строки.
+        """
+
+        entries, hits, misses = future.result()
+        if self.cache is not None:
+            self.cache.hits += hits
+            self.cache.misses += misses
+
+        return entries
+
+    def chunks(self) -> Iterator[list[BaseModel | BaseRecord]]:
+        """
+        Разбиение источников на части с заменой моделей компактными записями для передачи в процессы.
+
+        :return: Генератор частей.
+        """
+
+        models = iter(self.models)
+        while chunk := [to_record(model) for model in islice(models, self.chunk_size)]:
+            yield chunk
+
+    def format_text(self) -> list[str]:
+        """
+        Форматирование списка источников в отсортированный список строк.
+
+        В памяти хранятся только ключи сортировки и строки, объекты стилей и модели освобождаются
+        сразу после форматирования источника. Источники каждого типа сортируются отдельно,
+        отсортированные списки типов объединяются k-путевым слиянием.
+
+        :return: Отформатированные строки.
+        """
+
+        logger.info("Общее форматирование ...")
+
+        # пары из ключа сортировки и строки по наименованиям моделей
+        runs: dict[str, list[tuple[Any, str]]] = {}
+        for name, key, text in self.entries():
+            if name not in runs:
+                runs[name] = []
+            runs[name].append((key, text))
+
+        # сообщения о форматировании источников объединяются в одну запись по типам
+        logger.info("Отформатировано источников: %s.", ", ".join(f"{name} – {len(run)}" for name, run in runs.items()))
+
+        for run in runs.values():
+            run.sort(key=itemgetter(0))
+
+        return [text for _, text in heapq.merge(*runs.values(), key=itemgetter(0))]
+
+    def iter_text(self, run_size: Optional[int] = None) -> Iterator[str]:
+        """
+        Форматирование списка источников в отсортированные строки с ограничением потребления памяти.
+
+        Если указан размер части, строки сортируются внешней сортировкой (`ExternalSorter`): в памяти
+        находится не больше `run_size` строк, отсортированные части хранятся во временных файлах.
+
+        :param run_size: Количество строк в части, сортируемой в памяти (`None` – сортировка всего списка в памяти).
+        :return: Генератор отформатированных строк.
+        """
+
+        if run_size is None:
+            yield from self.format_text()
+            return
+
+        logger.info("Общее форматирование (внешняя сортировка частями по %s) ...", run_size)
+        with ExternalSorter(run_size) as sorter:
+            yield from sorter.sort(self.pairs())
+
+
+def format_chunk(
+    formatter: type[CitationFormatter],
+    records: list[BaseModel | BaseRecord],
+    cache: Optional[FormattedCache] = None,
+) -> tuple[list[tuple[str, Any, str]], int, int]:
+    """
+    Форматирование части источников (выполняется в дочернем процессе).
+
+    :param formatter: Класс форматирования списка источников.
+    :param records: Записи источников.
+    :param cache: Постоянный кэш отформатированных строк.
+    :return: Тройки из наименования модели, ключа сортировки и отформатированной строки,
+        количество попаданий и промахов кэша.
+    """
+
+    entries = formatter(records, cache=cache).format_records(records)
+    if cache is None:
+        return entries, 0, 0
+
+    cache.close()
+    return entries, cache.hits, cache.misses
@@ -0,0 +1,246 @@
+"""
+Постоянный кэш отформатированных строк источников.
+"""
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Optional, Sequence
+
+from formatters.styles.base import BaseCitationStyle
+from logger import get_logger
+from settings import CACHE_PATH, FORMATTED_CACHE_MAX_SIZE
+
+logger = get_logger(__name__)
+
+# версия формата записей кэша (изменение версии делает недействительными все записи)
+CACHE_VERSION = 1
+
+# имя файла базы данных кэша в директории кэша
+DATABASE_NAME = "formatted.sqlite3"
+
+# количество ключей в одном запросе (ограничение количества параметров запроса SQLite)
+QUERY_SIZE = 500
+
+
+def style_version(style: type[BaseCitationStyle]) -> str:
+    """
+    Вычисление версии стиля цитирования.
+
+    Версия зависит от шаблона стиля и байт-кода методов вычисляемых переменных шаблона,
+    поэтому изменение шаблона или вычисления переменной делает недействительными записи стиля.
+
+    :param style: Класс стиля цитирования.
+    :return: Версия стиля.
+    """
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((CACHE_VERSION, style.__module__, style.__qualname__, style.template.template)).encode())
+    for name in style.variables:
+        getter = getattr(style, f"get_{name}", None)
+        code = getattr(getter, "__code__", None)
+        if code is not None:
+            digest.update(code.co_code)
+            digest.update(repr(code.co_consts).encode())
+
+    return digest.hexdigest()
+
+
+class FormattedCache:
+    """
+    Постоянный кэш отформатированных строк в базе данных SQLite.
+
+    Ключ записи – хэш версии стиля (`style_version()`), наименования модели и значений переменных шаблона,
+    то есть атрибутов модели, от которых зависит строка. Строки неизмененных источников берутся из кэша
+    без форматирования. При превышении размера удаляются давно использованные записи.
+
+    Объект кэша можно передавать в дочерние процессы: соединение с базой данных открывается
+    в каждом процессе при первом обращении. Записи вытесняются при выходе из контекста кэша.
+    """
+
+    def __init__(self, directory: str = CACHE_PATH, max_size: int = FORMATTED_CACHE_MAX_SIZE) -> None:
+        """
+        Конструктор.
+
+        :param directory: Путь к директории кэша.
+        :param max_size: Максимальный размер строк кэша в байтах (при превышении удаляются давно использованные
+            записи).
+        """
+
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._connection: Optional[sqlite3.Connection] = None
+        # версии стилей по классам стилей
+        self._versions: dict[type[BaseCitationStyle], str] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # соединение не передается в дочерний процесс, счетчики дочернего процесса считаются заново
+        return {**self.__dict__, "_connection": None, "hits": 0, "misses": 0}
+
+    def __enter__(self) -> "FormattedCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        # при форматировании в дочерних процессах соединение основного процесса не открывалось,
+        # обращения к кэшу учтены по счетчикам дочерних процессов
+        if self.hits + self.misses:
+            self.evict()
+            self.log_stats()
+        self.close()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Получение соединения с базой данных кэша (база данных создается при первом обращении).
+
+        :return: Соединение.
+        """
+
+        if self._connection is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.directory / DATABASE_NAME, timeout=60)
+            # журнал WAL позволяет читать кэш во время записи из других процессов
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key BLOB PRIMARY KEY, text TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries (used)")
+            self._connection = connection
+
+        return self._connection
+
+    def keys(self, style: type[BaseCitationStyle], model: str, rows: Sequence[tuple[Any, ...]]) -> list[bytes]:
+        """
+        Вычисление ключей записей для значений переменных шаблона.
+
+        :param style: Класс стиля цитирования.
+        :param model: Наименование модели.
+        :param rows: Значения переменных шаблона (`style.variables`) для каждого источника.
+        :return: Ключи записей.
+        """
+
+        if style not in self._versions:
+            self._versions[style] = style_version(style)
+        prefix = f"{self._versions[style]}\0{model}\0".encode()
+
+        blake2b = hashlib.blake2b
+        return [blake2b(prefix + repr(row).encode(), digest_size=16).digest() for row in rows]
+
+    def get(self, keys: Sequence[bytes]) -> dict[bytes, str]:
+        """
+        Получение строк по ключам с отметкой использования найденных записей.
+
+        :param keys: Ключи записей.
+        :return: Найденные строки по ключам.
+        """
+
+        found: dict[bytes, str] = {}
+        connection = self.connection
+        used = time.time()
+        with connection:
+            for start in range(0, len(keys), QUERY_SIZE):
+                part = keys[start : start + QUERY_SIZE]
+                placeholders = ",".join("?" * len(part))
+                found.update(
+                    connection.execute(f"SELECT key, text FROM entries WHERE key IN ({placeholders})", part).fetchall()
+                )
+                connection.execute(f"UPDATE entries SET used = ? WHERE key IN ({placeholders})", (used, *part))
+
+        # ключи повторяющихся источников учитываются для каждого источника
+        hits = sum(key in found for key in keys)
+        self.hits += hits
+        self.misses += len(keys) - hits
+
+        return found
+
+    def put(self, entries: Sequence[tuple[bytes, str]]) -> None:
+        """
+        Сохранение строк в кэш.
+
+        :param entries: Пары из ключа записи и строки.
+        """
+
+        if not entries:
+            return
+
+        used = time.time()
+        with self.connection as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO entries (key, text, size, used) VALUES (?, ?, ?, ?)",
+                [(key, text, len(key) + len(text.encode()), used) for key, text in entries],
+            )
+
+    def evict(self) -> None:
+        """
+        Вытеснение давно использованных записей при превышении размера кэша.
+        """
+
+        with self.connection as connection:
+            size = connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if size <= self.max_size:
+                return
+
+            # количество давно использованных записей, после удаления которых размер не превышает максимальный
+            # (записи одной пачки имеют одинаковое время использования, поэтому порядок уточняется по rowid)
+            count = 0
+            for (entry_size,) in connection.execute("SELECT size FROM entries ORDER BY used, rowid"):
+                if size <= self.max_size:
+                    break
+                size -= entry_size
+                count += 1
+
+            connection.execute(
+                "DELETE FROM entries WHERE rowid IN (SELECT rowid FROM entries ORDER BY used, rowid LIMIT ?)", (count,)
+            )
+
+        logger.info("Кэш строк: вытеснено записей %s.", count)
+
+    def clear(self) -> None:
+        """
+        Удаление всех записей кэша.
+        """
+
+        with self.connection as connection:
+            connection.execute("DELETE FROM entries")
+        self.connection.execute("VACUUM")
+
+        logger.info("Кэш строк очищен.")
+
+    def close(self) -> None:
+        """
+        Закрытие соединения с базой данных.
+        """
+
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @property
+    def ratio(self) -> float:
+        """
+        Получение доли попаданий в кэш.
+
+        :return: Доля попаданий (0, если обращений не было).
+        """
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def log_stats(self) -> None:
+        """
+        Запись в лог количества попаданий и промахов кэша.
+        """
+
+        logger.info(
+            "Кэш строк: попаданий %s, промахов %s, доля попаданий %.1f%%.", self.hits, self.misses, self.ratio * 100
+        )
@@ -0,0 +1,128 @@
+"""
+Ключи сортировки библиографического списка.
+
+По ГОСТ Р 7.0.5-2008 записи на кириллице располагаются перед записями на латинице,
+регистр букв и знаки препинания при сортировке не учитываются. Ключ сортировки вычисляется
+один раз для записи и хранится в виде строки байтов: каждый символ записи заменяется
+одним байтом, порядок байтов задает порядок символов.
+
+Строка кодируется в однобайтовую кодировку cp1251 (кириллица и латиница), затем байты кодировки
+заменяются байтами порядка (заглавные и строчные буквы – одинаковыми байтами) одним вызовом
+`bytes.translate()`. Символы, отсутствующие в cp1251, заменяет обработчик ошибок кодирования.
+"""
+import codecs
+import unicodedata
+
+# порядок символов в ключе: пробел (разделитель слов), цифры, кириллица, латиница, буквы других алфавитов
+CYRILLIC = "абвгдеёжзийклмнопрстуфхцчшщъыьэюя"
+LATIN = "abcdefghijklmnopqrstuvwxyz"
+SEPARATOR = 0x20
+DIGITS_START = 0x30
+CYRILLIC_START = 0x40
+LATIN_START = CYRILLIC_START + len(CYRILLIC)
+OTHER = 0xFF
+
+ENCODING = "cp1251"
+# байт, не используемый cp1251, для букв других алфавитов
+OTHER_PLACEHOLDER = b"\x98"
+# наименование обработчика ошибок кодирования
+ERRORS = "collation"
+
+# символы, байт порядка которых совпадает с байтом cp1251 (для обработчика ошибок кодирования)
+ORDER_CHARS = {SEPARATOR: " ", **{DIGITS_START + index: str(index) for index in range(10)}}
+ORDER_CHARS.update({LATIN_START + index: char for index, char in enumerate(LATIN)})
+
+
+def classify(char: str) -> bytes:
+    """
+    Получение байта порядка символа (пустая строка байтов для игнорируемых символов).
+
+    :param char: Символ в нижнем регистре.
+    :return: Байт порядка.
+    """
+
+    if char.isspace():
+        return bytes([SEPARATOR])
+    if char.isdecimal() and char.isascii():
+        return bytes([DIGITS_START + int(char)])
+    if char in CYRILLIC:
+        return bytes([CYRILLIC_START + CYRILLIC.index(char)])
+    if char in LATIN:
+        return bytes([LATIN_START + LATIN.index(char)])
+    if char.isalnum():
+        # буквы латиницы с диакритическими знаками сортируются как основные буквы
+        base = unicodedata.normalize("NFKD", char)[:1]
+        if base != char and (base in LATIN or (base.isdecimal() and base.isascii())):
+            return classify(base)
+        return bytes([OTHER])
+
+    return b""
+
+
+def replace_unencodable(error: UnicodeError) -> tuple[bytes, int]:
+    """
+    Обработчик ошибок кодирования: символы, отсутствующие в cp1251, заменяются байтами cp1251
+    соответствующих символов ключа.
+
+    :param error: Ошибка кодирования.
+    :return: Замена и позиция продолжения кодирования.
+    """
+
+    # обработчик предназначен только для кодирования, остальные ошибки передаются без изменений
+    if not isinstance(error, UnicodeEncodeError):
+        raise error
+
+    replacement = bytearray()
+    for char in error.object[error.start : error.end].casefold():
+        order = classify(char)
+        if order == bytes([OTHER]):
+            replacement += OTHER_PLACEHOLDER
+        elif order:
+            # байт порядка пробела, цифры или буквы латиницы совпадает с байтом cp1251 символа
+            replacement += ORDER_CHARS[order[0]].encode(ENCODING)
+
+    return bytes(replacement), error.end
+
+
+codecs.register_error(ERRORS, replace_unencodable)
+
+
+def build_table() -> tuple[bytes, bytes]:
+    """
+    Построение таблицы замены байтов cp1251 байтами порядка.
+
+    :return: Таблица замены и удаляемые байты для `bytes.translate()`.
+    """
+
+    table = bytearray(range(256))
+    delete = bytearray()
+    for code in range(256):
+        if bytes([code]) == OTHER_PLACEHOLDER:
+            table[code] = OTHER
+            continue
+
+        # заглавные буквы заменяются байтами порядка строчных
+        order = classify(bytes([code]).decode(ENCODING).lower())
+        if order:
+            table[code] = order[0]
+        else:
+            delete.append(code)
+
+    return bytes(table), bytes(delete)
+
+
+TABLE, DELETE = build_table()
+
+
+def collation_key(text: str) -> bytes:
+    """
+    Вычисление ключа сортировки строки.
+
+    Регистр букв не учитывается, знаки препинания удаляются, последовательности пробелов
+    заменяются одним пробелом, остальные символы – байтами порядка (цифры, кириллица, латиница).
+
+    :param text: Строка.
+    :return: Ключ сортировки.
+    """
+
+    return b" ".join(text.encode(ENCODING, ERRORS).translate(TABLE, DELETE).split())
@@ -0,0 +1,146 @@
+"""
+Внешняя сортировка отформатированных строк для списков, не помещающихся в память.
+"""
+import heapq
+import pickle
+import tempfile
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Iterable, Iterator, Optional
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# максимальное количество файлов, объединяемых за один проход слияния
+MAX_FAN_IN = 128
+
+
+class ExternalSorter:
+    """
+    Внешняя сортировка пар из ключа сортировки и строки.
+
+    Пары читаются частями по `run_size` пар, каждая часть сортируется в памяти и записывается
+    во временный файл, затем файлы объединяются k-путевым слиянием (`heapq.merge`).
+    В памяти одновременно находится не больше одной части, при слиянии – по одной паре из каждого файла.
+    Если все пары поместились в одну часть, временные файлы не создаются.
+    """
+
+    def __init__(self, run_size: int, directory: Optional[str] = None) -> None:
+        """
+        Конструктор.
+
+        :param run_size: Количество пар в части, сортируемой в памяти.
+        :param directory: Директория для временных файлов (по умолчанию – системная временная директория).
+        """
+
+        self.run_size = run_size
+        self.directory = directory
+        self.runs = 0
+        self._temporary: Optional[tempfile.TemporaryDirectory] = None
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Удаление временных файлов.
+        """
+
+        if self._temporary is not None:
+            self._temporary.cleanup()
+            self._temporary = None
+
+    def sort(self, pairs: Iterable[tuple[Any, str]]) -> Iterator[str]:
+        """
+        Сортировка пар с получением строк в порядке ключей.
+
+        :param pairs: Пары из ключа сортировки и строки.
+        :return: Генератор отсортированных строк.
+        """
+
+        pairs = iter(pairs)
+        run = sorted(islice(pairs, self.run_size), key=itemgetter(0))
+        if len(run) < self.run_size:
+            for _, text in run:
+                yield text
+            return
+
+        paths = []
+        while run:
+            paths.append(self.write_run(run))
+            # записанная часть освобождается до чтения следующей
+            del run
+            run = sorted(islice(pairs, self.run_size), key=itemgetter(0))
+        logger.info("Внешняя сортировка: записано частей %s.", len(paths))
+
+        # при большом количестве частей они предварительно объединяются группами
+        while len(paths) > MAX_FAN_IN:
+            paths = [
+                self.write_run(self.merge(paths[start : start + MAX_FAN_IN]))
+                for start in range(0, len(paths), MAX_FAN_IN)
+            ]
+
+        for _, text in self.merge(paths):
+            yield text
+
+    def merge(self, paths: list[Path]) -> Iterator[tuple[Any, str]]:
+        """
+        K-путевое слияние отсортированных частей с удалением прочитанных файлов.
+
+        :param paths: Пути к файлам частей.
+        :return: Генератор пар в порядке ключей.
+        """
+
+        yield from heapq.merge(*(self.read_run(path) for path in paths), key=itemgetter(0))
+
+    def write_run(self, run: Iterable[tuple[Any, str]]) -> Path:
+        """
+        Запись отсортированной части во временный файл.
+
+        :param run: Отсортированные пары.
+        :return: Путь к файлу части.
+        """
+
+        if self._temporary is None:
+            self._temporary = tempfile.TemporaryDirectory(prefix="runs-", dir=self.directory)
+
+        path = Path(self._temporary.name) / f"{self.runs}.run"
+        self.runs += 1
+        with path.open("wb") as file:
+            pickler = pickle.Pickler(file, protocol=pickle.HIGHEST_PROTOCOL)
+            for pair in run:
+                pickler.dump(pair)
+                # таблица ссылок пиклера не нужна для независимых пар и увеличивала бы потребление памяти
+                pickler.clear_memo()
+
+        return path
+
+    @staticmethod
+    def read_run(path: Path) -> Iterator[tuple[Any, str]]:
+        """
+        Потоковое чтение части из временного файла (файл удаляется после чтения).
+
+        :param path: Путь к файлу части.
+        :return: Генератор пар.
+        """
+
+        with path.open("rb") as file:
+            unpickler = pickle.Unpickler(file)
+            while True:
+                try:
+                    yield unpickler.load()
+                except EOFError:
+                    break
+
+        path.unlink()
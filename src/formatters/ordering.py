@@ -0,0 +1,114 @@
+"""
+Порядок источников в библиографическом списке.
+
+Порядок задается ключом сортировки, который вычисляется один раз для источника по атрибутам
+записи и отформатированной строке. Ключи источников одного типа сортируются отдельно,
+затем отсортированные списки типов объединяются k-путевым слиянием.
+"""
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+from formatters.collation import collation_key
+from formatters.models import (
+    ArticlesCollectionModel,
+    BookModel,
+    InternetResourceModel,
+    RegulationActModel,
+    ThesisModel,
+)
+from formatters.records import BaseRecord, model_name
+
+# ранг типов источников, для которых ранг не задан
+DEFAULT_RANK = 0x80
+# разделитель полей составного ключа (меньше байтов любых символов ключа)
+FIELD_SEPARATOR = b"\x00"
+
+
+class Ordering:
+    """
+    Порядок по отформатированным строкам (без учета типов источников).
+    """
+
+    def key(self, record: BaseModel | BaseRecord, text: str) -> Any:  # pylint: disable=unused-argument
+        """
+        Получение ключа сортировки источника.
+
+        :param record: Запись или модель источника.
+        :param text: Отформатированная строка.
+        :return: Ключ сортировки.
+        """
+
+        return text
+
+
+class GOSTOrdering(Ordering):
+    """
+    Порядок по ГОСТ Р 7.0.5-2008: нормативные акты располагаются перед остальными источниками,
+    внутри групп – по алфавиту (`collation_key()`).
+    """
+
+    # ранги типов источников (группы с меньшим рангом располагаются раньше)
+    ranks: dict[str, int] = {
+        RegulationActModel.__name__: 0,
+    }
+
+    def key(self, record: BaseModel | BaseRecord, text: str) -> bytes:
+        return bytes([self.ranks.get(model_name(record), DEFAULT_RANK)]) + collation_key(text)
+
+
+class APAOrdering(Ordering):
+    """
+    Порядок APA: по фамилии первого автора, затем по году и названию.
+
+    Для источников без автора на месте автора используется название.
+    """
+
+    # атрибуты автора, года и названия по наименованиям моделей
+    fields: dict[str, tuple[Optional[str], Optional[str], str]] = {
+        BookModel.__name__: ("authors", "year", "title"),
+        ArticlesCollectionModel.__name__: ("authors", "year", "article_title"),
+        ThesisModel.__name__: ("author", "year", "title"),
+        InternetResourceModel.__name__: (None, None, "article"),
+        RegulationActModel.__name__: (None, "publication_year", "title"),
+    }
+
+    def key(self, record: BaseModel | BaseRecord, text: str) -> bytes:
+        fields = self.fields.get(model_name(record))
+        if fields is None:
+            return collation_key(text)
+
+        author, year, title = fields
+        title_key = collation_key(getattr(record, title))
+        return FIELD_SEPARATOR.join(
+            (
+                collation_key(self.surname(getattr(record, author))) if author is not None else title_key,
+                self.year(getattr(record, year)) if year is not None else b"",
+                title_key,
+            )
+        )
+
+    @staticmethod
+    def year(value: Any) -> bytes:
+        """
+        Получение ключа года: год дополняется нулями до четырех цифр.
+
+        Год моделей, созданных без проверки (`construct()`), может быть строкой.
+
+        :param value: Год.
+        :return: Ключ года.
+        """
+
+        return str(value).zfill(4).encode() if value is not None else b""
+
+    @staticmethod
+    def surname(authors: str) -> str:
+        """
+        Получение фамилии первого автора из перечня авторов вида «Иванов И.М., Петров С.Н.».
+
+        :param authors: Авторы.
+        :return: Фамилия первого автора.
+        """
+
+        first = authors.split(",", 1)[0].split()
+        return first[0] if first else ""
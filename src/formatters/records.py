@@ -0,0 +1,134 @@
+"""
+Компактные записи источников для форматирования.
+
+Модели pydantic используются только для проверки входных данных. После проверки значения атрибутов
+переносятся в записи с `__slots__`: у записи нет словаря атрибутов экземпляра и множества
+заполненных полей, поэтому она занимает в несколько раз меньше памяти, чем модель.
+"""
+from typing import Any, Iterator
+
+from pydantic import BaseModel
+
+from formatters.models import (
+    ArticlesCollectionModel,
+    BookModel,
+    InternetResourceModel,
+    RegulationActModel,
+    ThesisModel,
+)
+
+
+class BaseRecord:
+    """
+    Базовый класс записи источника.
+
+    Атрибуты записи совпадают с атрибутами модели, поэтому стили цитирования работают
+    с записями и моделями одинаково.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    # модель, из которой создается запись
+    model: type[BaseModel]
+    # наименования атрибутов в порядке объявления в модели
+    fields: tuple[str, ...] = ()
+
+    def __init__(self, *values: Any) -> None:
+        """
+        Конструктор.
+
+        :param values: Значения атрибутов в порядке `fields`.
+        """
+
+        for field, value in zip(self.fields, values, strict=True):
+            setattr(self, field, value)
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "BaseRecord":
+        """
+        Создание записи из проверенной модели.
+
+        :param model: Модель.
+        :return: Запись.
+        """
+
+        values = model.__dict__
+        return cls(*[values[field] for field in cls.fields])
+
+    def dict(self) -> dict[str, Any]:
+        """
+        Получение словаря атрибутов (аналог `BaseModel.dict()`).
+
+        :return: Словарь атрибутов.
+        """
+
+        return {field: getattr(self, field) for field in self.fields}
+
+    def __iter__(self) -> Iterator[tuple[str, Any]]:
+        for field in self.fields:
+            yield field, getattr(self, field)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BaseRecord):
+            return self.model is other.model and self.dict() == other.dict()
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(f'{field}={value!r}' for field, value in self)})"
+
+
+def record_type(model: type[BaseModel]) -> type[BaseRecord]:
+    """
+    Создание класса записи для модели.
+
+    :param model: Модель.
+    :return: Класс записи с атрибутами модели.
+    """
+
+    fields = tuple(model.__fields__)
+    return type(
+        model.__name__.removesuffix("Model") + "Record",
+        (BaseRecord,),
+        {"__slots__": fields, "__doc__": f"Запись для модели {model.__name__}.", "model": model, "fields": fields},
+    )
+
+
+BookRecord = record_type(BookModel)
+InternetResourceRecord = record_type(InternetResourceModel)
+ArticlesCollectionRecord = record_type(ArticlesCollectionModel)
+RegulationActRecord = record_type(RegulationActModel)
+ThesisRecord = record_type(ThesisModel)
+
+# классы записей по классам моделей
+RECORDS: dict[type[BaseModel], type[BaseRecord]] = {
+    record.model: record
+    for record in (BookRecord, InternetResourceRecord, ArticlesCollectionRecord, RegulationActRecord, ThesisRecord)
+}
+
+
+def to_record(item: BaseModel | BaseRecord) -> BaseModel | BaseRecord:
+    """
+    Преобразование проверенной модели в запись.
+
+    Записи и модели без зарегистрированного класса записи возвращаются без изменений.
+
+    :param item: Модель или запись.
+    :return: Запись.
+    """
+
+    if isinstance(item, BaseModel) and (record := RECORDS.get(type(item))) is not None:
+        return record.from_model(item)
+
+    return item
+
+
+def model_name(item: BaseModel | BaseRecord) -> str:
+    """
+    Получение наименования модели для записи или модели.
+
+    :param item: Модель или запись.
+    :return: Наименование модели.
+    """
+
+    return item.model.__name__ if isinstance(item, BaseRecord) else type(item).__name__
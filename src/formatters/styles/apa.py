@@ -1,11 +1,10 @@
 """
 Стиль цитирования по ГОСТ Р 7.0.5-2008.
 """
+import logging
 from string import Template
+from typing import Optional
 
-from pydantic import BaseModel
-
-from formatters.base import BaseCitationFormatter
 from formatters.models import (
     BookModel,
     InternetResourceModel,
@@ -13,6 +12,8 @@ from formatters.models import (
     RegulationActModel,
     ThesisModel,
 )
+from formatters.base import CitationFormatter
+from formatters.ordering import APAOrdering
 from formatters.styles.base import BaseCitationStyle
 from logger import get_logger
 
@@ -24,36 +25,29 @@ class APABook(BaseCitationStyle):
     Форматирование для книг.
     """
 
+    __slots__ = ()
+
     data: BookModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($year) $title ($edition) $city: $publishing_house, $pages p."
-        )
+    template = Template("$authors ($year) $title ($edition) $city: $publishing_house, $pages p.")
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование книги "%s" ...', self.data.title)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование книги "%s" ...', self.data.title)
 
-        return self.template.substitute(
-            authors=self.data.authors,
-            title=self.data.title,
-            edition=self.get_edition(),
-            city=self.data.city,
-            publishing_house=self.data.publishing_house,
-            year=self.data.year,
-            pages=self.data.pages,
-        )
+        return self.render()
 
-    def get_edition(self) -> str:
+    @staticmethod
+    def get_edition(edition: Optional[str]) -> str:
         """
         Получение отформатированной информации об издательстве.
 
+        :param edition: Издание.
         :return: Информация об издательстве.
         """
 
-        return f"{self.data.edition} изд. – " if self.data.edition else ""
+        return f"{edition} изд. – " if edition else ""
 
 
 class APAInternetResource(BaseCitationStyle):
@@ -61,21 +55,17 @@ class APAInternetResource(BaseCitationStyle):
     Форматирование для интернет-ресурсов.
     """
 
+    __slots__ = ()
+
     data: InternetResourceModel
 
-    @property
-    def template(self) -> Template:
-        return Template("$website ($access_date) $article $link")
+    template = Template("$website ($access_date) $article $link")
 
     def substitute(self) -> str:
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование интернет-ресурса "%s" ...', self.data.article)
 
-        return self.template.substitute(
-            article=self.data.article,
-            website=self.data.website,
-            link=self.data.link,
-            access_date=self.data.access_date,
-        )
+        return self.render()
 
 
 class APACollectionArticle(BaseCitationStyle):
@@ -83,27 +73,18 @@ class APACollectionArticle(BaseCitationStyle):
     Форматирование для статьи из сборника.
     """
 
+    __slots__ = ()
+
     data: ArticlesCollectionModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors ($year) $article_title, $collection_title $city: $publishing_house, $pages p."
-        )
+    template = Template("$authors ($year) $article_title, $collection_title $city: $publishing_house, $pages p.")
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование сборника статей "%s" ...', self.data.article_title)
 
-        return self.template.substitute(
-            authors=self.data.authors,
-            article_title=self.data.article_title,
-            collection_title=self.data.collection_title,
-            city=self.data.city,
-            publishing_house=self.data.publishing_house,
-            year=self.data.year,
-            pages=self.data.pages,
-        )
+        return self.render()
 
 
 class APAThesis(BaseCitationStyle):
@@ -111,38 +92,38 @@ class APAThesis(BaseCitationStyle):
     Форматирование для диссертаций.
     """
 
+    __slots__ = ()
+
     data: ThesisModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$author ($year) $title / $city, $pages p."
-        )
+    template = Template("$author ($year) $title / $city, $pages p.")
 
     def substitute(self) -> str:
-        logger.info('Форматирование диссертации "%s" ...', self.data.title)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование диссертации "%s" ...', self.data.title)
 
-        return self.template.substitute(self.data.dict())
+        return self.render()
 
 
 class APARegulationAct(BaseCitationStyle):
+    __slots__ = ()
+
     data: RegulationActModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "($publication_year) $title, $type, $official_source, $number, edited $edition"
-        )
+    template = Template("($publication_year) $title, $type, $official_source, $number, edited $edition")
 
     def substitute(self) -> str:
-        logger.info('Форматирование законодательного акта "%s" ...', self.data.title)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование законодательного акта "%s" ...', self.data.title)
 
-        return self.template.substitute(self.data.dict())
+        return self.render()
 
 
-class APACitationFormatter(BaseCitationFormatter):
+class APACitationFormatter(CitationFormatter):
     """
     Базовый класс для итогового форматирования списка источников.
+
+    Источники сортируются по фамилии первого автора, году и названию (`APAOrdering`).
     """
 
     formatters_map = {
@@ -153,24 +134,4 @@ class APACitationFormatter(BaseCitationFormatter):
         ThesisModel.__name__: APAThesis,
     }
 
-    def __init__(self, models: list[BaseModel]) -> None:
-        """
-        Конструктор.
-
-        :param models: Список объектов для форматирования
-        """
-
-        formatted_items = []
-        for model in models:
-            formatted_items.append(self.formatters_map.get(type(model).__name__)(model))  # type: ignore
-
-        self.formatted_items = formatted_items
-
-    def format(self) -> list[BaseCitationStyle]:
-        """
-        Форматирование списка источников.
-
-        :return:
-        """
-
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+    ordering = APAOrdering()
@@ -2,32 +2,139 @@
 Базовые методы для форматирования списка источников.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC
 from string import Template
+from typing import Any, Callable, ClassVar, Optional, Sequence
 
 
 from pydantic import BaseModel
 
+from formatters.records import BaseRecord
+
+
+# функция форматирования строк по столбцам значений атрибутов
+BatchRenderer = Callable[[dict[str, Sequence[Any]]], list[str]]
+
+
+def compile_template(
+    template: Template, style: type
+) -> tuple[tuple[str, ...], Callable[["BaseCitationStyle"], str], BatchRenderer]:
+    """
+    Компиляция шаблона в функции форматирования строки и столбцов значений.
+
+    Шаблон разбирается один раз для класса стиля: текст шаблона переносится в f-строку,
+    переменная `$name` заменяется значением атрибута `name` форматируемого объекта, а если у стиля
+    определен статический метод `get_name(value)` – результатом его вызова для значения атрибута.
+
+    :param template: Шаблон для форматирования строки.
+    :param style: Класс стиля цитирования.
+    :return: Наименования переменных шаблона, функция форматирования строки объекта стиля
+        и функция форматирования столбцов значений.
+    """
+
+    parts = []
+    names: list[str] = []
+    getters: list[str] = []
+    position = 0
+    for match in template.pattern.finditer(template.template):
+        # фигурные скобки текста шаблона экранируются для f-строки
+        parts.append(template.template[position : match.start()].replace("{", "{{").replace("}", "}}"))
+        position = match.end()
+
+        name = match.group("named") or match.group("braced")
+        if match.group("escaped") is not None:
+            parts.append("$")
+            continue
+        if name is None:
+            raise ValueError(f"Некорректная переменная в шаблоне: {template.template}")
+
+        if name not in names:
+            names.append(name)
+        # значения атрибутов передаются через переменные `v_<name>`
+        if callable(getattr(style, f"get_{name}", None)):
+            if name not in getters:
+                getters.append(name)
+            parts.append(f"{{get_{name}(v_{name})}}")
+        else:
+            parts.append(f"{{v_{name}}}")
+    parts.append(template.template[position:].replace("{", "{{").replace("}", "}}"))
+
+    text = f"f{''.join(parts)!r}"
+    bindings = "".join(f"    get_{name} = style.get_{name}\n" for name in getters)
+    source = (
+        "def render(self):\n"
+        "    data = self.data\n"
+        + bindings
+        + "".join(f"    v_{name} = data.{name}\n" for name in names)
+        + f"    return {text}\n"
+        "def render_batch(columns):\n"
+        + bindings
+        + f"    return [{text} for ({''.join(f'v_{name}, ' for name in names)}) in "
+        f"zip({', '.join(f'columns[{name!r}]' for name in names)})]\n"
+    )
+    namespace: dict = {"style": style}
+    exec(compile(source, f"<template {style.__name__}>", "exec"), namespace)  # pylint: disable=exec-used
+
+    return tuple(names), namespace["render"], namespace["render_batch"]
+
 
 class BaseCitationStyle(ABC):
     """
     Абстрактный базовый класс стиля цитирования.
+
+    Шаблон стиля (`template`) компилируется в функцию форматирования (`render`) один раз при объявлении класса.
+    Строка форматируется при первом обращении к `formatted`. Экземпляры не имеют словаря атрибутов,
+    поэтому наследники также объявляют `__slots__`.
     """
 
-    def __init__(self, data: BaseModel) -> None:
+    __slots__ = ("data", "_formatted")
+
+    # шаблон для форматирования строки
+    template: ClassVar[Template]
+    # наименования переменных шаблона (атрибутов форматируемого объекта)
+    variables: ClassVar[tuple[str, ...]] = ()
+    # функция форматирования строки, скомпилированная из шаблона
+    render: ClassVar[Callable[["BaseCitationStyle"], str]]
+    # функция форматирования столбцов значений, скомпилированная из шаблона
+    render_batch: ClassVar[BatchRenderer]
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        if isinstance(cls.__dict__.get("template"), Template):
+            cls.variables, render, render_batch = compile_template(cls.template, cls)
+            cls.render = render  # type: ignore
+            cls.render_batch = staticmethod(render_batch)  # type: ignore
+
+    @classmethod
+    def format_batch(cls, columns: dict[str, Sequence[Any]]) -> list[str]:
+        """
+        Форматирование источников одного типа по столбцам значений атрибутов.
+
+        Строки формируются в одном цикле без создания объектов стиля и обращения к атрибутам объектов.
+
+        :param columns: Списки значений по наименованиям переменных шаблона (`variables`), одинаковой длины.
+        :return: Отформатированные строки в порядке значений.
+        """
+
+        return cls.render_batch(columns)
+
+    def __init__(self, data: BaseModel | BaseRecord) -> None:
         self.data = data
-        self.formatted = self.substitute()
+        self._formatted: Optional[str] = None
 
     @property
-    @abstractmethod
-    def template(self) -> Template:
+    def formatted(self) -> str:
         """
-        Получение шаблона для форматирования строки.
+        Получение отформатированной строки (форматируется при первом обращении).
 
-        :return:
+        :return: Отформатированная строка.
         """
 
-    @abstractmethod
+        if self._formatted is None:
+            self._formatted = self.substitute()
+
+        return self._formatted
+
     def substitute(self) -> str:
         """
         Заполнение шаблона для форматирования строки.
@@ -35,6 +142,8 @@ class BaseCitationStyle(ABC):
         :return:
         """
 
+        return self.render()
+
     def __str__(self) -> str:
         return self.formatted
 
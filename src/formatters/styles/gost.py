@@ -1,10 +1,12 @@
 """
 Стиль цитирования по ГОСТ Р 7.0.5-2008.
 """
+import logging
 from string import Template
+from typing import Optional
 
-from pydantic import BaseModel
-
+from formatters.base import CitationFormatter
+from formatters.ordering import GOSTOrdering
 from formatters.styles.base import BaseCitationStyle
 from formatters.models import (
     BookModel,
@@ -25,36 +27,29 @@ class GOSTBook(BaseCitationStyle):
     Форматирование для книг.
     """
 
+    __slots__ = ()
+
     data: BookModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $title. – $edition$city: $publishing_house, $year. – $pages с."
-        )
+    template = Template("$authors $title. – $edition$city: $publishing_house, $year. – $pages с.")
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование книги "%s" ...', self.data.title)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование книги "%s" ...', self.data.title)
 
-        return self.template.substitute(
-            authors=self.data.authors,
-            title=self.data.title,
-            edition=self.get_edition(),
-            city=self.data.city,
-            publishing_house=self.data.publishing_house,
-            year=self.data.year,
-            pages=self.data.pages,
-        )
+        return self.render()
 
-    def get_edition(self) -> str:
+    @staticmethod
+    def get_edition(edition: Optional[str]) -> str:
         """
         Получение отформатированной информации об издательстве.
 
+        :param edition: Издание.
         :return: Информация об издательстве.
         """
 
-        return f"{self.data.edition} изд. – " if self.data.edition else ""
+        return f"{edition} изд. – " if edition else ""
 
 
 class GOSTInternetResource(BaseCitationStyle):
@@ -62,24 +57,18 @@ class GOSTInternetResource(BaseCitationStyle):
     Форматирование для интернет-ресурсов.
     """
 
+    __slots__ = ()
+
     data: InternetResourceModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$article // $website URL: $link (дата обращения: $access_date)."
-        )
+    template = Template("$article // $website URL: $link (дата обращения: $access_date).")
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование интернет-ресурса "%s" ...', self.data.article)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование интернет-ресурса "%s" ...', self.data.article)
 
-        return self.template.substitute(
-            article=self.data.article,
-            website=self.data.website,
-            link=self.data.link,
-            access_date=self.data.access_date,
-        )
+        return self.render()
 
 
 class GOSTCollectionArticle(BaseCitationStyle):
@@ -87,27 +76,18 @@ class GOSTCollectionArticle(BaseCitationStyle):
     Форматирование для статьи из сборника.
     """
 
+    __slots__ = ()
+
     data: ArticlesCollectionModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages."
-        )
+    template = Template("$authors $article_title // $collection_title. – $city: $publishing_house, $year. – С. $pages.")
 
     def substitute(self) -> str:
 
-        logger.info('Форматирование сборника статей "%s" ...', self.data.article_title)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование сборника статей "%s" ...', self.data.article_title)
 
-        return self.template.substitute(
-            authors=self.data.authors,
-            article_title=self.data.article_title,
-            collection_title=self.data.collection_title,
-            city=self.data.city,
-            publishing_house=self.data.publishing_house,
-            year=self.data.year,
-            pages=self.data.pages,
-        )
+        return self.render()
 
 
 class GOSTThesis(BaseCitationStyle):
@@ -115,38 +95,42 @@ class GOSTThesis(BaseCitationStyle):
     Форматирование для диссертации.
     """
 
+    __slots__ = ()
+
     data: ThesisModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$author $title : $degree $field $field_code / $city, $year. - $pages с."
-        )
+    template = Template("$author $title : $degree $field $field_code / $city, $year. - $pages с.")
 
     def substitute(self) -> str:
-        logger.info('Форматирование диссертации "%s" ...', self.data.title)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование диссертации "%s" ...', self.data.title)
 
-        return self.template.substitute(self.data.dict())
+        return self.render()
 
 
 class GOSTRegulationAct(BaseCitationStyle):
+    __slots__ = ()
+
     data: RegulationActModel
 
-    @property
-    def template(self) -> Template:
-        return Template(
-            "$title: $type от $accept_date. №$number: в ред. от $edition // $official_source $publication_year"
-        )
+    template = Template(
+        "$title: $type от $accept_date. №$number: в ред. от $edition // $official_source $publication_year"
+    )
 
     def substitute(self) -> str:
-        logger.info('Форматирование законодательного акта "%s" ...', self.data.title)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Форматирование законодательного акта "%s" ...', self.data.title)
 
-        return self.template.substitute(self.data.dict())
+        return self.render()
 
 
-class GOSTCitationFormatter:
+class GOSTCitationFormatter(CitationFormatter):
     """
     Базовый класс для итогового форматирования списка источников.
+
+    Нормативные акты располагаются перед остальными источниками, внутри групп источники сортируются
+    по ключам `collation_key()`: записи на кириллице перед записями на латинице, без учета регистра
+    и знаков препинания.
     """
 
     formatters_map = {
@@ -157,24 +141,4 @@ class GOSTCitationFormatter:
         RegulationActModel.__name__: GOSTRegulationAct,
     }
 
-    def __init__(self, models: list[BaseModel]) -> None:
-        """
-        Конструктор.
-
-        :param models: Список объектов для форматирования
-        """
-
-        formatted_items = []
-        for model in models:
-            formatted_items.append(self.formatters_map.get(type(model).__name__)(model))  # type: ignore
-
-        self.formatted_items = formatted_items
-
-    def format(self) -> list[BaseCitationStyle]:
-        """
-        Форматирование списка источников.
-
-        :return:
-        """
-
-        return sorted(self.formatted_items, key=lambda item: item.formatted)
+    ordering = GOSTOrdering()
@@ -1,35 +1,123 @@
 """
 Функции для логирования.
+
+Записи логов всех модулей передаются через очередь (`QueueHandler`) одному обработчику очереди
+(`QueueListener`), который в отдельном потоке пишет их в общий файл и в консоль. Запись в лог
+не блокирует обработку источников файловым и консольным выводом. Дочерние процессы
+передают записи в ту же очередь (см. `pool_options()`), поэтому в файл пишет только основной процесс.
 """
+import atexit
 import logging
+import multiprocessing
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Any, Optional
+
+from settings import LOGGING_FILE, LOGGING_FORMAT, LOGGING_LEVEL, LOGGING_PATH
+
+# очередь записей логов и ее обработчик (создаются один раз в основном процессе)
+_queue: Optional[Any] = None
+_listener: Optional[QueueListener] = None
+_lock = threading.Lock()
 
-from settings import LOGGING_FORMAT, LOGGING_LEVEL, LOGGING_PATH
 
+def setup_logging(logging_format: str = LOGGING_FORMAT, logging_path: str = LOGGING_PATH) -> None:
+    """
+    Настройка записи логов через очередь.
+
+    Повторный вызов не добавляет обработчики. В дочерних процессах настройка выполняется
+    при запуске процесса (`init_worker()`).
 
-def get_logger(
-    module_name: str,
-    logging_level: str = LOGGING_LEVEL,
-    logging_format: str = LOGGING_FORMAT,
-) -> logging.Logger:
+    :param logging_format: Формат логов
+    :param logging_path: Путь к директории для логирования
+    """
+
+    global _queue, _listener  # pylint: disable=global-statement
+
+    # в дочерних процессах, запущенных через spawn, основной модуль импортируется до установки
+    # родительского процесса (`parent_process()`), поэтому процесс определяется по имени
+    if multiprocessing.current_process().name != "MainProcess":
+        return
+
+    with _lock:
+        if _listener is not None:
+            return
+
+        formatter = logging.Formatter(logging_format)
+        # запись логов в общий файл
+        file_handler = logging.FileHandler(Path(logging_path) / LOGGING_FILE, encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        # вывод логов в консоль
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        # очередь процессов, чтобы в нее могли писать и дочерние процессы
+        # (контекст spawn: очередь можно передать в пулы процессов с любым способом запуска)
+        _queue = multiprocessing.get_context("spawn").Queue(-1)
+        _listener = QueueListener(_queue, file_handler, stream_handler, respect_handler_level=True)
+        _listener.start()
+        logging.getLogger().addHandler(QueueHandler(_queue))
+
+        atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """
+    Остановка обработчика очереди с записью оставшихся в очереди записей.
+    """
+
+    global _listener  # pylint: disable=global-statement
+
+    with _lock:
+        if _listener is None:
+            return
+
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def init_worker(queue: Any) -> None:
+    """
+    Настройка логирования в дочернем процессе: записи передаются в очередь основного процесса.
+
+    :param queue: Очередь записей логов основного процесса
+    """
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(queue))
+
+
+def pool_options() -> dict[str, Any]:
+    """
+    Получение параметров пула процессов для передачи логов дочерних процессов в основной процесс.
+
+    :return: Параметры `initializer` и `initargs` для `ProcessPoolExecutor`.
+    """
+
+    setup_logging()
+    if _queue is None:
+        return {}
+
+    return {"initializer": init_worker, "initargs": (_queue,)}
+
+
+def get_logger(module_name: str, logging_level: str = LOGGING_LEVEL) -> logging.Logger:
     """
     Настройка логгера.
 
     :param module_name: Наименование модуля
     :param logging_level: Уровень логирования
-    :param logging_format: Формат логов
     :return:
     """
 
-    # запись логов в файлы
+    setup_logging()
+
     logger = logging.getLogger(module_name)
     logger.setLevel(logging_level)
-    file_handler = logging.FileHandler(f"{LOGGING_PATH}/{module_name}.log")
-    file_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(file_handler)
-
-    # вывод логов в консоль
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(logging.Formatter(logging_format))
-    logger.addHandler(stream_handler)
 
     return logger
@@ -1,16 +1,25 @@
 """
 Запуск приложения.
 """
+from contextlib import ExitStack
 from enum import Enum, unique
+from itertools import zip_longest
+from typing import Optional
 
 import click
 
-from formatters.base import BaseCitationFormatter
+from formatters.base import CitationFormatter
+from formatters.cache import FormattedCache
 from formatters.styles.apa import APACitationFormatter
 from formatters.styles.gost import GOSTCitationFormatter
 from logger import get_logger
-from readers.reader import SourcesReader
-from renderer import APARenderer, GOSTRenderer, Renderer
+from readers.base import BaseModelsWriter, BaseSourcesReader
+from readers.cache import SheetCache
+from readers.delimited import DelimitedReader
+from readers.jsonl import JsonLinesReader, JsonLinesWriter
+from readers.reader import EngineEnum, SourcesReader
+from readers.snapshot import SnapshotReader, SnapshotWriter
+from renderer import APARenderer, FormatEnum, GOSTRenderer, Renderer, get_renderer, render_outputs
 from settings import INPUT_FILE_PATH, OUTPUT_FILE_PATH
 
 logger = get_logger(__name__)
@@ -29,7 +38,7 @@ class CitationEnum(str, Enum):
 
 def get_citation_type(
     citation: str,
-) -> tuple[type[BaseCitationFormatter], type[Renderer]]:
+) -> tuple[type[CitationFormatter], type[Renderer]]:
     """
     Получение классов для форматирования и рендеринга.
     """
@@ -61,48 +70,198 @@ def get_citation_type(
     type=str,
     default=INPUT_FILE_PATH,
     show_default=True,
-    help="Путь к входному файлу",
+    help="Путь к входному файлу (xlsx, csv, tsv, jsonl, ndjson, snapshot или директория с файлами csv/tsv)",
 )
 @click.option(
     "--path_output",
     "-po",
     "path_output",
     type=str,
-    default=OUTPUT_FILE_PATH,
+    multiple=True,
+    default=(OUTPUT_FILE_PATH,),
     show_default=True,
-    help="Путь к выходному файлу",
+    help="Путь к выходному файлу (можно указать несколько раз для генерации нескольких файлов за один проход)",
+)
+@click.option(
+    "--format",
+    "-f",
+    "output_format",
+    type=click.Choice(list(FormatEnum), case_sensitive=False),
+    multiple=True,
+    help="Формат выходного файла (по умолчанию определяется по расширению, иначе docx); "
+    "при нескольких выходных файлах форматы сопоставляются с ними по порядку",
+)
+@click.option(
+    "--streaming/--no-streaming",
+    "streaming",
+    default=True,
+    show_default=True,
+    help="Потоковое чтение входного файла (режим только для чтения)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    "workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Количество процессов для параллельного чтения листов входного файла и форматирования",
+)
+@click.option(
+    "--engine",
+    "-e",
+    "engine",
+    type=click.Choice(list(EngineEnum), case_sensitive=False),
+    default=EngineEnum.OPENPYXL.name,
+    show_default=True,
+    help="Способ чтения входного файла (xml – потоковый разбор листов без openpyxl)",
+)
+@click.option(
+    "--cache/--no-cache",
+    "cache",
+    default=False,
+    show_default=True,
+    help="Постоянный кэш моделей неизмененных листов входного файла и отформатированных строк",
+)
+@click.option(
+    "--clear_cache",
+    "clear_cache",
+    is_flag=True,
+    default=False,
+    help="Очистка кэша перед обработкой",
+)
+@click.option(
+    "--trusted",
+    "trusted",
+    is_flag=True,
+    default=False,
+    help="Создание моделей без проверки для ранее проверенных входных данных",
+)
+@click.option(
+    "--run_size",
+    "run_size",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Количество строк в части для внешней сортировки через временные файлы (по умолчанию сортировка в памяти)",
+)
+@click.option(
+    "--dump_models",
+    "-dm",
+    "dump_models",
+    type=str,
+    default=None,
+    help="Путь к файлу для записи прочитанных моделей (JSON Lines или снимок с расширением .snapshot)",
 )
 def process_input(
     citation: str = CitationEnum.GOST,
     path_input: str = INPUT_FILE_PATH,
-    path_output: str = OUTPUT_FILE_PATH,
+    path_output: tuple[str, ...] = (OUTPUT_FILE_PATH,),
+    output_format: tuple[str, ...] = (),
+    streaming: bool = True,
+    workers: int = 1,
+    engine: str = EngineEnum.OPENPYXL,
+    cache: bool = False,
+    clear_cache: bool = False,
+    trusted: bool = False,
+    dump_models: Optional[str] = None,
+    run_size: Optional[int] = None,
 ) -> None:
     """
-    Генерация файла Word с оформленным библиографическим списком.
+    Генерация файлов (Word, текст, Markdown, HTML или BibTeX) с оформленным библиографическим списком.
 
     :param str citation: Стиль цитирования
     :param str path_input: Путь к входному файлу
-    :param str path_output: Путь к выходному файлу
+    :param tuple[str, ...] path_output: Пути к выходным файлам
+    :param tuple[str, ...] output_format: Форматы выходных файлов
+    :param bool streaming: Потоковое чтение входного файла
+    :param int workers: Количество процессов для параллельного чтения и форматирования
+    :param str engine: Способ чтения входного файла
+    :param bool cache: Постоянный кэш моделей неизмененных листов и отформатированных строк
+    :param bool clear_cache: Очистка кэша перед обработкой
+    :param bool trusted: Создание моделей без проверки
+    :param str dump_models: Путь к файлу для записи прочитанных моделей
+    :param int run_size: Количество строк в части для внешней сортировки
     """
 
     logger.info(
         """Обработка команды с параметрами:
         - Стиль цитирования: %s.
         - Путь к входному файлу: %s.
-        - Путь к выходному файлу: %s.""",
+        - Пути к выходным файлам: %s.
+        - Форматы выходных файлов: %s.
+        - Потоковое чтение: %s.
+        - Количество процессов: %s.
+        - Способ чтения: %s.
+        - Кэш: %s.
+        - Доверенные данные: %s.
+        - Запись моделей: %s.
+        - Размер части внешней сортировки: %s.""",
         citation,
         path_input,
         path_output,
+        output_format,
+        streaming,
+        workers,
+        engine,
+        cache,
+        trusted,
+        dump_models,
+        run_size,
     )
 
-    models = SourcesReader(path_input).read()
+    if len(output_format) > len(path_output):
+        raise click.BadParameter("Форматов указано больше, чем выходных файлов.", param_hint="--format")
+
+    # кэши создаются только при их использовании или очистке
+    if clear_cache:
+        SheetCache().clear()
+        FormattedCache().clear()
+    sheet_cache = SheetCache() if cache else None
+    formatted_cache = FormattedCache() if cache else None
+
+    reader: BaseSourcesReader
+    if SnapshotReader.supports(path_input):
+        reader = SnapshotReader(path_input)
+    elif JsonLinesReader.supports(path_input):
+        reader = JsonLinesReader(path_input, trusted=trusted)
+    elif DelimitedReader.supports(path_input):
+        # файлы с разделителями читаются построчно, параметры чтения рабочей книги не используются
+        reader = DelimitedReader(path_input, trusted=trusted)
+    else:
+        reader = SourcesReader(
+            path_input,
+            read_only=streaming,
+            workers=workers,
+            engine=engine,
+            cache=sheet_cache,
+            trusted=trusted,
+        )
+
+    with ExitStack() as stack:
+        stack.enter_context(reader)
+        models = reader.read()
+        if dump_models:
+            # модели записываются по мере чтения, без накопления в памяти
+            writer: type[BaseModelsWriter] = SnapshotWriter if SnapshotReader.supports(dump_models) else JsonLinesWriter
+            models = stack.enter_context(writer(dump_models)).passthrough(models)
+
+        logger.info("Форматирование списка источников ...")
+        formatter, renderer = get_citation_type(citation)
+        formatted_models = formatter(
+            models, workers=workers, cache=stack.enter_context(formatted_cache) if formatted_cache is not None else None
+        ).iter_text(run_size)
+
+        # при внешней сортировке строки передаются в генерацию файлов по мере слияния частей
+        logger.info("Генерация выходных файлов ...")
+        outputs = [
+            (get_renderer(renderer, path, output), path) for path, output in zip_longest(path_output, output_format)
+        ]
+        render_outputs(formatted_models, outputs)
 
-    logger.info("Форматирование списка источников ...")
-    formatter, renderer = get_citation_type(citation)
-    formatted_models = tuple(str(item) for item in formatter(models).format())
+    if reader.errors:
+        # выходной файл содержит все корректные строки, ошибочные строки перечисляются одним сообщением
+        raise click.ClickException("Строки с ошибками пропущены:\n" + "\n".join(str(error) for error in reader.errors))
 
-    logger.info("Генерация выходного файла ...")
-    renderer(formatted_models).render(path_output)
     logger.info("Команда успешно завершена.")
 
 
@@ -2,31 +2,213 @@
 Функции чтения исходного файла.
 """
 
+import sys
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import Type
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Type, TypeVar
 
 from openpyxl.workbook import Workbook
 from pydantic import BaseModel
 
 from logger import get_logger
+from readers.xlsx import XlsxWorkbook
 
 logger = get_logger(__name__)
 
+# функция декодирования строки таблицы в словарь атрибутов модели
+RowDecoder = Callable[[Sequence[Any]], dict[str, Any]]
+
+SourcesReaderType = TypeVar("SourcesReaderType", bound="BaseSourcesReader")
+ModelsWriterType = TypeVar("ModelsWriterType", bound="BaseModelsWriter")
+
+
+def to_str(value: Any) -> str:
+    """
+    Преобразование значения ячейки в строку.
+    """
+
+    return str(value).strip()
+
+
+def to_int(value: Any) -> int:
+    """
+    Преобразование значения ячейки в целое число.
+    """
+
+    # значения, уже прочитанные как целые числа, не требуют преобразования через строку
+    return value if type(value) is int else int(str(value))  # pylint: disable=unidiomatic-typecheck
+
+
+def to_date(value: Any) -> Any:
+    """
+    Преобразование значения ячейки с датой в строку формата `дд.мм.гггг`.
+    """
+
+    if isinstance(value, date):
+        # эквивалент `value.strftime("%d.%m.%Y")` без разбора формата для каждой ячейки
+        return f"{value.day:02d}.{value.month:02d}.{value.year:04d}"
+
+    return value
+
+
+def to_value(value: Any) -> Any:
+    """
+    Значение ячейки без преобразования (для типов данных без преобразователя).
+    """
+
+    return value
+
+
+# преобразователи значений ячеек по типам данных из метода `attributes()`
+CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    str: to_str,
+    int: to_int,
+    date: to_date,
+}
+
+
+class RowError(BaseModel):
+    """
+    Ошибка декодирования или проверки строки листа.
+    """
+
+    sheet: str
+    row: int
+    error: str
+
+    def __str__(self) -> str:
+        return f'Лист "{self.sheet}", строка {self.row}: {self.error}'
+
+
+class BaseSourcesReader(ABC):
+    """
+    Базовый класс чтения входного файла со всеми типами источников (рабочая книга, файлы с разделителями,
+    JSON Lines, снимок моделей).
+
+    Используется как контекстный менеджер: файл открывается при входе (`open()`) и закрывается при выходе
+    (`close()`). Ошибки строк, пропущенных при чтении, сохраняются в `errors`.
+    """
+
+    errors: list[RowError]
+
+    def __enter__(self: SourcesReaderType) -> SourcesReaderType:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """
+        Открытие входного файла (по умолчанию файл открывается при чтении).
+        """
+
+    def close(self) -> None:
+        """
+        Закрытие входного файла (по умолчанию файл закрывается после чтения).
+        """
+
+    @abstractmethod
+    def read(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение моделей.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+
+class BaseModelsWriter(ABC):
+    """
+    Базовый класс потоковой записи моделей в файл.
+
+    Используется как контекстный менеджер: файл открывается при входе (`open()`), при выходе
+    запись завершается (`close()`) с признаком записи всех моделей (без исключения).
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу для записи.
+        """
+
+        self.path = Path(path)
+        self.count = 0
+
+    def __enter__(self: ModelsWriterType) -> ModelsWriterType:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self.close(completed=exc_type is None):
+            logger.info("Записано моделей в %s: %s.", self.path, self.count)
+
+    @abstractmethod
+    def open(self) -> None:
+        """
+        Открытие файла для записи.
+        """
+
+    @abstractmethod
+    def close(self, completed: bool = True) -> bool:
+        """
+        Завершение записи и закрытие файла.
+
+        :param completed: Признак записи всех моделей.
+        :return: Признак сохранения файла.
+        """
+
+    @abstractmethod
+    def write(self, model: BaseModel) -> None:
+        """
+        Запись модели в файл.
+
+        :param model: Модель.
+        """
+
+    def passthrough(self, models: Iterable[BaseModel]) -> Iterator[BaseModel]:
+        """
+        Запись моделей по мере их чтения без остановки дальнейшей обработки.
+
+        :param models: Модели.
+        :return: Генератор тех же моделей.
+        """
+
+        for model in models:
+            self.write(model)
+            yield model
+
 
 class BaseReader(ABC):
     """
     Базовый класс читателя исходного файла.
     """
 
-    def __init__(self, workbook: Workbook) -> None:
+    def __init__(self, workbook: Optional[Workbook | XlsxWorkbook] = None, trusted: bool = False) -> None:
         """
         Конструктор.
 
-        :param workbook: Рабочая книга Excel.
+        :param workbook: Рабочая книга Excel (openpyxl или потоковая книга XML-частей листов),
+            не требуется для получения описания листа и модели.
+        :param trusted: Доверенные данные (ранее прошедшие проверку): модели создаются без проверки.
         """
 
         self.workbook = workbook
+        self.trusted = trusted
+        # ошибки строк, не прошедших декодирование или проверку
+        self.errors: list[RowError] = []
 
     @property
     @abstractmethod
@@ -67,40 +249,143 @@ class BaseReader(ABC):
         :return: Атрибуты с информацией об индексе столбца и типе данных
         """
 
-    def read(self) -> list[BaseModel]:
+    @property
+    def headers(self) -> dict[str, str]:
         """
-        Чтение исходного файла.
+        Получение заголовков столбцов для атрибутов.
 
-        :return: Список моделей строк в виде DTO (Data Transfer Objects).
+        Если заголовок найден в первой строке листа, индекс столбца атрибута определяется по нему,
+        иначе используется индекс из метода `attributes()`.
+
+        :return: Заголовки столбцов по наименованиям атрибутов.
         """
 
-        models = []
-        # чтение со второй строки таблицы (первая строка содержит заголовок)
-        for row in self.workbook[self.sheet].iter_rows(min_row=2):
+        return {}
+
+    @property
+    def interned(self) -> frozenset[str]:
+        """
+        Получение наименований строковых атрибутов с небольшим количеством уникальных значений
+        (города, издательства и т.п.), значения которых хранятся в памяти один раз (`sys.intern()`).
+
+        :return: Наименования атрибутов.
+        """
+
+        return frozenset()
+
+    def compile_decoder(self, header: Optional[Sequence[Any]] = None) -> RowDecoder:
+        """
+        Компиляция описания атрибутов в функцию декодирования строки.
+
+        Индексы столбцов и преобразователи значений определяются один раз для листа,
+        а не для каждой ячейки каждой строки.
+
+        :param header: Строка заголовка листа для определения индексов столбцов.
+        :return: Функция декодирования строки в словарь атрибутов модели.
+        """
+
+        positions = {}
+        if header:
+            positions = {str(title).strip().lower(): index for index, title in enumerate(header) if title}
+
+        headers = self.headers
+        interned = self.interned
+        fields = []
+        for attr, params in self.attributes.items():
+            index, data_type = next(iter(params.items()))
+            title = headers.get(attr)
+            if title:
+                index = positions.get(title.strip().lower(), index)
+            convert = CONVERTERS.get(data_type, to_value)
+            if attr in interned:
+                convert = self.compile_interning(convert)
+            fields.append((attr, index, convert))
+
+        width = max(index for _, index, _ in fields) + 1
+        padding = (None,) * width
+
+        def decode(row: Sequence[Any]) -> dict[str, Any]:
+            # в режиме только для чтения строка может быть короче заголовка
+            if len(row) < width:
+                row = (*row, *padding)
+
+            # пустые значения передаются в модель без преобразования
+            return {attr: convert(value) if (value := row[index]) else value for attr, index, convert in fields}
+
+        return decode
+
+    @staticmethod
+    def compile_interning(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+        """
+        Получение преобразователя значений атрибута с заменой строк единственными объектами (`sys.intern()`),
+        поэтому повторяющиеся значения хранятся в памяти один раз.
+
+        :param convert: Преобразователь значений ячеек.
+        :return: Преобразователь значений ячеек.
+        """
+
+        intern = sys.intern
+
+        def convert_interned(value: Any) -> Any:
+            value = convert(value)
+            return intern(value) if type(value) is str else value  # pylint: disable=unidiomatic-typecheck
+
+        return convert_interned
+
+    def read_rows(self, rows: Iterable[Sequence[Any]]) -> Iterator[BaseModel]:
+        """
+        Потоковое декодирование строк таблицы в модели.
+
+        Строки с ошибками пропускаются и сохраняются в `errors` с номером строки листа,
+        чтобы одним запуском можно было найти все ошибки листа.
+
+        :param rows: Строки таблицы, первая строка содержит заголовок.
+        :return: Генератор моделей строк в виде DTO (Data Transfer Objects).
+        """
+
+        rows = iter(rows)
+        decode = self.compile_decoder(next(rows, None))
+
+        for number, row in enumerate(rows, start=2):
             # обработка строки идет только, если заполнены обязательные столбцы
-            if row[0].value:
-                attrs = {}
+            if row and row[0]:
+                model = self.create_model(decode, number, row)
+                if model is not None:
+                    yield model
 
-                # обработка заданных в методе `attributes()` атрибутов
-                for attr, params in self.attributes.items():
-                    index, data_type = list(params.items())[0]
-                    attrs[attr] = row[index].value
+    def create_model(self, decode: RowDecoder, number: int, row: Sequence[Any]) -> Optional[BaseModel]:
+        """
+        Создание модели из строки таблицы.
+
+        Ошибка декодирования или проверки сохраняется в `errors`, строка пропускается.
 
-                    if not attrs[attr]:
-                        continue
+        :param decode: Функция декодирования строки.
+        :param number: Номер строки для сообщения об ошибке.
+        :param row: Строка таблицы.
+        :return: Модель строки или `None` для строки с ошибкой.
+        """
 
-                    if data_type is int:
-                        attrs[attr] = int(str(attrs.get(attr)))
+        try:
+            # для доверенных данных модель создается без проверки атрибутов
+            if self.trusted:
+                return self.model.construct(**decode(row))
 
-                    if data_type is str:
-                        attrs[attr] = str(attrs.get(attr)).strip()
+            return self.model(**decode(row))
+        except ValueError as ex:
+            # `ValidationError` также является `ValueError`
+            error = RowError(sheet=self.sheet, row=number, error=str(ex))
+            logger.warning("%s", error)
+            self.errors.append(error)
 
-                    if data_type is date:
-                        value = attrs.get(attr)
-                        if isinstance(value, date):
-                            attrs[attr] = value.strftime("%d.%m.%Y")
+        return None
 
-                # добавление считанной и обработанной строки в список моделей
-                models.append(self.model(**attrs))
+    def read(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходного файла.
+
+        Строки листа обрабатываются по одной, поэтому в памяти одновременно находится только текущая строка.
+
+        :return: Генератор моделей строк в виде DTO (Data Transfer Objects).
+        """
 
-        return models
+        return self.read_rows(self.workbook[self.sheet].iter_rows(values_only=True))  # type: ignore
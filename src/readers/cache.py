@@ -0,0 +1,207 @@
+"""
+Кэш прочитанных моделей листов, ключом которого является хэш содержимого листа.
+"""
+import hashlib
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from pydantic import BaseModel
+
+from logger import get_logger
+from readers.base import BaseReader, RowError
+from readers.xlsx import XlsxWorkbook
+from settings import CACHE_MAX_SIZE, CACHE_PATH
+
+logger = get_logger(__name__)
+
+# версия формата записей кэша (изменение версии делает недействительными все записи)
+CACHE_VERSION = 3
+
+# индексы общих строк в ячейках строкового типа (`<c r="A1" t="s"><v>0</v></c>`)
+SHARED_STRING_RE = re.compile(rb'\bt="s"[^>]*>\s*<(?:\w+:)?v>(\d+)<')
+
+
+class SheetCache:
+    """
+    Постоянный кэш прочитанных и проверенных моделей листов.
+
+    Ключ записи – хэш XML-части листа, используемых листом общих строк и форматов дат,
+    а также описания читателя и модели. Если лист не изменился с прошлого запуска,
+    модели и ошибки строк загружаются с диска без разбора листа и проверки моделей.
+    Модели, созданные без проверки (доверенные данные), в кэш не записываются.
+    """
+
+    def __init__(self, directory: str = CACHE_PATH, max_size: int = CACHE_MAX_SIZE) -> None:
+        """
+        Конструктор.
+
+        :param directory: Путь к директории кэша.
+        :param max_size: Максимальный размер кэша в байтах (при превышении удаляются давно использованные записи).
+        """
+
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def __getstate__(self) -> dict[str, Any]:
+        # счетчики дочернего процесса считаются заново и передаются основному процессу
+        return {**self.__dict__, "hits": 0, "misses": 0}
+
+    def read(
+        self,
+        workbook: XlsxWorkbook,
+        reader: type[BaseReader],
+        load: Callable[[], BaseReader],
+        errors: list[RowError],
+    ) -> Iterator[BaseModel]:
+        """
+        Чтение моделей листа из кэша или из исходного файла с сохранением в кэш.
+
+        :param workbook: Рабочая книга для вычисления хэша содержимого листа.
+        :param reader: Класс читателя листа.
+        :param load: Функция получения читателя листа исходного файла (вызывается при промахе).
+        :param errors: Список, в который добавляются ошибки строк листа.
+        :return: Генератор моделей листа.
+        """
+
+        path = self.directory / f"{self.key(workbook, reader)}.pickle"
+        if path.exists():
+            self.hits += 1
+            logger.info("Кэш листов: модели %s загружены из кэша.", reader.__name__)
+            # отметка использования записи для вытеснения давно использованных записей
+            os.utime(path)
+            with path.open("rb") as file:
+                models, sheet_errors = pickle.load(file)
+            errors.extend(sheet_errors)
+            yield from models
+            return
+
+        self.misses += 1
+        sheet_reader = load()
+        models = []
+        for model in sheet_reader.read():
+            models.append(model)
+            yield model
+
+        errors.extend(sheet_reader.errors)
+        if not sheet_reader.trusted:
+            self.write(path, models, sheet_reader.errors)
+
+    def write(self, path: Path, models: list[BaseModel], errors: list[RowError]) -> None:
+        """
+        Сохранение моделей и ошибок строк листа в кэш.
+
+        :param path: Путь к записи кэша.
+        :param models: Модели листа.
+        :param errors: Ошибки строк листа.
+        """
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # запись во временный файл, чтобы прерванная запись не оставила поврежденную запись кэша
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        with temporary.open("wb") as file:
+            pickle.dump((models, errors), file, protocol=pickle.HIGHEST_PROTOCOL)
+        temporary.replace(path)
+
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Вытеснение давно использованных записей при превышении размера кэша.
+        """
+
+        entries = sorted(
+            (entry.stat().st_mtime, entry.stat().st_size, entry) for entry in self.directory.glob("*.pickle")
+        )
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry in entries:
+            if size <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            size -= entry_size
+            logger.info("Кэш листов: запись %s вытеснена.", entry.name)
+
+    def clear(self) -> None:
+        """
+        Удаление всех записей кэша.
+        """
+
+        for entry in self.directory.glob("*.pickle"):
+            entry.unlink(missing_ok=True)
+
+        logger.info("Кэш листов очищен.")
+
+    @property
+    def ratio(self) -> float:
+        """
+        Получение доли попаданий в кэш.
+
+        :return: Доля попаданий (0, если обращений не было).
+        """
+
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def log_stats(self) -> None:
+        """
+        Запись в лог количества попаданий и промахов кэша.
+        """
+
+        logger.info(
+            "Кэш листов: попаданий %s, промахов %s, доля попаданий %.1f%%.", self.hits, self.misses, self.ratio * 100
+        )
+
+    @staticmethod
+    def key(workbook: XlsxWorkbook, reader: type[BaseReader]) -> str:
+        """
+        Вычисление ключа записи кэша для листа.
+
+        XML-часть листа читается потоково, индексы общих строк собираются по границам закрывающих тегов,
+        чтобы совпадение не разрывалось между фрагментами.
+
+        :param workbook: Рабочая книга.
+        :param reader: Класс читателя листа.
+        :return: Ключ записи кэша.
+        """
+
+        spec = reader()
+        digest = hashlib.sha256()
+        digest.update(
+            repr(
+                (
+                    CACHE_VERSION,
+                    reader.__module__,
+                    reader.__qualname__,
+                    spec.model.schema_json(),
+                    spec.attributes,
+                    spec.headers,
+                    sorted(spec.interned),
+                    workbook.epoch,
+                    sorted(workbook.date_styles),
+                    sorted(workbook.timedelta_styles),
+                )
+            ).encode()
+        )
+
+        indexes: set[int] = set()
+        buffer = b""
+        with workbook.archive.open(workbook.parts[spec.sheet]) as source:
+            for chunk in iter(lambda: source.read(1 << 16), b""):
+                digest.update(chunk)
+                buffer += chunk
+                boundary = buffer.rfind(b"</") + 1
+                indexes.update(int(index) for index in SHARED_STRING_RE.findall(buffer, 0, boundary))
+                buffer = buffer[boundary:]
+            indexes.update(int(index) for index in SHARED_STRING_RE.findall(buffer))
+
+        # значения используемых листом общих строк (индексы общих строк меняются при правке других листов)
+        strings = workbook.shared_strings
+        for index in sorted(indexes):
+            digest.update(b"\0")
+            digest.update(strings[index].encode() if index < len(strings) else b"")
+
+        return digest.hexdigest()
@@ -0,0 +1,176 @@
+"""
+Чтение исходных данных из файлов с разделителями (CSV/TSV).
+"""
+import csv
+from itertools import chain
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from pydantic import BaseModel
+
+from logger import get_logger
+from readers.base import BaseReader, BaseSourcesReader, RowDecoder, RowError
+from readers.reader import SourcesReader
+
+logger = get_logger(__name__)
+
+# разделители значений по расширениям файлов
+DELIMITERS = {
+    ".csv": ",",
+    ".tsv": "\t",
+}
+
+# заголовок столбца с типом источника в общем файле для всех типов источников
+# (как ключ `JsonLinesReader.TYPE_KEY`: `type` – атрибут модели нормативного акта)
+TYPE_COLUMN = "model"
+
+
+class DelimitedReader(BaseSourcesReader):
+    """
+    Чтение из файлов с разделителями (CSV/TSV).
+
+    Поддерживаются два способа представления данных:
+
+    - отдельный файл для каждого типа источника (файл или директория с файлами), тип определяется
+      по имени файла – наименованию листа шаблона или модели (например, `Книга.csv`, `BookModel.tsv`, `book.csv`);
+    - общий файл со столбцом `model`, содержащим тип источника в каждой строке.
+
+    Столбцы определяются так же, как на листах шаблона: по заголовкам читателей или по индексам
+    из метода `attributes()` (в общем файле – без учета столбца `model`).
+    Файл, имя которого совпадает с типом источника, всегда читается как файл одного типа.
+    """
+
+    # зарегистрированные читатели
+    readers: list[type[BaseReader]] = SourcesReader.readers
+
+    def __init__(
+        self,
+        path: str,
+        readers: Optional[Iterable[type[BaseReader] | type[BaseModel]]] = None,
+        trusted: bool = False,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу или директории с файлами для чтения.
+        :param readers: Читатели или модели для чтения только части типов источников.
+        :param trusted: Доверенные данные (ранее прошедшие проверку): модели создаются без проверки.
+        """
+
+        self.path = Path(path)
+        self.trusted = trusted
+        if readers is not None:
+            self.readers = SourcesReader.select(readers)
+
+        # ошибки строк всех прочитанных файлов
+        self.errors: list[RowError] = []
+
+    @staticmethod
+    def supports(path: str) -> bool:
+        """
+        Проверка возможности чтения файла или директории.
+
+        :param path: Путь к файлу или директории.
+        :return: Признак файла с разделителями или директории.
+        """
+
+        return Path(path).is_dir() or Path(path).suffix.lower() in DELIMITERS
+
+    def match(self, name: str) -> Optional[type[BaseReader]]:
+        """
+        Поиск читателя по наименованию типа источника.
+
+        :param name: Наименование листа шаблона или модели.
+        :return: Читатель или `None`, если тип не найден.
+        """
+
+        name = name.strip().lower()
+        for reader in self.readers:
+            spec = reader()
+            model = spec.model.__name__.lower()
+            if name in {spec.sheet.strip().lower(), model, model.removesuffix("model")}:
+                return reader
+
+        return None
+
+    def read(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение файлов с разделителями.
+
+        Строки обрабатываются по одной, строки с ошибками пропускаются и сохраняются в `errors`.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        if self.path.is_dir():
+            paths = sorted(path for path in self.path.iterdir() if path.suffix.lower() in DELIMITERS)
+        else:
+            paths = [self.path]
+
+        for path in paths:
+            logger.info("Чтение %s ...", path)
+            with path.open(newline="", encoding="utf-8-sig") as file:
+                rows = self.iter_rows(csv.reader(file, delimiter=DELIMITERS[path.suffix.lower()]))
+                header = next(rows, None)
+                reader = self.match(path.stem)
+                if reader is None and header and TYPE_COLUMN in header:
+                    yield from self.read_mixed(path.name, header, rows)
+                    continue
+
+                if reader is None:
+                    logger.warning("Файл %s пропущен: не найден тип источника.", path.name)
+                    continue
+
+                sheet_reader = reader(trusted=self.trusted)
+                yield from sheet_reader.read_rows(chain([header], rows) if header else ())
+                self.errors.extend(sheet_reader.errors)
+
+        if self.errors:
+            logger.warning("Найдено строк с ошибками: %s.", len(self.errors))
+
+    def read_mixed(self, name: str, header: tuple[Any, ...], rows: Iterator[tuple[Any, ...]]) -> Iterator[BaseModel]:
+        """
+        Чтение общего файла со столбцом типа источника.
+
+        :param name: Имя файла (для сообщений об ошибках).
+        :param header: Строка заголовка.
+        :param rows: Строки данных.
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        position = header.index(TYPE_COLUMN)
+        # читатели и функции декодирования по значениям столбца типа источника
+        decoders: dict[str, tuple[BaseReader, RowDecoder]] = {}
+
+        for number, row in enumerate(rows, start=2):
+            source_type = row[position] if len(row) > position else None
+            values = row[:position] + row[position + 1 :]
+            if not source_type or not values or not values[0]:
+                continue
+
+            if source_type not in decoders:
+                reader = self.match(source_type)
+                if reader is None:
+                    self.errors.append(RowError(sheet=name, row=number, error=f"Неизвестный тип: {source_type}"))
+                    continue
+                sheet_reader = reader(trusted=self.trusted)
+                # ошибки всех типов источников сохраняются в порядке строк файла
+                sheet_reader.errors = self.errors
+                decoders[source_type] = sheet_reader, sheet_reader.compile_decoder()
+
+            sheet_reader, decode = decoders[source_type]
+            model = sheet_reader.create_model(decode, number, values)
+            if model is not None:
+                yield model
+
+    @staticmethod
+    def iter_rows(rows: Iterable[list[str]]) -> Iterator[tuple[Any, ...]]:
+        """
+        Преобразование строк файла: пустые значения заменяются на `None`, как у пустых ячеек листа.
+
+        :param rows: Строки файла.
+        :return: Генератор строк.
+        """
+
+        for row in rows:
+            yield tuple(value or None for value in row)
@@ -0,0 +1,158 @@
+"""
+Чтение и запись моделей в формате JSON Lines (NDJSON).
+"""
+import json
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TextIO
+
+from pydantic import BaseModel
+
+from logger import get_logger
+from readers.base import BaseModelsWriter, BaseReader, BaseSourcesReader, RowError
+from readers.reader import SourcesReader
+
+logger = get_logger(__name__)
+
+# расширения файлов JSON Lines
+EXTENSIONS = {".jsonl", ".ndjson"}
+
+# ключ с наименованием модели в объекте строки (`type` является атрибутом модели нормативного акта)
+TYPE_KEY = "model"
+
+# наименования моделей всех зарегистрированных читателей
+REGISTERED_MODELS = {reader().model.__name__ for reader in SourcesReader.readers}
+
+
+class JsonLinesReader(BaseSourcesReader):
+    """
+    Потоковое чтение моделей из файла JSON Lines.
+
+    Каждая строка файла содержит один объект с наименованием модели в ключе `model`:
+
+    .. code-block::
+
+        {"model": "BookModel", "authors": "Иванов И.М., Петров С.Н.", "title": "Наука как искусство", ...}
+
+    Файл читается построчно, поэтому потребление памяти не зависит от размера файла.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        readers: Optional[Iterable[type[BaseReader] | type[BaseModel]]] = None,
+        trusted: bool = False,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу для чтения.
+        :param readers: Читатели или модели для чтения только части типов источников.
+        :param trusted: Доверенные данные (ранее прошедшие проверку): модели создаются без проверки.
+        """
+
+        self.path = Path(path)
+        self.trusted = trusted
+        # модели по наименованиям
+        selected = SourcesReader.readers if readers is None else SourcesReader.select(readers)
+        self.models: dict[str, type[BaseModel]] = {reader().model.__name__: reader().model for reader in selected}
+        # ошибки строк файла
+        self.errors: list[RowError] = []
+
+    @staticmethod
+    def supports(path: str) -> bool:
+        """
+        Проверка возможности чтения файла.
+
+        :param path: Путь к файлу.
+        :return: Признак файла JSON Lines.
+        """
+
+        return Path(path).suffix.lower() in EXTENSIONS
+
+    def read(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение моделей.
+
+        Строки с ошибками пропускаются и сохраняются в `errors`, строки моделей,
+        не выбранных для чтения, пропускаются.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        logger.info("Чтение %s ...", self.path)
+        with self.path.open(encoding="utf-8") as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    attrs = json.loads(line)
+                except ValueError as ex:
+                    self.add_error(number, f"Некорректный JSON: {ex}")
+                    continue
+
+                name = attrs.pop(TYPE_KEY, None) if isinstance(attrs, dict) else None
+                if not isinstance(name, str) or name not in REGISTERED_MODELS:
+                    self.add_error(number, f"Неизвестная модель: {name}")
+                    continue
+                if name not in self.models:
+                    continue
+
+                try:
+                    model = self.models[name].construct(**attrs) if self.trusted else self.models[name](**attrs)
+                except (ValueError, TypeError) as ex:
+                    # `ValidationError` также является `ValueError`
+                    self.add_error(number, str(ex))
+                    continue
+
+                yield model
+
+        if self.errors:
+            logger.warning("Найдено строк с ошибками: %s.", len(self.errors))
+
+    def add_error(self, number: int, message: str) -> None:
+        """
+        Сохранение ошибки строки файла.
+
+        :param number: Номер строки.
+        :param message: Сообщение об ошибке.
+        """
+
+        error = RowError(sheet=self.path.name, row=number, error=message)
+        logger.warning("%s", error)
+        self.errors.append(error)
+
+
+class JsonLinesWriter(BaseModelsWriter):
+    """
+    Потоковая запись моделей в файл JSON Lines.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу для записи.
+        """
+
+        super().__init__(path)
+        self._file: Optional[TextIO] = None
+
+    def open(self) -> None:
+        self._file = self.path.open("w", encoding="utf-8")
+
+    def close(self, completed: bool = True) -> bool:
+        # строки записываются независимо, поэтому записанные до ошибки модели сохраняются
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+        return True
+
+    def write(self, model: BaseModel) -> None:
+        if self._file is None:
+            raise RuntimeError("Файл для записи не открыт")
+
+        self._file.write(json.dumps({TYPE_KEY: model.__class__.__name__, **model.dict()}, ensure_ascii=False))
+        self._file.write("\n")
+        self.count += 1
@@ -1,11 +1,16 @@
 """
 Чтение исходного файла.
 """
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
-from typing import Type
+from enum import Enum, unique
+from functools import partial
+from itertools import repeat
+from typing import Any, Iterable, Iterator, Optional, Type
 
 import openpyxl
 from openpyxl.workbook import Workbook
+from pydantic import BaseModel
 
 from formatters.models import (
     BookModel,
@@ -14,8 +19,10 @@ from formatters.models import (
     RegulationActModel,
     ThesisModel,
 )
-from logger import get_logger
-from readers.base import BaseReader
+from logger import get_logger, pool_options
+from readers.base import BaseReader, BaseSourcesReader, RowError
+from readers.cache import SheetCache
+from readers.xlsx import XlsxWorkbook
 
 
 logger = get_logger(__name__)
@@ -46,6 +53,22 @@ class BookReader(BaseReader):
             "pages": {6: int},
         }
 
+    @property
+    def interned(self) -> frozenset[str]:
+        return frozenset({"city", "publishing_house"})
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "authors": "Фамилии и инициалы авторов",
+            "title": "Название книги",
+            "edition": "Номер издания",
+            "city": "Город издательства",
+            "publishing_house": "Название издательства",
+            "year": "Год издания",
+            "pages": "Количество страниц",
+        }
+
 
 class InternetResourceReader(BaseReader):
     """
@@ -69,6 +92,19 @@ class InternetResourceReader(BaseReader):
             "access_date": {3: date},
         }
 
+    @property
+    def interned(self) -> frozenset[str]:
+        return frozenset({"website"})
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "article": "Заголовок статьи или страницы",
+            "website": "Название сайта",
+            "link": "Гиперссылка",
+            "access_date": "Дата обращения на сайт",
+        }
+
 
 class ArticlesCollectionReader(BaseReader):
     """
@@ -94,6 +130,24 @@ class ArticlesCollectionReader(BaseReader):
             "year": {5: int},
             "pages": {6: str},
         }
+
+    @property
+    def interned(self) -> frozenset[str]:
+        return frozenset({"city", "publishing_house"})
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "authors": "Фамилии и инициалы авторов",
+            "article_title": "Название статьи",
+            "collection_title": "Название сборника",
+            "city": "Город издательства",
+            "publishing_house": "Название издательства",
+            "year": "Год издания",
+            "pages": "Страницы статьи в сборнике",
+        }
+
+
 class RegulationActReader(BaseReader):
     """
     Чтение модели нормативного акта.
@@ -121,7 +175,25 @@ class RegulationActReader(BaseReader):
             "publication_year": {5: int},
             "version": {6: int},
             "article_number": {7: int},
-            "edition": {8: date}
+            "edition": {8: date},
+        }
+
+    @property
+    def interned(self) -> frozenset[str]:
+        return frozenset({"type", "official_source"})
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "type": "Тип нормативного актa",
+            "title": "Полное название нормативного акта",
+            "accept_date": "Дата принятия",
+            "number": "Номер нормативного акта",
+            "official_source": "Официальный источник опубликования",
+            "publication_year": "Год публикации источника",
+            "version": "Номер выхода источника",
+            "article_number": "Номер статьи",
+            "edition": "В редакции от",
         }
 
 
@@ -151,41 +223,244 @@ class ThesisReader(BaseReader):
             "pages": {7: int},
         }
 
+    @property
+    def interned(self) -> frozenset[str]:
+        return frozenset({"degree", "field", "field_code", "city"})
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {
+            "author": "Фамилия и инициалы автора",
+            "title": "Название диссертации",
+            "degree": "Доктора или кандидата",
+            "field": "Отрасль наук (сокращённо)",
+            "field_code": "Код специальности",
+            "city": "Город издательства",
+            "year": "Год",
+            "pages": "Количество страниц",
+        }
+
 
-class SourcesReader:
+@unique
+class EngineEnum(str, Enum):
+    """
+    Поддерживаемые способы чтения рабочей книги.
+    """
+
+    OPENPYXL = "openpyxl"  # рабочая книга openpyxl
+    XML = "xml"  # потоковый разбор XML-частей листов без openpyxl
+
+
+class SourcesReader(BaseSourcesReader):
     """
     Чтение из источника данных.
     """
 
     # зарегистрированные читатели
-    readers: list[type[BaseReader]]  = [
+    readers: list[type[BaseReader]] = [
         BookReader,
         InternetResourceReader,
         ArticlesCollectionReader,
         RegulationActReader,
-        ThesisReader
+        ThesisReader,
     ]
 
-    def __init__(self, path: str) -> None:
+    def __init__(
+        self,
+        path: str,
+        read_only: bool = False,
+        workers: int = 1,
+        engine: str = EngineEnum.OPENPYXL,
+        readers: Optional[Iterable[type[BaseReader] | type[BaseModel]]] = None,
+        cache: Optional[SheetCache] = None,
+        trusted: bool = False,
+    ) -> None:
         """
         Конструктор.
 
+        Рабочая книга открывается только при первом обращении к ней.
+
         :param path: Путь к исходному файлу для чтения.
+        :param read_only: Потоковый режим чтения (только для чтения, без загрузки всех ячеек в память).
+        :param workers: Количество процессов для параллельного чтения листов (1 – последовательное чтение).
+        :param engine: Способ чтения рабочей книги (XML-части листов всегда читаются потоково).
+        :param readers: Читатели или модели для чтения только части листов (по умолчанию – все зарегистрированные).
+        :param cache: Кэш прочитанных моделей листов.
+        :param trusted: Доверенные данные (ранее прошедшие проверку): модели создаются без проверки.
+        """
+
+        self.path = path
+        self.read_only = read_only
+        self.workers = workers
+        self.engine = engine
+        self.cache = cache
+        self.trusted = trusted
+        # ошибки строк всех прочитанных листов
+        self.errors: list[RowError] = []
+        if readers is not None:
+            self.readers = self.select(readers)
+
+        self._workbook: Optional[Workbook | XlsxWorkbook] = None
+
+    @classmethod
+    def select(cls, types: Iterable[type[BaseReader] | type[BaseModel]]) -> list[type[BaseReader]]:
+        """
+        Выбор зарегистрированных читателей по классам читателей или моделей.
+
+        :param types: Классы читателей или моделей.
+        :return: Читатели в порядке регистрации.
+        """
+
+        wanted = set(types)
+        selected = [reader for reader in cls.readers if reader in wanted or reader().model in wanted]
+        if not selected:
+            raise ValueError(f"Не найдены читатели для типов: {wanted}")
+
+        return selected
+
+    @property
+    def workbook(self) -> Workbook | XlsxWorkbook:
+        """
+        Получение рабочей книги (открывается при первом обращении).
+
+        В режиме только для чтения и при разборе XML-частей листов лист разбирается только тогда,
+        когда его запрашивает читатель. При полной загрузке openpyxl разбирает все листы при открытии.
+
+        :return: Рабочая книга.
+        """
+
+        if self._workbook is None:
+            logger.info("Загрузка рабочей книги ...")
+            match self.engine:
+                case EngineEnum.OPENPYXL:
+                    self._workbook = openpyxl.load_workbook(self.path, read_only=self.read_only)
+                case EngineEnum.XML:
+                    self._workbook = XlsxWorkbook(self.path)
+                case other:
+                    raise ValueError(f"Неверный способ чтения рабочей книги: {other}")
+
+        return self._workbook
+
+    @property
+    def options(self) -> dict[str, Any]:
+        """
+        Получение параметров чтения для открытия того же файла в дочернем процессе.
+
+        :return: Именованные аргументы конструктора.
+        """
+
+        return {"read_only": self.read_only, "engine": self.engine, "cache": self.cache, "trusted": self.trusted}
+
+    def close(self) -> None:
+        """
+        Закрытие исходного файла.
+
+        В потоковом режиме рабочая книга держит файл открытым до завершения чтения.
+        """
+
+        if self._workbook is not None:
+            self._workbook.close()
+            self._workbook = None
+
+    def read(self) -> Iterator[BaseModel]:
+        """
+        Потоковое чтение исходного файла.
+
+        Строки с ошибками пропускаются, чтение продолжается. После завершения чтения
+        ошибки всех листов доступны в `errors`.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        if self.workers > 1:
+            yield from self.read_parallel()
+        else:
+            yield from self.read_sheets()
+
+        if self.cache is not None:
+            # при параллельном чтении учитываются обращения к кэшу во всех дочерних процессах
+            self.cache.log_stats()
+        if self.errors:
+            logger.warning("Найдено строк с ошибками: %s.", len(self.errors))
+
+    def read_sheets(self) -> Iterator[BaseModel]:
+        """
+        Последовательное чтение листов исходного файла (с загрузкой неизмененных листов из кэша).
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        if self.cache is None:
+            for reader in self.readers:
+                logger.info("Чтение %s ...", reader)
+                yield from self.read_sheet(reader)
+            return
+
+        # рабочая книга открывается только при промахе кэша
+        with XlsxWorkbook(self.path) as workbook:
+            for reader in self.readers:
+                logger.info("Чтение %s ...", reader)
+                yield from self.cache.read(workbook, reader, partial(self.sheet_reader, reader), self.errors)
+
+    def sheet_reader(self, reader: type[BaseReader]) -> BaseReader:
         """
+        Получение читателя листа исходного файла.
 
-        logger.info("Загрузка рабочей книги ...")
-        self.workbook: Workbook = openpyxl.load_workbook(path)
+        :param reader: Класс читателя листа.
+        :return: Читатель листа.
+        """
+
+        return reader(self.workbook, trusted=self.trusted)
 
-    def read(self) -> list:
+    def read_sheet(self, reader: type[BaseReader]) -> Iterator[BaseModel]:
         """
-        Чтение исходного файла.
+        Чтение моделей одного листа исходного файла.
 
-        :return: Список прочитанных моделей (строк).
+        :param reader: Класс читателя листа.
+        :return: Генератор прочитанных моделей (строк).
         """
 
-        items = []
-        for reader in self.readers:
-            logger.info("Чтение %s ...", reader)
-            items.extend(reader(self.workbook).read())  # type: ignore
+        sheet_reader = self.sheet_reader(reader)
+        yield from sheet_reader.read()
+        self.errors.extend(sheet_reader.errors)
+
+    def read_parallel(self) -> Iterator[BaseModel]:
+        """
+        Параллельное чтение листов исходного файла.
+
+        Каждый лист читается в отдельном процессе, результаты объединяются в порядке зарегистрированных читателей.
+
+        :return: Генератор прочитанных моделей (строк).
+        """
+
+        workers = min(self.workers, len(self.readers))
+        logger.info("Параллельное чтение листов (процессов: %s) ...", workers)
+
+        with ProcessPoolExecutor(max_workers=workers, **pool_options()) as executor:
+            for models, errors, hits, misses in executor.map(
+                read_sheet_worker, repeat(self.path), self.readers, repeat(self.options)
+            ):
+                yield from models
+                self.errors.extend(errors)
+                if self.cache is not None:
+                    self.cache.hits += hits
+                    self.cache.misses += misses
+
+
+def read_sheet_worker(
+    path: str, reader: type[BaseReader], options: dict[str, Any]
+) -> tuple[list[BaseModel], list[RowError], int, int]:
+    """
+    Чтение одного листа исходного файла (выполняется в дочернем процессе при параллельном чтении).
+
+    :param path: Путь к исходному файлу для чтения.
+    :param reader: Класс читателя листа.
+    :param options: Параметры чтения рабочей книги.
+    :return: Список прочитанных моделей (строк), список ошибок строк, количество попаданий и промахов кэша
+        (статистика кэша записывается в лог основным процессом).
+    """
 
-        return items
+    with SourcesReader(path, readers=[reader], **options) as sources:
+        models = list(sources.read_sheets())
+        cache = sources.cache
+        return models, sources.errors, cache.hits if cache else 0, cache.misses if cache else 0
@@ -0,0 +1,283 @@
+"""
+Компактный двоичный снимок проверенных моделей с произвольным доступом через `mmap`.
+
+Структура файла:
+
+.. code-block::
+
+    MAGIC
+    записи:  тег типа (1 байт), длина данных (4 байта), данные – JSON-массив значений атрибутов модели
+    таблица типов: JSON-массив пар [наименование модели, [наименования атрибутов]], индекс тега – номер пары
+    индекс:  смещения записей (8 байт на запись), затем теги типов записей (1 байт на запись)
+    окончание: смещение таблицы типов, смещение индекса, количество записей (по 8 байт), MAGIC
+
+Числа записываются в порядке байтов little-endian.
+"""
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional
+
+from pydantic import BaseModel
+
+from logger import get_logger
+from readers.base import BaseModelsWriter, BaseReader, BaseSourcesReader, RowError
+from readers.reader import SourcesReader
+
+logger = get_logger(__name__)
+
+# расширение файлов снимков
+EXTENSION = ".snapshot"
+
+MAGIC = b"BIBSNAP1"
+# заголовок записи: тег типа и длина данных
+RECORD = struct.Struct("<BI")
+# окончание файла: смещение таблицы типов, смещение индекса, количество записей и MAGIC
+TRAILER = struct.Struct(f"<QQQ{len(MAGIC)}s")
+
+
+class SnapshotWriter(BaseModelsWriter):
+    """
+    Потоковая запись моделей в снимок.
+
+    Записи пишутся по мере поступления моделей, в памяти хранятся только смещения и теги записей.
+    Снимок записывается во временный файл в той же директории и заменяет файл по пути только
+    после записи окончания, поэтому прерванная запись не повреждает ранее созданный снимок.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу для записи.
+        """
+
+        super().__init__(path)
+        self._file: Optional[IO[bytes]] = None
+        self._temporary: Optional[Path] = None
+        self._offset = 0
+        self._offsets = array("Q")
+        self._tags = bytearray()
+        # теги типов и наименования атрибутов по классам моделей
+        self._types: dict[type[BaseModel], tuple[int, tuple[str, ...]]] = {}
+
+    def open(self) -> None:
+        self._temporary = self.path.with_name(f".{self.path.name}.tmp")
+        self._file = self._temporary.open("wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+
+    def close(self, completed: bool = True) -> bool:
+        if self._file is None:
+            return False
+
+        assert self._temporary is not None
+
+        written = False
+        try:
+            if completed:
+                self._write_footer()
+                written = True
+        finally:
+            self._file.close()
+            self._file = None
+            if written:
+                os.replace(self._temporary, self.path)
+            else:
+                self._temporary.unlink(missing_ok=True)
+            self._temporary = None
+
+        if not written:
+            logger.warning("Запись снимка %s прервана, файл не изменен.", self.path)
+
+        return written
+
+    def write(self, model: BaseModel) -> None:
+        """
+        Запись модели в снимок.
+
+        :param model: Модель.
+        """
+
+        if self._file is None:
+            raise RuntimeError("Файл для записи не открыт")
+
+        model_type = model.__class__
+        if model_type not in self._types:
+            self._types[model_type] = len(self._types), tuple(model_type.__fields__)
+        tag, fields = self._types[model_type]
+
+        values = model.__dict__
+        payload = json.dumps([values[field] for field in fields], ensure_ascii=False, separators=(",", ":")).encode()
+        self._file.write(RECORD.pack(tag, len(payload)))
+        self._file.write(payload)
+
+        self._offsets.append(self._offset)
+        self._tags.append(tag)
+        self._offset += RECORD.size + len(payload)
+        self.count += 1
+
+    def _write_footer(self) -> None:
+        """
+        Запись таблицы типов, индекса и окончания файла.
+        """
+
+        assert self._file is not None
+
+        table = json.dumps([[model.__name__, fields] for model, (_, fields) in self._types.items()]).encode()
+        table_offset = self._offset
+        index_offset = table_offset + len(table)
+
+        if sys.byteorder == "big":
+            self._offsets.byteswap()
+
+        self._file.write(table)
+        self._file.write(self._offsets.tobytes())
+        self._file.write(self._tags)
+        self._file.write(TRAILER.pack(table_offset, index_offset, self.count, MAGIC))
+
+
+class SnapshotReader(BaseSourcesReader):
+    """
+    Чтение моделей из снимка с произвольным доступом.
+
+    Файл отображается в память, поэтому открытие снимка не зависит от его размера:
+    данные записи декодируются только при обращении к ней, а выбор записей по типам
+    выполняется по индексу тегов без чтения самих записей.
+    Снимок содержит проверенные модели, поэтому модели создаются без повторной проверки.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        readers: Optional[Iterable[type[BaseReader] | type[BaseModel]]] = None,
+    ) -> None:
+        """
+        Конструктор.
+
+        :param path: Путь к файлу снимка.
+        :param readers: Читатели или модели для чтения только части типов источников.
+        """
+
+        self.path = Path(path)
+        self.selected = SourcesReader.readers if readers is None else SourcesReader.select(readers)
+        # ошибки строк (снимок содержит только проверенные модели, список нужен для совместимости с `SourcesReader`)
+        self.errors: list[RowError] = []
+
+        self._file: Optional[IO[bytes]] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._offsets: Optional[memoryview | array] = None
+        self._tags = b""
+        self._types: list[tuple[type[BaseModel], tuple[str, ...]]] = []
+
+    @staticmethod
+    def supports(path: str) -> bool:
+        """
+        Проверка возможности чтения файла.
+
+        :param path: Путь к файлу.
+        :return: Признак файла снимка.
+        """
+
+        return Path(path).suffix.lower() == EXTENSION
+
+    def open(self) -> None:
+        """
+        Отображение файла снимка в память и чтение таблицы типов и индекса.
+        """
+
+        if self._mmap is not None:
+            return
+
+        self._file = self.path.open("rb")
+        self._mmap = buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(buffer) < len(MAGIC) + TRAILER.size or buffer[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"Файл {self.path} не является снимком моделей")
+
+        table_offset, index_offset, count, magic = TRAILER.unpack_from(buffer, len(buffer) - TRAILER.size)
+        # файл прерванной записи не содержит окончания
+        if magic != MAGIC or index_offset + count * 9 + TRAILER.size != len(buffer) or table_offset > index_offset:
+            self.close()
+            raise ValueError(f"Файл {self.path} не является снимком моделей")
+
+        models = {reader().model.__name__: reader().model for reader in SourcesReader.readers}
+        for name, fields in json.loads(buffer[table_offset:index_offset]):
+            model = models.get(name)
+            if model is None or tuple(model.__fields__) != tuple(fields):
+                self.close()
+                raise ValueError(f"Снимок {self.path} создан для другой схемы модели {name}")
+            self._types.append((model, tuple(fields)))
+
+        tags_offset = index_offset + count * 8
+        if sys.byteorder == "big":
+            self._offsets = array("Q", buffer[index_offset:tags_offset])
+            self._offsets.byteswap()
+        else:
+            self._offsets = memoryview(buffer)[index_offset:tags_offset].cast("Q")
+        self._tags = buffer[tags_offset : tags_offset + count]
+
+    def close(self) -> None:
+        """
+        Закрытие файла снимка.
+        """
+
+        if isinstance(self._offsets, memoryview):
+            # отображение нельзя закрыть, пока на него ссылается представление индекса
+            self._offsets.release()
+        self._offsets = None
+        self._types = []
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        self.open()
+        return len(self._tags)
+
+    def __getitem__(self, index: int) -> BaseModel:
+        """
+        Получение модели по номеру записи.
+
+        :param index: Номер записи.
+        :return: Модель.
+        """
+
+        self.open()
+        assert self._mmap is not None and self._offsets is not None
+
+        offset = self._offsets[index]
+        tag, length = RECORD.unpack_from(self._mmap, offset)
+        start = offset + RECORD.size
+        model, fields = self._types[tag]
+
+        return model.construct(**dict(zip(fields, json.loads(self._mmap[start : start + length]))))
+
+    def read(self) -> Iterator[BaseModel]:
+        """
+        Чтение моделей выбранных типов в порядке записи.
+
+        :return: Генератор моделей.
+        """
+
+        self.open()
+        logger.info("Чтение %s ...", self.path)
+
+        selected = {reader().model for reader in self.selected}
+        tags = {tag for tag, (model, _) in enumerate(self._types) if model in selected}
+        if len(tags) == len(self._types):
+            for index in range(len(self._tags)):
+                yield self[index]
+            return
+
+        for index, tag in enumerate(self._tags):
+            if tag in tags:
+                yield self[index]
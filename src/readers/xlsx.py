@@ -0,0 +1,404 @@
+"""
+Потоковое чтение листов xlsx напрямую из XML-частей пакета (без openpyxl).
+
+Рабочая книга повторяет минимальный интерфейс `openpyxl` (`workbook[sheet].iter_rows(values_only=True)`),
+поэтому читатели листов работают с ней так же, как с книгой openpyxl.
+"""
+import posixpath
+import zipfile
+from functools import lru_cache
+from types import TracebackType
+from typing import IO, Any, Iterator, Optional
+from xml.etree.ElementTree import Element, iterparse, parse
+from xml.parsers import expat
+
+from openpyxl.styles.numbers import builtin_format_code, is_date_format, is_timedelta_format
+from openpyxl.utils import column_index_from_string
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+
+from logger import get_logger
+
+logger = get_logger(__name__)
+
+# пространства имен XML-частей пакета
+SHEET_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIPS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+# теги элементов листа (в формате expat с разделителем пространства имен " ")
+ROW_TAG = f"{SHEET_MAIN_NS} row"
+CELL_TAG = f"{SHEET_MAIN_NS} c"
+VALUE_TAG = f"{SHEET_MAIN_NS} v"
+FORMULA_TAG = f"{SHEET_MAIN_NS} f"
+INLINE_STRING_TAG = f"{SHEET_MAIN_NS} is"
+TEXT_TAG = f"{SHEET_MAIN_NS} t"
+PHONETIC_TAG = f"{SHEET_MAIN_NS} rPh"
+
+# теги элементов таблицы общих строк (в формате ElementTree)
+SHARED_STRING_TAG = f"{{{SHEET_MAIN_NS}}}si"
+SHARED_TEXT_TAG = f"{{{SHEET_MAIN_NS}}}t"
+SHARED_RICH_TEXT_TAG = f"{{{SHEET_MAIN_NS}}}r/{{{SHEET_MAIN_NS}}}t"
+
+# пути служебных частей пакета
+WORKBOOK_PART = "xl/workbook.xml"
+WORKBOOK_RELS_PART = "xl/_rels/workbook.xml.rels"
+SHARED_STRINGS_PART = "xl/sharedStrings.xml"
+STYLES_PART = "xl/styles.xml"
+
+
+def text_content(element: Element) -> str:
+    """
+    Получение текста общей строки без форматирования (простой текст и текст фрагментов с форматированием).
+
+    :param element: Элемент общей строки (`si`).
+    :return: Текст строки.
+    """
+
+    snippets = [element.findtext(SHARED_TEXT_TAG) or ""]
+    snippets.extend(item.text or "" for item in element.iterfind(SHARED_RICH_TEXT_TAG))
+
+    return "".join(snippets)
+
+
+@lru_cache(maxsize=None)
+def column_index(letters: str) -> int:
+    """
+    Получение индекса столбца по его буквенному обозначению (с кэшированием для повторяющихся столбцов).
+    """
+
+    return column_index_from_string(letters)
+
+
+def cast_number(value: str) -> int | float:
+    """
+    Преобразование числового значения ячейки (аналогично openpyxl).
+    """
+
+    if "." in value or "E" in value or "e" in value:
+        return float(value)
+
+    return int(value)
+
+
+def parse_rows(source: IO[bytes], workbook: "XlsxWorkbook", chunk_size: int = 1 << 16) -> Iterator[tuple[int, tuple]]:
+    """
+    Инкрементальный разбор XML-части листа (expat) с получением строк в виде кортежей значений.
+
+    Элементы дерева не создаются: значения ячеек собираются обработчиками событий парсера,
+    поэтому в памяти находится только текущий фрагмент файла. Значения ячеек получаются так же,
+    как в openpyxl для рабочей книги без `data_only`.
+
+    :param source: Файл XML-части листа.
+    :param workbook: Рабочая книга.
+    :param chunk_size: Размер читаемого за один раз фрагмента файла.
+    :return: Генератор номеров строк и кортежей значений ячеек.
+    """
+
+    shared_strings = workbook.shared_strings
+    date_styles = workbook.date_styles
+    timedelta_styles = workbook.timedelta_styles
+    epoch = workbook.epoch
+
+    rows: list[tuple[int, tuple]] = []
+    values: list[Any] = []
+    # номер строки, обозначение, тип и формат текущей ячейки
+    row_index = 0
+    reference: Optional[str] = None
+    data_type = "n"
+    style = 0
+    # собираемый текст: значение, формула, встроенная строка и буфер, в который сейчас идет текст
+    value: list[str] = []
+    formula: Optional[list[str]] = None
+    inline: Optional[list[str]] = None
+    phonetic = False
+    text: Optional[list[str]] = None
+
+    def cell_value() -> Any:
+        if formula is not None:
+            return "=" + "".join(formula)
+        if data_type == "inlineStr":
+            return "".join(inline) if inline is not None else None
+
+        raw = "".join(value) or None
+        if raw is None:
+            return None
+        if data_type == "s":
+            return shared_strings[int(raw)]
+        if data_type == "n":
+            number = cast_number(raw)
+            if style in date_styles:
+                try:
+                    return from_excel(number, epoch, timedelta=style in timedelta_styles)
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return number
+        if data_type == "b":
+            return bool(int(raw))
+        if data_type == "d":
+            return from_ISO8601(raw)
+
+        # строки формул ("str") и ошибки ("e") возвращаются как есть
+        return raw
+
+    def start(name: str, attrs: dict[str, str]) -> None:
+        nonlocal row_index, reference, data_type, style, value, formula, inline, phonetic, text
+
+        # проверки упорядочены по частоте элементов в листе
+        if name == CELL_TAG:
+            reference = attrs.get("r")
+            data_type = attrs.get("t", "n")
+            style = int(attrs.get("s") or 0)
+            value = []
+            formula = inline = None
+        elif name == VALUE_TAG:
+            text = value
+        elif name == ROW_TAG:
+            row_index = int(attrs["r"]) if "r" in attrs else row_index + 1
+            values.clear()
+        elif name == TEXT_TAG:
+            if inline is not None and not phonetic:
+                text = inline
+        elif name == FORMULA_TAG:
+            formula = text = []
+        elif name == INLINE_STRING_TAG:
+            inline = []
+        elif name == PHONETIC_TAG:
+            phonetic = True
+
+    def end(name: str) -> None:
+        nonlocal phonetic, text
+
+        if name == VALUE_TAG:
+            text = None
+        elif name == CELL_TAG:
+            if reference:
+                column = column_index(reference.rstrip("0123456789"))
+                if column > len(values) + 1:
+                    values.extend([None] * (column - len(values) - 1))
+            values.append(cell_value())
+        elif name == ROW_TAG:
+            rows.append((row_index, tuple(values)))
+        elif name in (TEXT_TAG, FORMULA_TAG):
+            text = None
+        elif name == PHONETIC_TAG:
+            phonetic = False
+
+    def data(chunk: str) -> None:
+        if text is not None:
+            text.append(chunk)
+
+    parser = expat.ParserCreate(namespace_separator=" ")
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = data
+
+    final = False
+    while not final:
+        chunk = source.read(chunk_size)
+        final = not chunk
+        parser.Parse(chunk, final)
+        yield from rows
+        rows.clear()
+
+
+class XlsxWorksheet:
+    """
+    Лист рабочей книги, строки которого читаются потоково из XML-части пакета.
+    """
+
+    # размер читаемого за один раз фрагмента XML-части листа
+    chunk_size = 1 << 16
+
+    def __init__(self, workbook: "XlsxWorkbook", part: str) -> None:
+        """
+        Конструктор.
+
+        :param workbook: Рабочая книга.
+        :param part: Путь к XML-части листа в пакете.
+        """
+
+        self.workbook = workbook
+        self.part = part
+
+    def iter_rows(self, min_row: int = 1, values_only: bool = True) -> Iterator[tuple[Any, ...]]:
+        """
+        Потоковое чтение строк листа.
+
+        Пропущенные в XML строки возвращаются пустыми кортежами, как в режиме только для чтения openpyxl.
+
+        :param min_row: Номер первой читаемой строки.
+        :param values_only: Чтение только значений ячеек (поддерживается только этот режим).
+        :return: Генератор кортежей значений ячеек.
+        """
+
+        if not values_only:
+            raise ValueError("Поддерживается только чтение значений ячеек (values_only=True).")
+
+        counter = 0
+        with self.workbook.archive.open(self.part) as source:
+            for index, row in parse_rows(source, self.workbook, self.chunk_size):
+                # пропущенные строки
+                while counter + 1 < index:
+                    counter += 1
+                    if counter >= min_row:
+                        yield ()
+
+                counter = index
+                if index >= min_row:
+                    yield row
+
+
+class XlsxWorkbook:
+    """
+    Рабочая книга xlsx, листы которой читаются потоково из XML-частей пакета.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Конструктор.
+
+        Открывается только архив и описание листов, таблица общих строк и стили читаются один раз при первом обращении.
+
+        :param path: Путь к файлу рабочей книги.
+        """
+
+        self.archive = zipfile.ZipFile(path)
+        self.parts = self.read_sheet_parts()
+        self._shared_strings: Optional[list[str]] = None
+        self._date_styles: Optional[tuple[set[int], set[int]]] = None
+
+        workbook = self.read_part(WORKBOOK_PART)
+        properties = workbook.find(f"{{{SHEET_MAIN_NS}}}workbookPr")
+        date1904 = properties is not None and properties.get("date1904") in ("1", "true")
+        self.epoch = CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+    def __enter__(self) -> "XlsxWorkbook":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __getitem__(self, name: str) -> XlsxWorksheet:
+        if name not in self.parts:
+            raise KeyError(f"Worksheet {name} does not exist.")
+
+        return XlsxWorksheet(self, self.parts[name])
+
+    @property
+    def sheetnames(self) -> list[str]:
+        """
+        Получение наименований листов рабочей книги.
+
+        :return: Наименования листов в порядке следования в книге.
+        """
+
+        return list(self.parts)
+
+    def close(self) -> None:
+        """
+        Закрытие файла рабочей книги.
+        """
+
+        self.archive.close()
+
+    def read_part(self, name: str) -> Element:
+        """
+        Чтение небольшой XML-части пакета целиком (описание книги, связи, стили).
+
+        :param name: Путь к части в пакете.
+        :return: Корневой элемент части.
+        """
+
+        with self.archive.open(name) as source:
+            return parse(source).getroot()
+
+    def read_sheet_parts(self) -> dict[str, str]:
+        """
+        Получение путей к XML-частям листов по их наименованиям.
+
+        :return: Пути к частям листов по наименованиям листов.
+        """
+
+        targets = {}
+        for relationship in self.read_part(WORKBOOK_RELS_PART).iter(f"{{{PACKAGE_RELATIONSHIPS_NS}}}Relationship"):
+            target = relationship.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(posixpath.dirname(WORKBOOK_PART), target))
+            targets[relationship.get("Id")] = target
+
+        return {
+            sheet.get("name", ""): targets[sheet.get(f"{{{RELATIONSHIPS_NS}}}id", "")]
+            for sheet in self.read_part(WORKBOOK_PART).iter(f"{{{SHEET_MAIN_NS}}}sheet")
+        }
+
+    @property
+    def shared_strings(self) -> list[str]:
+        """
+        Получение таблицы общих строк (читается один раз для всей книги).
+
+        :return: Список общих строк.
+        """
+
+        if self._shared_strings is None:
+            strings = []
+            if SHARED_STRINGS_PART in self.archive.NameToInfo:
+                with self.archive.open(SHARED_STRINGS_PART) as source:
+                    for _, element in iterparse(source):
+                        if element.tag == SHARED_STRING_TAG:
+                            strings.append(text_content(element).replace("x005F_", ""))
+                            element.clear()
+            self._shared_strings = strings
+
+        return self._shared_strings
+
+    @property
+    def date_styles(self) -> set[int]:
+        """
+        Получение индексов форматов ячеек, содержащих дату.
+        """
+
+        return self.read_date_styles()[0]
+
+    @property
+    def timedelta_styles(self) -> set[int]:
+        """
+        Получение индексов форматов ячеек, содержащих интервал времени.
+        """
+
+        return self.read_date_styles()[1]
+
+    def read_date_styles(self) -> tuple[set[int], set[int]]:
+        """
+        Определение форматов ячеек с датами и интервалами времени по таблице стилей.
+
+        :return: Индексы форматов ячеек с датами и индексы форматов ячеек с интервалами времени.
+        """
+
+        if self._date_styles is None:
+            dates: set[int] = set()
+            timedeltas: set[int] = set()
+            if STYLES_PART in self.archive.NameToInfo:
+                styles = self.read_part(STYLES_PART)
+                custom = {
+                    int(item.get("numFmtId", 0)): item.get("formatCode")
+                    for item in styles.iter(f"{{{SHEET_MAIN_NS}}}numFmt")
+                }
+                cell_formats = styles.find(f"{{{SHEET_MAIN_NS}}}cellXfs")
+                for index, cell_format in enumerate(cell_formats if cell_formats is not None else ()):
+                    number_format = int(cell_format.get("numFmtId", 0))
+                    code = custom[number_format] if number_format in custom else builtin_format_code(number_format)
+                    if is_date_format(code):
+                        dates.add(index)
+                    if is_timedelta_format(code):
+                        timedeltas.add(index)
+            self._date_styles = dates, timedeltas
+
+        return self._date_styles
@@ -3,35 +3,171 @@
 """
 from __future__ import annotations
 
+import html
+import io
+import queue
+import re
+import threading
+import zipfile
+from enum import Enum, unique
+from itertools import count, islice
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, Iterable, Iterator, Optional, Sequence
+from xml.sax.saxutils import escape
 
 from docx import Document
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.shared import Cm, Pt
 
+# часть пакета docx с текстом документа
+DOCUMENT_PART = "word/document.xml"
+# текст абзаца-образца, по которому определяется разметка абзаца источника
+ROW_MARKER = "__bibliography_row__"
+# размер буфера записи текста документа в архив
+BUFFER_SIZE = 1 << 16
+
+# количество строк в части, передаваемой генераторам файлов при записи нескольких файлов
+CHUNK_SIZE = 1024
+# количество частей в очереди каждого генератора (ограничивает потребление памяти при медленном генераторе)
+QUEUE_SIZE = 16
+
+# символы, недопустимые в XML (например, вертикальная табуляция из ячеек Excel)
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+# замена управляющих символов текста элементами разметки (как при добавлении текста через python-docx)
+RUN_BREAKS = {
+    "\t": '</w:t><w:tab/><w:t xml:space="preserve">',
+    "\n": '</w:t><w:br/><w:t xml:space="preserve">',
+    "\r": '</w:t><w:br/><w:t xml:space="preserve">',
+}
+
+
+class DocxPrototype:
+    """
+    Образец пакета docx для потоковой записи абзацев.
+
+    Образец создается через python-docx один раз: документ с заголовком, стилями и одним абзацем-образцом.
+    Текст документа (`word/document.xml`) делится на начало, разметку абзаца до и после текста и окончание,
+    остальные части пакета сжимаются в архив-образец, который копируется в выходной файл без изменений. Абзацы источников записываются
+    в архив по мере поступления строк, дерево элементов документа не создается.
+    """
+
+    def __init__(self, document: Any, style: str | None) -> None:
+        """
+        Конструктор.
+
+        :param document: Документ python-docx с заголовком и стилями.
+        :param style: Стиль абзацев источников.
+        """
+
+        document.add_paragraph(ROW_MARKER, style=style)
+        buffer = io.BytesIO()
+        document.save(buffer)
+
+        # остальные части пакета сжимаются один раз и копируются в каждый выходной файл
+        package = io.BytesIO()
+        with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(package, "w", zipfile.ZIP_DEFLATED) as archive:
+            for info in source.infolist():
+                if info.filename != DOCUMENT_PART:
+                    archive.writestr(info, source.read(info), compress_type=zipfile.ZIP_DEFLATED)
+            xml = source.read(DOCUMENT_PART).decode("utf-8")
+        self.package = package.getvalue()
+
+        marker = xml.index(ROW_MARKER)
+        start = xml.rindex("<w:p>", 0, marker)
+        end = xml.index("</w:p>", marker) + len("</w:p>")
+
+        self.head = xml[:start].encode("utf-8")
+        self.tail = xml[end:].encode("utf-8")
+        prefix, suffix = xml[start:marker], xml[marker + len(ROW_MARKER) : end]
+        # пробелы в начале и в конце строки сохраняются
+        self.paragraph_prefix = prefix.replace("<w:t>", '<w:t xml:space="preserve">')
+        self.paragraph_suffix = suffix
+
+    def paragraph(self, row: str) -> str:
+        """
+        Получение разметки абзаца источника.
+
+        :param row: Строка источника.
+        :return: Разметка абзаца.
+        """
+
+        text = escape(INVALID_XML_CHARS.sub("", row))
+        if "\t" in text or "\n" in text or "\r" in text:
+            for char, markup in RUN_BREAKS.items():
+                text = text.replace(char, markup)
+
+        return f"{self.paragraph_prefix}{text}{self.paragraph_suffix}"
+
+    def write(self, path: Path | str, rows: Iterable[str]) -> None:
+        """
+        Потоковая запись пакета docx с абзацами источников.
+
+        :param path: Путь для сохранения выходного файла.
+        :param rows: Строки источников.
+        """
+
+        Path(path).write_bytes(self.package)
+        with zipfile.ZipFile(path, "a", compression=zipfile.ZIP_DEFLATED) as archive:
+            with archive.open(DOCUMENT_PART, "w", force_zip64=True) as document:
+                document.write(self.head)
+                chunk: list[str] = []
+                size = 0
+                for row in rows:
+                    paragraph = self.paragraph(row)
+                    chunk.append(paragraph)
+                    size += len(paragraph)
+                    if size >= BUFFER_SIZE:
+                        document.write("".join(chunk).encode("utf-8"))
+                        chunk, size = [], 0
+                document.write("".join(chunk).encode("utf-8"))
+                document.write(self.tail)
+
 
 class Renderer:
     """
     Создание выходного файла – Word.
+
+    Документ с заголовком и стилями создается через python-docx, абзацы источников записываются
+    в пакет docx потоково (`DocxPrototype`), поэтому потребление памяти не зависит от количества строк.
     """
 
-    def __init__(self, rows: tuple[str, ...]):
+    # образцы пакетов docx по классам рендеринга
+    _prototypes: ClassVar[dict[type[Renderer], DocxPrototype]] = {}
+
+    def __init__(self, rows: Iterable[str]):
+        # строки читаются один раз при генерации файла, поэтому можно передать генератор
         self.rows = rows
 
     def set_style(self, document: Any) -> str | None:
         """
         Метод получения стилей для выходного файла.
+
+        :param document: Документ python-docx.
+        :return: Стиль абзацев источников (`None` – стиль по умолчанию).
         """
-        raise NotImplementedError
 
-    def render(self, path: Path | str) -> None:
+        style_normal = document.styles["Normal"]
+        style_normal.font.name = "Times New Roman"
+        style_normal.font.size = Pt(12)
+        style_normal.paragraph_format.line_spacing = 1.5
+        style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+        return "List Number"
+
+    def prototype(self) -> DocxPrototype:
         """
-        Метод генерации Word-файла со списком использованных источников.
+        Получение образца пакета docx с заголовком и стилями.
 
-        :param Path | str path: Путь для сохранения выходного файла.
+        Образец создается один раз в процессе для каждого класса рендеринга: разбор шаблона python-docx
+        и применение стилей (`set_style()`) не повторяются при генерации каждого файла.
+
+        :return: Образец пакета.
         """
 
+        prototype = self._prototypes.get(type(self))
+        if prototype is not None:
+            return prototype
+
         document = Document()
 
         # стилизация заголовка
@@ -41,33 +177,24 @@ class Renderer:
         runner.bold = True
 
         # стилизация текста
-        style_normal = document.styles["Normal"]
-        style_normal.font.name = "Times New Roman"
-        style_normal.font.size = Pt(12)
-        style_normal.paragraph_format.line_spacing = 1.5
-        style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        prototype = self._prototypes[type(self)] = DocxPrototype(document, self.set_style(document))
 
-        for row in self.rows:
-            # добавление источника
-            document.add_paragraph(row, style="List Number")
+        return prototype
 
-        # сохранение файла Word
-        document.save(path)
-
-
-class GOSTRenderer(Renderer):
-    def set_style(self, document: Any) -> str | None:
+    def render(self, path: Path | str) -> None:
         """
-        Метод задания стиля для оформления текста.
+        Метод генерации Word-файла со списком использованных источников.
+
+        :param Path | str path: Путь для сохранения выходного файла.
         """
-        style_normal = document.styles["Normal"]
 
-        style_normal.font.name = "Times New Roman"
-        style_normal.font.size = Pt(12)
-        style_normal.paragraph_format.line_spacing = 1.5
-        style_normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        self.prototype().write(path, self.rows)
 
-        return "List Number"
+
+class GOSTRenderer(Renderer):
+    """
+    Создание выходного файла Word по ГОСТ Р 7.0.5-2008 (стили по умолчанию, нумерованный список).
+    """
 
 
 class APARenderer(Renderer):
@@ -84,3 +211,242 @@ class APARenderer(Renderer):
 
         style_normal.paragraph_format.first_line_indent = Cm(-1.5)
         return None
+
+
+class TextRenderer(Renderer):
+    """
+    Создание выходного файла – текст (нумерованный список строк).
+
+    Строки записываются в файл по мере поступления через буферизованную запись,
+    поэтому потребление памяти не зависит от количества строк.
+    Наследники задают начало и окончание файла и разметку строки (`row()`).
+    """
+
+    # начало и окончание файла
+    head: ClassVar[str] = ""
+    tail: ClassVar[str] = ""
+
+    @staticmethod
+    def row(number: int, row: str) -> str:
+        """
+        Получение разметки строки источника.
+
+        :param number: Номер источника в списке.
+        :param row: Строка источника.
+        :return: Разметка строки.
+        """
+
+        return f"{number}. {row}\n"
+
+    def render(self, path: Path | str) -> None:
+        """
+        Метод генерации файла со списком использованных источников.
+
+        :param Path | str path: Путь для сохранения выходного файла.
+        """
+
+        with open(path, "w", encoding="utf-8", newline="\n", buffering=BUFFER_SIZE) as file:
+            file.write(self.head)
+            file.writelines(map(self.row, count(1), self.rows))
+            file.write(self.tail)
+
+
+# символы разметки Markdown, экранируемые обратной косой чертой
+MARKDOWN_SPECIAL = re.compile(r"([\\`*_\[\]<>#|])")
+
+
+class MarkdownRenderer(TextRenderer):
+    """
+    Создание выходного файла – нумерованный список Markdown.
+    """
+
+    @staticmethod
+    def row(number: int, row: str) -> str:
+        text = MARKDOWN_SPECIAL.sub(r"\\\1", row) if MARKDOWN_SPECIAL.search(row) else row
+        if "\n" in text or "\r" in text:
+            # продолжение пункта списка на следующей строке с отступом
+            text = "\n   ".join(text.splitlines())
+
+        return f"{number}. {text}\n"
+
+
+class HTMLRenderer(TextRenderer):
+    """
+    Создание выходного файла – нумерованный список HTML (`<ol>`) для встраивания в страницу.
+    """
+
+    head = "<ol>\n"
+    tail = "</ol>\n"
+
+    @staticmethod
+    def row(number: int, row: str) -> str:  # pylint: disable=unused-argument
+        text = html.escape(INVALID_XML_CHARS.sub("", row), quote=False)
+        if "\n" in text or "\r" in text:
+            text = "<br>".join(text.splitlines())
+
+        return f"<li>{text}</li>\n"
+
+
+# специальные символы TeX и их замены
+BIBTEX_SPECIAL = re.compile(r"[\\{}%&$#_^~]")
+BIBTEX_ESCAPE = {
+    "\\": r"\textbackslash{}",
+    "^": r"\textasciicircum{}",
+    "~": r"\textasciitilde{}",
+}
+
+
+class BibTeXRenderer(TextRenderer):
+    """
+    Создание выходного файла – BibTeX.
+
+    Отформатированная строка источника записывается в поле `note` записи `@misc`
+    с ключом по номеру источника, поэтому порядок и оформление списка сохраняются.
+    """
+
+    @staticmethod
+    def row(number: int, row: str) -> str:
+        text = " ".join(row.split())
+        if BIBTEX_SPECIAL.search(text):
+            text = BIBTEX_SPECIAL.sub(lambda match: BIBTEX_ESCAPE.get(match[0], f"\\{match[0]}"), text)
+
+        return f"@misc{{ref{number},\n  note = {{{text}}}\n}}\n\n"
+
+
+@unique
+class FormatEnum(str, Enum):
+    """
+    Поддерживаемые форматы выходного файла.
+    """
+
+    DOCX = "docx"  # Word
+    TXT = "txt"  # текст
+    MD = "md"  # Markdown
+    HTML = "html"  # HTML
+    BIB = "bib"  # BibTeX
+
+    @classmethod
+    def from_path(cls, path: Path | str) -> "FormatEnum":
+        """
+        Определение формата выходного файла по расширению (по умолчанию – Word).
+
+        :param path: Путь к выходному файлу.
+        :return: Формат выходного файла.
+        """
+
+        suffix = Path(path).suffix.lower().lstrip(".")
+        return FORMAT_SUFFIXES.get(suffix, cls.DOCX)
+
+
+# форматы выходного файла по расширениям
+FORMAT_SUFFIXES = {
+    "txt": FormatEnum.TXT,
+    "md": FormatEnum.MD,
+    "markdown": FormatEnum.MD,
+    "html": FormatEnum.HTML,
+    "htm": FormatEnum.HTML,
+    "bib": FormatEnum.BIB,
+}
+
+# классы рендеринга по форматам (для Word класс определяется стилем цитирования)
+FORMAT_RENDERERS: dict[FormatEnum, type[Renderer]] = {
+    FormatEnum.TXT: TextRenderer,
+    FormatEnum.MD: MarkdownRenderer,
+    FormatEnum.HTML: HTMLRenderer,
+    FormatEnum.BIB: BibTeXRenderer,
+}
+
+
+def get_renderer(renderer: type[Renderer], path: Path | str, output_format: Optional[str] = None) -> type[Renderer]:
+    """
+    Получение класса рендеринга для формата выходного файла.
+
+    :param renderer: Класс рендеринга Word для стиля цитирования.
+    :param path: Путь к выходному файлу.
+    :param output_format: Формат выходного файла (по умолчанию определяется по расширению).
+    :return: Класс рендеринга.
+    """
+
+    output_format = FormatEnum(output_format) if output_format else FormatEnum.from_path(path)
+    return FORMAT_RENDERERS.get(output_format, renderer)
+
+
+def consume(chunks: queue.Queue) -> Iterator[str]:
+    """
+    Получение строк из очереди частей до признака окончания (`None`).
+
+    :param chunks: Очередь частей строк.
+    :return: Генератор строк.
+    """
+
+    while (chunk := chunks.get()) is not None:
+        yield from chunk
+
+
+def render_worker(renderer: type[Renderer], path: Path | str, chunks: queue.Queue, errors: list[BaseException]) -> None:
+    """
+    Генерация файла в отдельном потоке из строк очереди.
+
+    :param renderer: Класс рендеринга.
+    :param path: Путь для сохранения выходного файла.
+    :param chunks: Очередь частей строк.
+    :param errors: Список ошибок генераторов.
+    """
+
+    rows = consume(chunks)
+    try:
+        renderer(rows).render(path)
+    except BaseException as error:  # pylint: disable=broad-exception-caught
+        errors.append(error)
+        # оставшиеся части извлекаются, чтобы передача строк другим генераторам не блокировалась
+        for _ in rows:
+            pass
+
+
+def render_outputs(
+    rows: Iterable[str],
+    outputs: Sequence[tuple[type[Renderer], Path | str]],
+    chunk_size: int = CHUNK_SIZE,
+    queue_size: int = QUEUE_SIZE,
+) -> None:
+    """
+    Генерация нескольких выходных файлов за один проход по строкам.
+
+    Каждый файл генерируется в отдельном потоке, строки передаются потокам частями через ограниченные очереди.
+    Строки читаются один раз, время генерации определяется самым медленным генератором.
+    Если при генерации какого-либо файла возникла ошибка, передача строк прекращается и ошибка передается вызывающему коду.
+
+    :param rows: Строки источников.
+    :param outputs: Пары из класса рендеринга и пути к выходному файлу.
+    :param chunk_size: Количество строк в части.
+    :param queue_size: Количество частей в очереди каждого генератора.
+    """
+
+    if len(outputs) == 1:
+        renderer, path = outputs[0]
+        renderer(rows).render(path)
+        return
+
+    errors: list[BaseException] = []
+    queues: list[queue.Queue] = [queue.Queue(maxsize=queue_size) for _ in outputs]
+    threads = [
+        threading.Thread(target=render_worker, args=(renderer, path, chunks, errors), name=f"render-{path}")
+        for (renderer, path), chunks in zip(outputs, queues)
+    ]
+    for thread in threads:
+        thread.start()
+
+    rows = iter(rows)
+    try:
+        while not errors and (chunk := list(islice(rows, chunk_size))):
+            # части только читаются генераторами, поэтому одна часть передается всем очередям
+            for chunks in queues:
+                chunks.put(chunk)
+    finally:
+        for chunks in queues:
+            chunks.put(None)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
@@ -14,9 +14,16 @@ OUTPUT_FILE_PATH: str = os.getenv("OUTPUT_FILE_PATH", "../media/output.docx")
 
 # путь к директории для логирования
 LOGGING_PATH: str = os.getenv("LOGGING_PATH", "../logs")
+# имя общего файла логов в директории для логирования
+LOGGING_FILE: str = os.getenv("LOGGING_FILE", "app.log")
 # формат для записей логов
-LOGGING_FORMAT: str = os.getenv(
-    "LOGGING_FORMAT", "%(name)s %(asctime)s %(levelname)s %(message)s"
-)
+LOGGING_FORMAT: str = os.getenv("LOGGING_FORMAT", "%(name)s %(asctime)s %(levelname)s %(message)s")
 # уровень логирования
 LOGGING_LEVEL: str = os.getenv("LOGGING_LEVEL", "INFO")
+
+# путь к директории постоянного кэша
+CACHE_PATH: str = os.getenv("CACHE_PATH", "../cache")
+# максимальный размер кэша прочитанных листов в байтах
+CACHE_MAX_SIZE: int = int(os.getenv("CACHE_MAX_SIZE", str(512 * 1024 * 1024)))
+# максимальный размер кэша отформатированных строк в байтах
+FORMATTED_CACHE_MAX_SIZE: int = int(os.getenv("FORMATTED_CACHE_MAX_SIZE", str(256 * 1024 * 1024)))
@@ -0,0 +1,103 @@
+"""
+Тестирование кэша отформатированных строк.
+"""
+from pathlib import Path
+from string import Template
+
+from formatters.cache import FormattedCache, style_version
+from formatters.models import BookModel, InternetResourceModel, ThesisModel
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+
+
+class TestFormattedCache:
+    """
+    Тестирование кэша отформатированных строк.
+    """
+
+    def test_hits(
+        self,
+        tmp_path: Path,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        thesis_fixture: ThesisModel,
+    ) -> None:
+        """
+        Тестирование получения строк неизмененных источников из кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ThesisModel thesis_fixture: Фикстура модели диссертации
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, thesis_fixture]
+        expected = GOSTCitationFormatter(models).format_text()
+
+        with FormattedCache(str(tmp_path)) as cache:
+            assert GOSTCitationFormatter(models, cache=cache).format_text() == expected
+            assert (cache.hits, cache.misses) == (0, 3)
+
+        changed = book_model_fixture.copy(update={"title": "Измененная книга"})
+        with FormattedCache(str(tmp_path)) as cache:
+            texts = GOSTCitationFormatter([changed, *models[1:]], cache=cache).format_text()
+            assert (cache.hits, cache.misses) == (2, 1)
+            assert cache.ratio == 2 / 3
+        assert texts == GOSTCitationFormatter([changed, *models[1:]]).format_text()
+
+        # в дочерних процессах используется тот же кэш
+        with FormattedCache(str(tmp_path)) as cache:
+            texts = GOSTCitationFormatter(models * 4, workers=2, chunk_size=4, cache=cache).format_text()
+            assert texts == GOSTCitationFormatter(models * 4).format_text()
+            assert (cache.hits, cache.misses) == (12, 0)
+
+    def test_style_version(self) -> None:
+        """
+        Тестирование изменения версии стиля при изменении шаблона.
+        """
+
+        def make_style(template: str) -> type[BaseCitationStyle]:
+            return type(
+                "Style", (BaseCitationStyle,), {"template": Template(template), "get_edition": GOSTBook.get_edition}
+            )
+
+        style = make_style("$title. – $edition$city, $year.")
+        assert style_version(style) == style_version(make_style("$title. – $edition$city, $year."))
+        assert style_version(style) != style_version(make_style("$title. – $edition$city: $year."))
+
+    def test_evict(self, tmp_path: Path, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование вытеснения записей при превышении размера кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        with FormattedCache(str(tmp_path), max_size=0) as cache:
+            GOSTCitationFormatter([book_model_fixture], cache=cache).format_text()
+        with FormattedCache(str(tmp_path)) as cache:
+            GOSTCitationFormatter([book_model_fixture], cache=cache).format_text()
+            assert (cache.hits, cache.misses) == (0, 1)
+
+        with FormattedCache(str(tmp_path)) as cache:
+            cache.clear()
+            GOSTCitationFormatter([book_model_fixture], cache=cache).format_text()
+            assert (cache.hits, cache.misses) == (0, 1)
+
+        # вытесняется только необходимое количество записей одной пачки
+        models = [book_model_fixture.copy(update={"title": f"Том {index}"}) for index in range(10)]
+        with FormattedCache(str(tmp_path)) as cache:
+            cache.clear()
+            GOSTCitationFormatter(models, cache=cache).format_text()
+            sizes = [size for (size,) in cache.connection.execute("SELECT size FROM entries")]
+            cache.max_size = sum(sizes) - 1
+        with FormattedCache(str(tmp_path)) as cache:
+            assert cache.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 9
+
+        # записи вытесняются и при форматировании только в дочерних процессах
+        models = [book_model_fixture.copy(update={"title": f"Книга {index}"}) for index in range(40)]
+        with FormattedCache(str(tmp_path), max_size=0) as cache:
+            GOSTCitationFormatter(models, workers=2, chunk_size=10, cache=cache).format_text()
+            assert (cache.hits, cache.misses) == (0, 40)
+        with FormattedCache(str(tmp_path)) as cache:
+            assert cache.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0] == 0
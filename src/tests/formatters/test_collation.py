@@ -0,0 +1,52 @@
+"""
+Тестирование ключей сортировки библиографического списка.
+"""
+import pytest
+
+from formatters.collation import ENCODING, ERRORS, collation_key
+from formatters.models import BookModel
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestCollation:
+    """
+    Тестирование ключей сортировки библиографического списка.
+    """
+
+    def test_collation_key(self) -> None:
+        """
+        Тестирование порядка: цифры, кириллица, латиница, без учета регистра и знаков препинания.
+        """
+
+        entries = ["Zeta A.", "apple", "Élan", "ёлка", "«Алфавит»", "Ежов", "Иванова А.", "Иванов И.М.", "10 лет"]
+
+        assert sorted(entries, key=collation_key) == [
+            "10 лет",
+            "«Алфавит»",
+            "Ежов",
+            "ёлка",
+            "Иванов И.М.",
+            "Иванова А.",
+            "apple",
+            "Élan",
+            "Zeta A.",
+        ]
+        assert collation_key("Иванов,  И.М.") == collation_key("иванов им")
+        assert isinstance(collation_key("Иванов"), bytes)
+        # обработчик ошибок кодирования не обрабатывает ошибки декодирования
+        with pytest.raises(UnicodeDecodeError):
+            b"\x98".decode(ENCODING, ERRORS)
+
+    def test_gost_order(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование сортировки записей на кириллице перед записями на латинице.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        latin = book_model_fixture.copy(update={"authors": "Adams J."})
+        lower = book_model_fixture.copy(update={"authors": "бобров Б.Б."})
+
+        texts = GOSTCitationFormatter([latin, lower, book_model_fixture]).format_text()
+
+        assert [text.split()[0] for text in texts] == ["бобров", "Иванов", "Adams"]
@@ -0,0 +1,69 @@
+"""
+Тестирование внешней сортировки отформатированных строк.
+"""
+import random
+from pathlib import Path
+
+import pytest
+
+from formatters import external
+from formatters.external import ExternalSorter
+from formatters.models import BookModel, InternetResourceModel, ThesisModel
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestExternalSorter:
+    """
+    Тестирование внешней сортировки отформатированных строк.
+    """
+
+    @pytest.mark.parametrize("fan_in", [external.MAX_FAN_IN, 2])
+    def test_sort(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, fan_in: int) -> None:
+        """
+        Тестирование совпадения внешней сортировки с сортировкой в памяти и удаления временных файлов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :param MonkeyPatch monkeypatch: Фикстура подмены атрибутов
+        :param int fan_in: Максимальное количество частей в одном проходе слияния
+        """
+
+        monkeypatch.setattr(external, "MAX_FAN_IN", fan_in)
+        generator = random.Random(0)
+        # одинаковые ключи сохраняют порядок исходных пар, как при сортировке в памяти
+        pairs = [(generator.randrange(20), f"строка {index}") for index in range(101)]
+
+        with ExternalSorter(10, str(tmp_path)) as sorter:
+            assert list(sorter.sort(pairs)) == [text for _, text in sorted(pairs, key=lambda pair: pair[0])]
+            assert sorter.runs >= 11
+        assert not list(tmp_path.iterdir())
+
+    def test_single_run(self, tmp_path: Path) -> None:
+        """
+        Тестирование сортировки без временных файлов, если все строки помещаются в одну часть.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        with ExternalSorter(10, str(tmp_path)) as sorter:
+            assert list(sorter.sort([(2, "б"), (1, "а")])) == ["а", "б"]
+            assert sorter.runs == 0
+
+    def test_iter_text(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        thesis_fixture: ThesisModel,
+    ) -> None:
+        """
+        Тестирование форматирования списка источников с внешней сортировкой.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ThesisModel thesis_fixture: Фикстура модели диссертации
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, thesis_fixture] * 3
+        expected = GOSTCitationFormatter(models).format_text()
+
+        assert list(GOSTCitationFormatter(iter(models)).iter_text(run_size=2)) == expected
+        assert list(GOSTCitationFormatter(models).iter_text()) == expected
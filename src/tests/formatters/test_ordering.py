@@ -0,0 +1,79 @@
+"""
+Тестирование порядка источников в библиографическом списке.
+"""
+from formatters.models import BookModel, InternetResourceModel, RegulationActModel, ThesisModel
+from formatters.ordering import APAOrdering
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTCitationFormatter
+
+
+class TestOrdering:
+    """
+    Тестирование порядка источников в библиографическом списке.
+    """
+
+    def test_gost_regulation_acts_first(
+        self,
+        book_model_fixture: BookModel,
+        regulation_act_fixture: RegulationActModel,
+        thesis_fixture: ThesisModel,
+    ) -> None:
+        """
+        Тестирование расположения нормативных актов перед остальными источниками по ГОСТ.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param RegulationActModel regulation_act_fixture: Фикстура модели нормативного акта
+        :param ThesisModel thesis_fixture: Фикстура модели диссертации
+        """
+
+        book = book_model_fixture.copy(update={"authors": "Абрамов А.А."})
+        act = regulation_act_fixture.copy(update={"title": "Об образовании"})
+        models = [book, thesis_fixture, act, regulation_act_fixture]
+
+        texts = GOSTCitationFormatter(models).format_text()
+
+        assert [text.split()[0] for text in texts] == ["Наука", "Об", "Абрамов", "Иванов"]
+        assert texts == [str(item) for item in GOSTCitationFormatter(models).format()]
+
+    def test_apa(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        thesis_fixture: ThesisModel,
+    ) -> None:
+        """
+        Тестирование порядка APA: фамилия первого автора, год, название.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ThesisModel thesis_fixture: Фикстура модели диссертации
+        """
+
+        earlier = book_model_fixture.copy(update={"authors": "Иванов А.А., Яковлев Я.Я.", "year": 2019})
+        title = book_model_fixture.copy(update={"title": "Алгебра"})
+        # источник без автора располагается по названию
+        resource = internet_resource_model_fixture.copy(update={"article": "Ивановские чтения"})
+        models = [book_model_fixture, thesis_fixture, resource, title, earlier]
+
+        texts = APACitationFormatter(models).format_text()
+        ordering = APACitationFormatter.ordering
+
+        assert texts == [
+            APACitationFormatter.formatters_map[type(model).__name__](model).formatted
+            for model in (earlier, title, book_model_fixture, thesis_fixture, resource)
+        ]
+        assert isinstance(ordering, APAOrdering)
+        assert ordering.surname("Иванов И.М., Петров С.Н.") == "Иванов"
+
+    def test_apa_unvalidated_year(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование ключа APA для модели, созданной без проверки, с годом в виде строки.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        ordering = APAOrdering()
+        unvalidated = BookModel.construct(**{**book_model_fixture.dict(), "year": "2020"})
+
+        assert ordering.key(unvalidated, "") == ordering.key(book_model_fixture, "")
+        assert ordering.year(987) == b"0987"
@@ -0,0 +1,53 @@
+"""
+Тестирование компактных записей источников.
+"""
+import pickle
+
+import pytest
+
+from formatters.models import BookModel, RegulationActModel
+from formatters.records import BookRecord, RegulationActRecord, model_name, to_record
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter, GOSTRegulationAct
+
+
+class TestRecords:
+    """
+    Тестирование компактных записей источников.
+    """
+
+    def test_to_record(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование преобразования модели в запись.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        record = to_record(book_model_fixture)
+
+        assert isinstance(record, BookRecord)
+        assert record.dict() == book_model_fixture.dict()
+        assert model_name(record) == model_name(book_model_fixture) == BookModel.__name__
+        assert to_record(record) is record
+        assert pickle.loads(pickle.dumps(record)) == record
+
+        # у записи нет словаря атрибутов экземпляра
+        with pytest.raises(AttributeError):
+            record.__dict__  # pylint: disable=pointless-statement
+
+    def test_formatting(self, book_model_fixture: BookModel, regulation_act_fixture: RegulationActModel) -> None:
+        """
+        Тестирование совпадения форматирования записей и моделей.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param RegulationActModel regulation_act_fixture: Фикстура модели нормативного акта
+        """
+
+        record = to_record(regulation_act_fixture)
+        assert isinstance(record, RegulationActRecord)
+        assert GOSTRegulationAct(record).formatted == GOSTRegulationAct(regulation_act_fixture).formatted
+        assert GOSTBook(to_record(book_model_fixture)).formatted == GOSTBook(book_model_fixture).formatted
+
+        for formatter in (GOSTCitationFormatter, APACitationFormatter):
+            items = formatter([book_model_fixture, regulation_act_fixture]).format()
+            assert all(not isinstance(item.data, (BookModel, RegulationActModel)) for item in items)
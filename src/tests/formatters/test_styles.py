@@ -0,0 +1,125 @@
+"""
+Тестирование компиляции шаблонов стилей цитирования.
+"""
+from string import Template
+
+import pytest
+
+from formatters.models import BookModel, InternetResourceModel, ThesisModel
+from formatters.styles.apa import APACitationFormatter
+from formatters.styles.base import BaseCitationStyle
+from formatters.styles.gost import GOSTBook, GOSTCitationFormatter
+
+
+class TestStyles:
+    """
+    Тестирование компиляции шаблонов стилей цитирования.
+    """
+
+    def test_compile_template(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование совпадения скомпилированного шаблона с `Template.substitute()`.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        class Style(BaseCitationStyle):
+            """
+            Стиль с вычисляемой переменной, фигурными скобками и знаком доллара в шаблоне.
+            """
+
+            template = Template("{$authors} ${title}: $$$year, '$edition' \\ \"$pages\"")
+
+            @staticmethod
+            def get_edition(edition: str) -> str:
+                return f"{edition} изд."
+
+        values = {**book_model_fixture.dict(), "edition": "3-е изд."}
+
+        assert Style(book_model_fixture).formatted == Style.template.substitute(values)
+
+    def test_lazy_style(self, book_model_fixture: BookModel) -> None:
+        """
+        Тестирование отложенного форматирования и отсутствия словаря атрибутов у объектов стилей.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        """
+
+        item = GOSTBook(book_model_fixture)
+        # строка форматируется только при первом обращении
+        assert item._formatted is None  # pylint: disable=protected-access
+        assert item.formatted is item.formatted
+
+        with pytest.raises(AttributeError):
+            item.__dict__  # pylint: disable=pointless-statement
+
+    def test_format_text(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        thesis_fixture: ThesisModel,
+    ) -> None:
+        """
+        Тестирование совпадения отформатированных строк с объектами стилей.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ThesisModel thesis_fixture: Фикстура модели диссертации
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, thesis_fixture]
+        for formatter in (GOSTCitationFormatter, APACitationFormatter):
+            expected = [str(item) for item in formatter(models).format()]
+
+            # генератор моделей читается один раз
+            assert formatter(iter(models)).format_text() == expected
+            assert [text for _, text in formatter(models).pairs()] == [
+                formatter.formatters_map[type(model).__name__](model).formatted for model in models
+            ]
+
+    def test_format_parallel(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        thesis_fixture: ThesisModel,
+    ) -> None:
+        """
+        Тестирование форматирования частями в нескольких процессах.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ThesisModel thesis_fixture: Фикстура модели диссертации
+        """
+
+        models = [book_model_fixture, internet_resource_model_fixture, thesis_fixture] * 5
+        expected = GOSTCitationFormatter(models).format_text()
+
+        assert GOSTCitationFormatter(iter(models), workers=2, chunk_size=4).format_text() == expected
+        # небольшой список форматируется последовательно
+        assert GOSTCitationFormatter(models, workers=2, chunk_size=100).format_text() == expected
+
+    def test_format_batch(
+        self,
+        book_model_fixture: BookModel,
+        internet_resource_model_fixture: InternetResourceModel,
+        thesis_fixture: ThesisModel,
+    ) -> None:
+        """
+        Тестирование совпадения пакетного форматирования по столбцам с объектами стилей.
+
+        :param BookModel book_model_fixture: Фикстура модели книги
+        :param InternetResourceModel internet_resource_model_fixture: Фикстура модели интернет-ресурса
+        :param ThesisModel thesis_fixture: Фикстура модели диссертации
+        """
+
+        other_book = book_model_fixture.copy(update={"edition": None, "title": "Другая книга"})
+        models = [book_model_fixture, internet_resource_model_fixture, other_book, thesis_fixture]
+        for formatter in (GOSTCitationFormatter, APACitationFormatter):
+            style = formatter.formatters_map["BookModel"]
+            columns = {name: [getattr(book_model_fixture, name), getattr(other_book, name)] for name in style.variables}
+            assert style.format_batch(columns) == [style(book_model_fixture).formatted, style(other_book).formatted]
+
+            # порядок источников разных типов сохраняется
+            assert [text for *_, text in formatter(models).format_records(models)] == [
+                formatter.formatters_map[type(model).__name__](model).formatted for model in models
+            ]
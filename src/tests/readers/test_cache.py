@@ -0,0 +1,86 @@
+"""
+Тестирование кэша прочитанных моделей листов.
+"""
+from pathlib import Path
+
+import openpyxl
+
+from readers.cache import SheetCache
+from readers.reader import BookReader, InternetResourceReader, SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestSheetCache:
+    """
+    Тестирование кэша прочитанных моделей листов.
+    """
+
+    def test_hits(self, tmp_path: Path) -> None:
+        """
+        Тестирование загрузки моделей неизмененных листов из кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+
+        cache = SheetCache(str(tmp_path))
+        assert list(SourcesReader(TEMPLATE_FILE_PATH, cache=cache).read()) == expected
+        assert (cache.hits, cache.misses) == (0, len(SourcesReader.readers))
+
+        assert list(SourcesReader(TEMPLATE_FILE_PATH, cache=cache).read()) == expected
+        assert (cache.hits, cache.misses) == (len(SourcesReader.readers), len(SourcesReader.readers))
+
+        cache.clear()
+        assert not list(tmp_path.glob("*.pickle"))
+
+    def test_hits_parallel(self, tmp_path: Path) -> None:
+        """
+        Тестирование учета обращений к кэшу дочерних процессов при параллельном чтении листов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+        count = len(SourcesReader.readers)
+
+        cache = SheetCache(str(tmp_path))
+        assert list(SourcesReader(TEMPLATE_FILE_PATH, workers=2, cache=cache).read()) == expected
+        assert list(SourcesReader(TEMPLATE_FILE_PATH, workers=2, cache=cache).read()) == expected
+        assert (cache.hits, cache.misses) == (count, count)
+        assert cache.ratio == 0.5
+
+    def test_changed_sheet(self, tmp_path: Path) -> None:
+        """
+        Тестирование повторного чтения только измененного листа.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "input.xlsx"
+        workbook = openpyxl.load_workbook(TEMPLATE_FILE_PATH)
+        workbook.save(path)
+
+        cache = SheetCache(str(tmp_path / "cache"))
+        readers = [BookReader, InternetResourceReader]
+        list(SourcesReader(str(path), readers=readers, cache=cache).read())
+
+        workbook = openpyxl.load_workbook(path)
+        workbook[InternetResourceReader().sheet]["A2"] = "Измененная статья"
+        workbook.save(path)
+        models = list(SourcesReader(str(path), readers=readers, cache=cache).read())
+
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert "Измененная статья" in [getattr(model, "article", None) for model in models]
+
+    def test_evict(self, tmp_path: Path) -> None:
+        """
+        Тестирование вытеснения записей при превышении размера кэша.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        cache = SheetCache(str(tmp_path), max_size=0)
+        list(SourcesReader(TEMPLATE_FILE_PATH, cache=cache).read())
+
+        assert not list(tmp_path.glob("*.pickle"))
@@ -0,0 +1,126 @@
+"""
+Тестирование чтения файлов с разделителями (CSV/TSV).
+"""
+import csv
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from formatters.models import BookModel, InternetResourceModel
+from readers.delimited import DelimitedReader
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+def to_text(value: Any) -> str:
+    """
+    Преобразование значения ячейки в значение файла с разделителями.
+    """
+
+    if value is None:
+        return ""
+    if isinstance(value, date):
+        return value.strftime("%d.%m.%Y")
+
+    return str(value)
+
+
+class TestDelimitedReader:
+    """
+    Тестирование чтения файлов с разделителями (CSV/TSV).
+    """
+
+    @pytest.fixture
+    def directory(self, tmp_path: Path) -> Path:
+        """
+        Получение директории с файлами листов шаблона (по одному файлу на тип источника).
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :return:
+        """
+
+        workbook = SourcesReader(TEMPLATE_FILE_PATH).workbook
+        for index, reader in enumerate(SourcesReader.readers):
+            sheet = reader().sheet
+            # файлы TSV чередуются с файлами CSV
+            suffix, delimiter = (".csv", ",") if index % 2 else (".tsv", "\t")
+            with (tmp_path / f"{sheet.strip()}{suffix}").open("w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file, delimiter=delimiter)
+                for row in workbook[sheet].iter_rows(values_only=True):
+                    writer.writerow([to_text(value) for value in row])
+
+        return tmp_path
+
+    def test_directory(self, directory: Path) -> None:
+        """
+        Тестирование совпадения моделей, прочитанных из файлов листов и из рабочей книги.
+
+        :param Path directory: Директория с файлами листов шаблона
+        """
+
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+        with DelimitedReader(str(directory)) as reader:
+            models = list(reader.read())
+
+        assert sorted(models, key=repr) == sorted(expected, key=repr)
+        assert not reader.errors
+
+    def test_mixed(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения общего файла со столбцом типа источника.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "sources.csv"
+        path.write_text(
+            "model,1,2,3,4,5,6,7\n"
+            "Книга,Иванов И.М.,Наука как искусство,,СПб.,Просвещение,2020,999\n"
+            "internetresource,Наука как искусство,Ведомости,https://www.vedomosti.ru,01.01.2021\n"
+            "Книга,Иванов И.М.,Наука как искусство,,СПб.,Просвещение,год,999\n"
+            "Неизвестный тип,значение\n",
+            encoding="utf-8",
+        )
+
+        with DelimitedReader(str(path)) as reader:
+            models = list(reader.read())
+
+        assert [model.__class__ for model in models] == [BookModel, InternetResourceModel]
+        assert models[0].edition is None
+        assert [error.row for error in reader.errors] == [4, 5]
+        assert str(reader.errors[1]) == 'Лист "sources.csv", строка 5: Неизвестный тип: Неизвестный тип'
+
+    def test_regulation_act_attribute_header(self, tmp_path: Path) -> None:
+        """
+        Тестирование чтения файла нормативных актов с заголовками по наименованиям атрибутов
+        (атрибут `type` не считается столбцом типа источника).
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "RegulationActModel.csv"
+        path.write_text(
+            "type,title,active_date,number,source,publication_year,version,article_number,edition\n"
+            "Федеральный закон,Наука как искусство,01.01.2000,1234-56,Парламентская газета,2020,5,15,11.09.2002\n",
+            encoding="utf-8",
+        )
+
+        with DelimitedReader(str(path)) as reader:
+            models = list(reader.read())
+
+        assert [model.type for model in models] == ["Федеральный закон"]
+        assert not reader.errors
+
+    def test_supports(self, tmp_path: Path) -> None:
+        """
+        Тестирование выбора чтения по расширению файла.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        assert DelimitedReader.supports(str(tmp_path / "input.CSV"))
+        assert DelimitedReader.supports(str(tmp_path / "input.tsv"))
+        assert DelimitedReader.supports(str(tmp_path))
+        assert not DelimitedReader.supports(TEMPLATE_FILE_PATH)
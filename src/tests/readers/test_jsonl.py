@@ -0,0 +1,68 @@
+"""
+Тестирование чтения и записи моделей в формате JSON Lines.
+"""
+from pathlib import Path
+
+from formatters.models import BookModel
+from readers.jsonl import JsonLinesReader, JsonLinesWriter
+from readers.reader import SourcesReader
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestJsonLines:
+    """
+    Тестирование чтения и записи моделей в формате JSON Lines.
+    """
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """
+        Тестирование совпадения записанных и прочитанных моделей.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "models.jsonl"
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+        with JsonLinesWriter(str(path)) as writer:
+            assert list(writer.passthrough(expected)) == expected
+
+        assert writer.count == len(expected)
+        assert len(path.read_text(encoding="utf-8").splitlines()) == len(expected)
+
+        for trusted in (False, True):
+            with JsonLinesReader(str(path), trusted=trusted) as reader:
+                assert list(reader.read()) == expected
+                assert not reader.errors
+
+        assert all(isinstance(model, BookModel) for model in JsonLinesReader(str(path), readers=[BookModel]).read())
+
+    def test_errors(self, tmp_path: Path) -> None:
+        """
+        Тестирование пропуска строк с ошибками.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "models.ndjson"
+        path.write_text(
+            "\n".join(
+                (
+                    '{"model": "BookModel", "authors": "Иванов И.М.", "title": "Наука как искусство", '
+                    '"city": "СПб.", "publishing_house": "Просвещение", "year": 2020, "pages": 999}',
+                    "",
+                    '{"model": "BookModel", "title": "Без авторов"}',
+                    "{не JSON",
+                    '{"model": "UnknownModel"}',
+                    '["model"]',
+                )
+            ),
+            encoding="utf-8",
+        )
+
+        with JsonLinesReader(str(path)) as reader:
+            models = list(reader.read())
+
+        assert len(models) == 1
+        assert models[0].edition is None
+        assert [error.row for error in reader.errors] == [3, 4, 5, 6]
+        assert JsonLinesReader.supports(str(path))
@@ -47,7 +47,7 @@ class TestReaders:
         :param workbook: Объект тестовой рабочей книги.
         """
 
-        models = BookReader(workbook).read()
+        models = list(BookReader(workbook).read())
 
         assert len(models) == 4
         model = models[0]
@@ -73,7 +73,7 @@ class TestReaders:
         :param workbook: Объект тестовой рабочей книги.
         """
 
-        models = InternetResourceReader(workbook).read()
+        models = list(InternetResourceReader(workbook).read())
 
         assert len(models) == 3
         model = models[0]
@@ -96,7 +96,7 @@ class TestReaders:
         :param workbook: Объект тестовой рабочей книги.
         """
 
-        models = ArticlesCollectionReader(workbook).read()
+        models = list(ArticlesCollectionReader(workbook).read())
 
         assert len(models) == 1
         model = models[0]
@@ -122,7 +122,7 @@ class TestReaders:
         :param workbook: Объект тестовой рабочей книги.
         """
 
-        models = RegulationActReader(workbook).read()
+        models = list(RegulationActReader(workbook).read())
 
         assert len(models) == 1
         model = models[0]
@@ -150,7 +150,7 @@ class TestReaders:
         :param workbook: Объект тестовой рабочей книги.
         """
 
-        models = ThesisReader(workbook).read()
+        models = list(ThesisReader(workbook).read())
 
         assert len(models) == 1
         model = models[0]
@@ -175,7 +175,7 @@ class TestReaders:
         Тестирование функции чтения всех моделей из источника.
         """
 
-        models = SourcesReader(TEMPLATE_FILE_PATH).read()
+        models = list(SourcesReader(TEMPLATE_FILE_PATH).read())
         # проверка общего считанного количества моделей
         assert len(models) == 10
 
@@ -188,3 +188,136 @@ class TestReaders:
             RegulationActModel.__name__,
             ThesisModel.__name__,
         }
+
+    def test_sources_reader_read_only(self) -> None:
+        """
+        Тестирование потокового чтения (режим только для чтения) всех моделей из источника.
+        """
+
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+        with SourcesReader(TEMPLATE_FILE_PATH, read_only=True) as reader:
+            models = list(reader.read())
+
+        # потоковый режим должен возвращать те же модели, что и полная загрузка рабочей книги
+        assert models == expected
+
+    def test_sources_reader_parallel(self) -> None:
+        """
+        Тестирование параллельного чтения листов исходного файла.
+        """
+
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+        with SourcesReader(TEMPLATE_FILE_PATH, read_only=True, workers=2) as reader:
+            models = list(reader.read())
+
+        # порядок моделей совпадает с последовательным чтением
+        assert models == expected
+
+    def test_sources_reader_selected(self) -> None:
+        """
+        Тестирование ленивого открытия исходного файла и чтения только выбранных листов.
+        """
+
+        reader = SourcesReader(TEMPLATE_FILE_PATH, read_only=True, readers=[InternetResourceModel, BookReader])
+        # рабочая книга открывается только при чтении
+        assert reader._workbook is None  # pylint: disable=protected-access
+        assert reader.readers == [BookReader, InternetResourceReader]
+
+        with reader:
+            models = list(reader.read())
+
+        assert len(models) == 7
+        assert {model.__class__.__name__ for model in models} == {BookModel.__name__, InternetResourceModel.__name__}
+
+        with pytest.raises(ValueError):
+            SourcesReader(TEMPLATE_FILE_PATH, readers=[SourcesReader])  # type: ignore
+
+    def test_decoder_header_positions(self) -> None:
+        """
+        Тестирование определения индексов столбцов по строке заголовка.
+        """
+
+        reader = BookReader(Workbook())
+        header = (
+            "Название книги",
+            "Фамилии и инициалы авторов",
+            "Номер издания",
+            "Город издательства",
+            "Название издательства",
+            "Количество страниц",
+            "Год издания",
+        )
+        row = ("Наука как искусство", " Иванов И.М. ", None, "СПб.", "Просвещение", "999", 2020)
+
+        assert reader.compile_decoder(header)(row) == {
+            "authors": "Иванов И.М.",
+            "title": "Наука как искусство",
+            "edition": None,
+            "city": "СПб.",
+            "publishing_house": "Просвещение",
+            "year": 2020,
+            "pages": 999,
+        }
+
+        # без заголовка используются индексы из метода `attributes()`, короткая строка дополняется
+        assert reader.compile_decoder()(("Иванов И.М.", "Наука как искусство"))["city"] is None
+
+    def test_row_errors(self) -> None:
+        """
+        Тестирование пропуска строк с ошибками и сбора ошибок всех строк листа.
+        """
+
+        reader = BookReader()
+        header = ("Авторы", "Название", "Издание", "Город", "Издательство", "Год", "Страницы")
+        row = ("Иванов И.М.", "Наука как искусство", "3-е", "СПб.", "Просвещение", 2020, 999)
+        rows = [
+            header,
+            row,
+            (*row[:5], "две тысячи", 999),
+            row,
+            (*row[:5], 2020, -1),
+        ]
+
+        models = list(reader.read_rows(rows))
+
+        assert len(models) == 2
+        assert [(error.sheet, error.row) for error in reader.errors] == [("Книга", 3), ("Книга", 5)]
+        assert "pages" in reader.errors[1].error
+
+    def test_trusted(self) -> None:
+        """
+        Тестирование создания моделей без проверки для доверенных данных.
+        """
+
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+        with SourcesReader(TEMPLATE_FILE_PATH, trusted=True) as reader:
+            models = list(reader.read())
+
+        assert models == expected
+        assert not reader.errors
+
+    def test_interned(self) -> None:
+        """
+        Тестирование замены повторяющихся значений единственными объектами строк.
+        """
+
+        def copy(value: str) -> str:
+            # новый объект строки, как при чтении ячейки
+            return "".join(list(value))
+
+        reader = BookReader()
+        header = ("Авторы", "Название", "Издание", "Город", "Издательство", "Год", "Страницы")
+        rows = [
+            header,
+            ("Иванов И.М.", copy("Наука как искусство"), None, copy("СПб."), copy("Просвещение"), 2020, 999),
+            ("Петров С.Н.", "Введение в лингвистику", None, "М.", copy("Просвещение"), 2001, 360),
+            ("Сидоров А.А.", copy("Наука как искусство"), None, copy("СПб."), "АСТ", 2010, 100),
+        ]
+
+        models = list(reader.read_rows(rows))
+
+        assert models[0].city is models[2].city
+        assert models[0].publishing_house is models[1].publishing_house
+        # неповторяющиеся столбцы не заменяются
+        assert models[0].title == models[2].title
+        assert models[0].title is not models[2].title
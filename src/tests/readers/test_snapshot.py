@@ -0,0 +1,107 @@
+"""
+Тестирование двоичного снимка моделей.
+"""
+from pathlib import Path
+
+import pytest
+
+from formatters.models import InternetResourceModel, ThesisModel
+from readers.reader import SourcesReader
+from readers.snapshot import SnapshotReader, SnapshotWriter
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestSnapshot:
+    """
+    Тестирование двоичного снимка моделей.
+    """
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> Path:
+        """
+        Получение пути к снимку моделей тестовой рабочей книги.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        :return:
+        """
+
+        path = tmp_path / "models.snapshot"
+        with SnapshotWriter(str(path)) as writer:
+            for model in SourcesReader(TEMPLATE_FILE_PATH).read():
+                writer.write(model)
+
+        return path
+
+    def test_read(self, path: Path) -> None:
+        """
+        Тестирование совпадения записанных и прочитанных моделей.
+
+        :param Path path: Путь к снимку
+        """
+
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+        with SnapshotReader(str(path)) as reader:
+            assert list(reader.read()) == expected
+            # произвольный доступ к записям
+            assert len(reader) == len(expected)
+            assert reader[len(expected) - 1] == expected[-1]
+            assert reader[3] == expected[3]
+
+    def test_selected(self, path: Path) -> None:
+        """
+        Тестирование чтения только выбранных типов моделей.
+
+        :param Path path: Путь к снимку
+        """
+
+        expected = [
+            model
+            for model in SourcesReader(TEMPLATE_FILE_PATH).read()
+            if isinstance(model, (InternetResourceModel, ThesisModel))
+        ]
+        with SnapshotReader(str(path), readers=[ThesisModel, InternetResourceModel]) as reader:
+            assert list(reader.read()) == expected
+
+    def test_invalid(self, tmp_path: Path) -> None:
+        """
+        Тестирование открытия файла, не являющегося снимком.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        path = tmp_path / "invalid.snapshot"
+        path.write_bytes(b"{}" * 32)
+
+        with pytest.raises(ValueError):
+            with SnapshotReader(str(path)):
+                pass
+
+        assert SnapshotReader.supports(str(path))
+        assert not SnapshotReader.supports(TEMPLATE_FILE_PATH)
+
+    def test_interrupted(self, path: Path) -> None:
+        """
+        Тестирование прерванной записи: ранее созданный снимок не изменяется,
+        файл без окончания не открывается как снимок.
+
+        :param Path path: Фикстура пути к снимку моделей тестовой рабочей книги
+        """
+
+        content = path.read_bytes()
+        models = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+
+        with pytest.raises(KeyboardInterrupt):
+            with SnapshotWriter(str(path)) as writer:
+                for model in models[:7]:
+                    writer.write(model)
+                raise KeyboardInterrupt
+
+        assert path.read_bytes() == content
+        assert list(path.parent.iterdir()) == [path]
+
+        # файл без окончания (запись прервана без удаления файла)
+        truncated = path.with_name("truncated.snapshot")
+        truncated.write_bytes(content[: len(content) // 2])
+        with pytest.raises(ValueError, match="не является снимком моделей"):
+            with SnapshotReader(str(truncated)):
+                pass
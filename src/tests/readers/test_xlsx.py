@@ -0,0 +1,76 @@
+"""
+Тестирование потокового чтения листов xlsx без openpyxl.
+"""
+from datetime import datetime
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from readers.reader import EngineEnum, SourcesReader
+from readers.xlsx import XlsxWorkbook
+from settings import TEMPLATE_FILE_PATH
+
+
+class TestXlsxWorkbook:
+    """
+    Тестирование потокового чтения листов xlsx без openpyxl.
+    """
+
+    @pytest.fixture
+    def path(self, tmp_path: Path) -> Path:
+        """
+        Получение пути к рабочей книге с ячейками разных типов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :return:
+        """
+
+        workbook = openpyxl.Workbook()
+        worksheet = workbook.active
+        worksheet.title = "Лист"
+        worksheet.append(("Строка", "Число", "Дробь", "Дата", "Логическое", "Формула"))
+        worksheet.append(("  текст  ", 2020, 1.5, datetime(2021, 1, 10), True, "=B2+1"))
+        # пропущенная строка и пропущенные ячейки
+        worksheet["C5"] = "значение"
+        worksheet["A6"] = "последняя"
+        path = tmp_path / "input.xlsx"
+        workbook.save(path)
+
+        return path
+
+    def test_rows(self, path: Path) -> None:
+        """
+        Тестирование совпадения строк с режимом только для чтения openpyxl.
+
+        :param Path path: Путь к рабочей книге
+        """
+
+        expected = list(openpyxl.load_workbook(path, read_only=True)["Лист"].iter_rows(values_only=True))
+        with XlsxWorkbook(str(path)) as workbook:
+            rows = list(workbook["Лист"].iter_rows(values_only=True))
+
+        assert len(rows) == len(expected)
+        for row, expected_row in zip(rows, expected):
+            # openpyxl дополняет строки до ширины листа пустыми значениями
+            assert row + (None,) * (len(expected_row) - len(row)) == expected_row
+
+    def test_sheet_names(self) -> None:
+        """
+        Тестирование получения наименований листов.
+        """
+
+        with XlsxWorkbook(TEMPLATE_FILE_PATH) as workbook:
+            assert workbook.sheetnames == openpyxl.load_workbook(TEMPLATE_FILE_PATH, read_only=True).sheetnames
+
+            with pytest.raises(KeyError):
+                workbook["Несуществующий лист"]  # pylint: disable=pointless-statement
+
+    def test_sources_reader(self) -> None:
+        """
+        Тестирование совпадения моделей, прочитанных разными способами.
+        """
+
+        expected = list(SourcesReader(TEMPLATE_FILE_PATH).read())
+        with SourcesReader(TEMPLATE_FILE_PATH, engine=EngineEnum.XML) as reader:
+            assert list(reader.read()) == expected
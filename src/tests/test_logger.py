@@ -0,0 +1,77 @@
+"""
+Тестирование настройки логирования.
+"""
+import logging
+import queue
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler
+from multiprocessing import get_context
+
+import pytest
+
+import logger
+from logger import get_logger, init_worker, pool_options
+
+
+def worker_state() -> tuple[bool, list[type]]:
+    """
+    Получение состояния логирования в дочернем процессе.
+
+    :return: Признак запуска обработчика очереди и типы обработчиков корневого логгера.
+    """
+
+    get_logger("tests.spawn")
+    # pylint: disable-next=protected-access
+    return logger._listener is not None, [type(handler) for handler in logging.getLogger().handlers]
+
+
+class TestLogger:
+    """
+    Тестирование настройки логирования.
+    """
+
+    def test_idempotent(self) -> None:
+        """
+        Тестирование однократного добавления обработчика очереди.
+        """
+
+        get_logger("tests.first")
+        get_logger("tests.second")
+
+        handlers = [handler for handler in logging.getLogger().handlers if isinstance(handler, QueueHandler)]
+        assert len(handlers) == 1
+        assert not get_logger("tests.first").handlers
+        assert pool_options()["initargs"] == (handlers[0].queue,)
+
+    def test_init_worker(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Тестирование передачи записей дочернего процесса в очередь основного процесса.
+
+        :param MonkeyPatch monkeypatch: Фикстура подмены атрибутов
+        """
+
+        root = logging.getLogger()
+        monkeypatch.setattr(root, "handlers", list(root.handlers))
+        records: queue.Queue = queue.Queue()
+
+        init_worker(records)
+        # логирование выключено для автоматических тестов
+        logging.disable(logging.NOTSET)
+        try:
+            get_logger("tests.worker").warning("Сообщение %s", 1)
+        finally:
+            logging.disable()
+
+        assert [type(handler) for handler in root.handlers] == [QueueHandler]
+        assert records.get_nowait().getMessage() == "Сообщение 1"
+
+    def test_spawn_pool(self) -> None:
+        """
+        Тестирование пула процессов, запущенных через spawn: обработчик очереди и файл логов
+        не создаются в дочерних процессах, записи передаются в очередь основного процесса.
+        """
+
+        with ProcessPoolExecutor(max_workers=2, mp_context=get_context("spawn"), **pool_options()) as executor:
+            states = [executor.submit(worker_state).result() for _ in range(2)]
+
+        assert states == [(False, [QueueHandler])] * 2
@@ -2,10 +2,23 @@
 Тестирование функций генерации выходного файла.
 """
 from pathlib import Path
+from typing import Iterator
 
 import pytest
+from docx import Document
+from docx.shared import Pt
 
-from renderer import Renderer
+from renderer import (
+    APARenderer,
+    BibTeXRenderer,
+    GOSTRenderer,
+    HTMLRenderer,
+    MarkdownRenderer,
+    Renderer,
+    TextRenderer,
+    get_renderer,
+    render_outputs,
+)
 
 
 class TestRenderer:
@@ -39,5 +52,123 @@ class TestRenderer:
 
         # проверка наличия файла
         assert len(list(tmp_path.iterdir())) == 1
-        # проверка размера файла в байтах на диске
-        assert path.stat().st_size == 36773
+        # проверка текста и стилей абзацев
+        document = Document(str(path))
+        assert [paragraph.text for paragraph in document.paragraphs] == [
+            "Список использованной литературы",
+            *formatted_models,
+        ]
+        assert {paragraph.style.name for paragraph in document.paragraphs[1:]} == {"List Number"}
+        assert document.styles["Normal"].font.name == "Times New Roman"
+        assert document.styles["Normal"].font.size == Pt(12)
+
+    def test_render_iterator(self, tmp_path: Path) -> None:
+        """
+        Тестирование потоковой записи строк из генератора с экранированием разметки.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        """
+
+        rows = ['Строка <1> & "2"', " Пробелы ", "Табуляция\tи перенос\nстроки", "Символ\x0b"]
+        path = tmp_path / "output.docx"
+        Renderer(iter(rows)).render(path)
+
+        assert [paragraph.text for paragraph in Document(str(path)).paragraphs[1:]] == [*rows[:3], "Символ"]
+
+    def test_styles(self, tmp_path: Path, formatted_models: tuple[str, ...]) -> None:
+        """
+        Тестирование стилей рендеринга и однократного создания образца пакета для каждого стиля.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param tuple[str, ...] formatted_models: Список строк для сохранения в файле
+        """
+
+        assert GOSTRenderer(()).prototype() is GOSTRenderer(()).prototype()
+        assert APARenderer(()).prototype() is not GOSTRenderer(()).prototype()
+
+        path = tmp_path / "output.docx"
+        APARenderer(formatted_models).render(path)
+
+        document = Document(str(path))
+        assert [paragraph.text for paragraph in document.paragraphs[1:]] == list(formatted_models)
+        # список APA не нумеруется, абзацы оформляются выступом первой строки
+        assert {paragraph.style.name for paragraph in document.paragraphs[1:]} == {"Normal"}
+        assert round(document.styles["Normal"].paragraph_format.first_line_indent.cm, 2) == -1.5
+
+    @pytest.mark.parametrize(
+        "renderer, expected",
+        [
+            (TextRenderer, "1. a < b & c\n2. 50% {d}_e\n"),
+            (MarkdownRenderer, "1. a \\< b & c\n2. 50% {d}\\_e\n"),
+            (HTMLRenderer, "<ol>\n<li>a &lt; b &amp; c</li>\n<li>50% {d}_e</li>\n</ol>\n"),
+            (
+                BibTeXRenderer,
+                "@misc{ref1,\n  note = {a < b \\& c}\n}\n\n@misc{ref2,\n  note = {50\\% \\{d\\}\\_e}\n}\n\n",
+            ),
+        ],
+    )
+    def test_render_text(self, tmp_path: Path, renderer: type[Renderer], expected: str) -> None:
+        """
+        Тестирование потоковой генерации текстовых форматов с экранированием разметки.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файла во время тестирования
+        :param type[Renderer] renderer: Класс рендеринга
+        :param str expected: Ожидаемое содержимое файла
+        """
+
+        path = tmp_path / "output"
+        renderer(iter(["a < b & c", "50% {d}_e"])).render(path)
+
+        assert path.read_text(encoding="utf-8") == expected
+
+    def test_get_renderer(self) -> None:
+        """
+        Тестирование выбора класса рендеринга по формату и расширению выходного файла.
+        """
+
+        assert get_renderer(APARenderer, "output.docx") is APARenderer
+        assert get_renderer(GOSTRenderer, "output.HTML") is HTMLRenderer
+        assert get_renderer(GOSTRenderer, "output.bib") is BibTeXRenderer
+        assert get_renderer(GOSTRenderer, "output.md", "txt") is TextRenderer
+        assert get_renderer(GOSTRenderer, "output.txt", "docx") is GOSTRenderer
+
+    def test_render_outputs(self, tmp_path: Path) -> None:
+        """
+        Тестирование генерации нескольких файлов за один проход по строкам.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        rows = [f"Строка №{index}" for index in range(1, 101)]
+        consumed = []
+
+        def generate() -> Iterator[str]:
+            for row in rows:
+                consumed.append(row)
+                yield row
+
+        # малые части и очереди: генераторы получают строки по мере чтения
+        outputs = [(GOSTRenderer, tmp_path / "output.docx"), (TextRenderer, tmp_path / "output.txt")]
+        render_outputs(generate(), outputs, chunk_size=7, queue_size=1)
+
+        assert consumed == rows
+        assert [paragraph.text for paragraph in Document(str(tmp_path / "output.docx")).paragraphs[1:]] == rows
+        assert (tmp_path / "output.txt").read_text(encoding="utf-8") == "".join(
+            f"{number}. {row}\n" for number, row in enumerate(rows, 1)
+        )
+
+    def test_render_outputs_error(self, tmp_path: Path) -> None:
+        """
+        Тестирование передачи ошибки генерации одного из файлов.
+
+        :param Path tmp_path: Фикстура пути для временного хранения файлов во время тестирования
+        """
+
+        class FailingRenderer(TextRenderer):
+            @staticmethod
+            def row(number: int, row: str) -> str:
+                raise ValueError(row)
+
+        outputs = [(TextRenderer, tmp_path / "output.txt"), (FailingRenderer, tmp_path / "failed.txt")]
+        with pytest.raises(ValueError, match="Строка №0"):
+            render_outputs((f"Строка №{index}" for index in range(10_000)), outputs, chunk_size=1, queue_size=1)